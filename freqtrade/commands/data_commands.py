@@ -155,10 +155,7 @@ def start_list_data(args: dict[str, Any]) -> None:
                 table_kwargs={"min_width": 50},
             )
     else:
-        paircombs1 = [
-            (pair, timeframe, candle_type, *dhc.ohlcv_data_min_max(pair, timeframe, candle_type))
-            for pair, timeframe, candle_type in paircombs
-        ]
+        paircombs1 = dhc.ohlcv_data_min_max_all(paircombs)
         print_rich_table(
             [
                 (
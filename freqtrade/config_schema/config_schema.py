@@ -6,6 +6,8 @@ from freqtrade.constants import (
     AVAILABLE_PAIRLISTS,
     BACKTEST_BREAKDOWNS,
     BACKTEST_CACHE_AGE,
+    BACKTEST_ENGINE_DEFAULT,
+    BACKTEST_ENGINES,
     DRY_RUN_WALLET,
     EXPORT_OPTIONS,
     HYPEROPT_LOSS_BUILTIN,
@@ -108,6 +110,15 @@ CONF_SCHEMA = {
             "description": "Process only new candles.",
             "type": "boolean",
         },
+        "analysis_workers": {
+            "description": (
+                "Number of threads analyzing pairs in parallel during dry / live runs. "
+                "Requires a thread-safe strategy."
+            ),
+            "type": "integer",
+            "minimum": 1,
+            "default": 1,
+        },
         "minimal_roi": {
             "description": f"Minimum return on investment. {__IN_STRATEGY}",
             "type": "object",
@@ -236,6 +247,15 @@ CONF_SCHEMA = {
             "type": "string",
             "enum": BACKTEST_CACHE_AGE,
         },
+        "backtest_engine": {
+            "description": (
+                "Data representation used by the backtesting loop. "
+                "'columnar' keeps candles in NumPy arrays to reduce memory usage."
+            ),
+            "type": "string",
+            "enum": BACKTEST_ENGINES,
+            "default": BACKTEST_ENGINE_DEFAULT,
+        },
         # Hyperopt
         "hyperopt_path": {
             "description": "Specify additional lookup path for Hyperopt Loss functions.",
@@ -825,6 +845,12 @@ CONF_SCHEMA = {
             "enum": AVAILABLE_DATAHANDLERS,
             "default": "feather",
         },
+        "dataload_workers": {
+            "description": "Number of threads used to load OHLCV data of multiple pairs.",
+            "type": "integer",
+            "minimum": 1,
+            "default": 1,
+        },
         "position_adjustment_enable": {
             "description": f"Enable position adjustment. {__IN_STRATEGY}",
             "type": "boolean",
@@ -1175,6 +1201,15 @@ CONF_SCHEMA = {
                     "type": "boolean",
                     "default": False,
                 },
+                "backtest_training_workers": {
+                    "description": (
+                        "Number of backtesting windows trained in parallel (joblib based "
+                        "models without continual learning only)."
+                    ),
+                    "type": "integer",
+                    "minimum": 1,
+                    "default": 1,
+                },
                 "fit_live_predictions_candles": {
                     "description": (
                         "Number of historical candles to use for computing target (label) "
@@ -1182,6 +1217,15 @@ CONF_SCHEMA = {
                     ),
                     "type": "integer",
                 },
+                "historic_predictions_max_candles": {
+                    "description": (
+                        "Number of historic predictions kept per pair in dry/live runs. "
+                        "0 keeps all predictions."
+                    ),
+                    "type": "integer",
+                    "minimum": 0,
+                    "default": 0,
+                },
                 "data_kitchen_thread_count": {
                     "description": (
                         "Designate the number of threads you want to use for data processing "
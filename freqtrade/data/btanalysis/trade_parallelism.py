@@ -9,18 +9,12 @@ from freqtrade.constants import IntOrInf
 logger = logging.getLogger(__name__)
 
 
-def analyze_trade_parallelism(trades: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+def _expand_trade_parallelism(trades: pd.DataFrame, timeframe_freq: str) -> pd.DataFrame:
     """
-    Find overlapping trades by expanding each trade once per period it was open
-    and then counting overlaps.
-    :param trades: Trades Dataframe - can be loaded from backtest, or created
-        via trade_list_to_dataframe
-    :param timeframe: Timeframe used for backtest
-    :return: dataframe with open-counts per time-period in timeframe
+    Expand each trade once per period it was open and count the overlaps.
+    Only used for calendar based timeframes (weekly / monthly), where periods
+    don't have a fixed length.
     """
-    from freqtrade.exchange import timeframe_to_resample_freq
-
-    timeframe_freq = timeframe_to_resample_freq(timeframe)
     dates = [
         pd.Series(
             pd.date_range(
@@ -44,12 +38,64 @@ def analyze_trade_parallelism(trades: pd.DataFrame, timeframe: str) -> pd.DataFr
     return df_final
 
 
+def analyze_trade_parallelism(trades: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """
+    Find overlapping trades by counting trade opens (+1) and closes (-1) per period,
+    and accumulating these over all periods.
+    :param trades: Trades Dataframe - can be loaded from backtest, or created
+        via trade_list_to_dataframe
+    :param timeframe: Timeframe used for backtest
+    :return: dataframe with open-counts per time-period in timeframe
+    """
+    from freqtrade.exchange import timeframe_to_resample_freq
+
+    timeframe_freq = timeframe_to_resample_freq(timeframe)
+    if trades.empty:
+        raise ValueError("No trades to analyze.")
+    if not timeframe_freq.endswith("s"):
+        return _expand_trade_parallelism(trades, timeframe_freq)
+
+    period = pd.Timedelta(timeframe_freq).value
+    open_dates = pd.DatetimeIndex(pd.to_datetime(trades["open_date"], utc=True))
+    close_dates = pd.DatetimeIndex(pd.to_datetime(trades["close_date"], utc=True))
+    open_ns = open_dates.as_unit("ns").asi8
+    close_ns = close_dates.as_unit("ns").asi8
+    # Number of periods each trade was open - starting at the open date,
+    # excluding the close date (the date is the candle open date).
+    periods = np.maximum(-(-(close_ns - open_ns) // period), 0)
+    active = periods > 0
+    if not active.any():
+        return pd.DataFrame(
+            {"open_trades": np.array([], dtype=np.int64)},
+            index=pd.DatetimeIndex([], name="date", freq=timeframe_freq),
+        )
+    open_ns = open_ns[active]
+    periods = periods[active]
+
+    # Periods start at midnight of the first day (like resample's default origin).
+    origin = pd.Timestamp(open_ns.min()).floor("D").value
+    first = (open_ns - origin) // period
+    last = first + periods
+    size = int(last.max()) + 1
+    open_trades = np.cumsum(
+        np.bincount(first, minlength=size) - np.bincount(last, minlength=size)
+    )
+    start = int(first.min())
+    end = int(last.max()) - 1
+    index = pd.date_range(
+        pd.Timestamp(origin + start * period),
+        periods=end - start + 1,
+        freq=timeframe_freq,
+        name="date",
+    )
+    return pd.DataFrame({"open_trades": open_trades[start : end + 1]}, index=index)
+
+
 def evaluate_result_multi(
     trades: pd.DataFrame, timeframe: str, max_open_trades: IntOrInf
 ) -> pd.DataFrame:
     """
-    Find overlapping trades by expanding each trade once per period it was open
-    and then counting overlaps
+    Find periods with more open trades than max_open_trades
     :param trades: Trades Dataframe - can be loaded from backtest, or created
         via trade_list_to_dataframe
     :param timeframe: Frequency used for the backtest
@@ -10,6 +10,7 @@ from collections import deque
 from datetime import UTC, datetime
 from typing import Any
 
+import numpy as np
 from pandas import DataFrame, Timedelta, Timestamp, to_timedelta
 
 from freqtrade.configuration import TimeRange
@@ -53,6 +54,8 @@ class DataProvider:
         self.__slice_date: datetime | None = None
 
         self.__cached_pairs_backtesting: dict[PairWithTimeframe, DataFrame] = {}
+        # Candle dates (int64 ns) of the cached backtesting data - to slice by binary search
+        self.__cached_dates_backtesting: dict[PairWithTimeframe, np.ndarray] = {}
         self.__producer_pairs_df: dict[
             str, dict[PairWithTimeframe, tuple[DataFrame, datetime]]
         ] = {}
@@ -299,6 +302,13 @@ class DataProvider:
         :param timeframe: timeframe to get data for
         :param candle_type: '', mark, index, premiumIndex, or funding_rate
         """
+        return self._get_historic_ohlcv(pair, timeframe, candle_type).copy()
+
+    def _get_historic_ohlcv(self, pair: str, timeframe: str, candle_type: str) -> DataFrame:
+        """
+        Load stored historical candle (OHLCV) data once and return the cached dataframe.
+        Must not be modified - use historic_ohlcv() to get a copy.
+        """
         _candle_type = (
             CandleType.from_string(candle_type)
             if candle_type != ""
@@ -329,7 +339,31 @@ class DataProvider:
                 data_format=self._config["dataformat_ohlcv"],
                 candle_type=_candle_type,
             )
-        return self.__cached_pairs_backtesting[saved_pair].copy()
+            data = self.__cached_pairs_backtesting[saved_pair]
+            self.__cached_dates_backtesting[saved_pair] = (
+                data["date"].values.astype("datetime64[ns]").view(np.int64)
+                if "date" in data.columns
+                else np.empty(0, dtype=np.int64)
+            )
+        return self.__cached_pairs_backtesting[saved_pair]
+
+    def _historic_ohlcv_until(
+        self, pair: str, timeframe: str, candle_type: str, cutoff_date: datetime
+    ) -> DataFrame:
+        """
+        Historical candle (OHLCV) data before cutoff_date.
+        The cutoff is found by binary search on the (sorted) candle dates, and a positional
+        slice of the cached data is returned - so this doesn't scale with the length of the data.
+        """
+        data = self._get_historic_ohlcv(pair, timeframe, candle_type)
+        _candle_type = (
+            CandleType.from_string(candle_type)
+            if candle_type != ""
+            else self._config["candle_type_def"]
+        )
+        dates = self.__cached_dates_backtesting[(pair, str(timeframe), _candle_type)]
+        cutoff = np.searchsorted(dates, Timestamp(cutoff_date).value, side="left")
+        return data.iloc[:cutoff]
 
     def get_required_startup(self, timeframe: str) -> int:
         freqai_config = self._config.get("freqai", {})
@@ -356,6 +390,8 @@ class DataProvider:
         on the runmode.
         Only combinations in the pairlist or which have been specified as informative pairs
         will be available.
+        In backtesting callbacks (once the dataframe is limited to the current date), the result
+        is a slice of the cached data - and should not be modified in place.
         :param pair: pair to get the data for
         :param timeframe: timeframe to get data for
         :return: Dataframe for this pair
@@ -367,12 +403,14 @@ class DataProvider:
         else:
             # Get historical OHLCV data (cached on disk).
             timeframe = timeframe or self._config["timeframe"]
-            data = self.historic_ohlcv(pair=pair, timeframe=timeframe, candle_type=candle_type)
-            # Cut date to timeframe-specific date.
-            # This is necessary to prevent lookahead bias in callbacks through informative pairs.
             if self.__slice_date:
+                # Cut date to timeframe-specific date.
+                # This is necessary to prevent lookahead bias in callbacks through
+                # informative pairs.
                 cutoff_date = timeframe_to_prev_date(timeframe, self.__slice_date)
-                data = data.loc[data["date"] < cutoff_date]
+                data = self._historic_ohlcv_until(pair, timeframe, candle_type, cutoff_date)
+            else:
+                data = self.historic_ohlcv(pair=pair, timeframe=timeframe, candle_type=candle_type)
         if len(data) == 0:
             logger.warning(f"No data found for ({pair}, {timeframe}, {candle_type}).")
         return data
@@ -439,12 +477,20 @@ class DataProvider:
         self,
         pairlist: ListPairsWithTimeframes,
         helping_pairs: ListPairsWithTimeframes | None = None,
+        priority_pairs: list[str] | None = None,
     ) -> None:
         """
         Refresh data, called with each cycle
+        Candles are requested in order of importance - pairlist entries for priority_pairs
+        (usually pairs with open trades) first, then the remaining pairlist, then helping_pairs.
+        :param pairlist: Pairs / timeframes of the whitelist
+        :param helping_pairs: Informative pairs / timeframes
+        :param priority_pairs: Pairs to refresh before all other pairs
         """
         if self._exchange is None:
             raise OperationalException(NO_EXCHANGE_EXCEPTION)
+        if priority_pairs:
+            pairlist = sorted(pairlist, key=lambda p: p[0] not in priority_pairs)
         final_pairs = (pairlist + helping_pairs) if helping_pairs else pairlist
         # refresh latest ohlcv data
         self._exchange.refresh_latest_ohlcv(final_pairs)
@@ -0,0 +1,80 @@
+import logging
+from datetime import UTC, datetime
+from pathlib import Path
+
+from freqtrade.misc import file_dump_json, file_load_json
+
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILE = ".ohlcv_catalog.json"
+CATALOG_VERSION = 1
+
+
+class DataCatalog:
+    """
+    Persistent cache of the date range and length of the data stored in a datadir.
+    Entries are keyed by the path relative to the datadir, and are only valid as long as
+    size and modification time of the path didn't change.
+    """
+
+    def __init__(self, datadir: Path) -> None:
+        self._datadir = datadir
+        self._entries: dict[str, dict] = {}
+        self._changed = False
+        try:
+            catalog = file_load_json(datadir / CATALOG_FILE)
+            if catalog and catalog.get("version") == CATALOG_VERSION:
+                self._entries = catalog["entries"]
+        except Exception as e:
+            logger.warning(f"Could not read data catalog from {datadir}: {e}. Rebuilding it.")
+
+    def _key(self, path: Path) -> str:
+        return path.relative_to(self._datadir).as_posix()
+
+    def get(self, path: Path) -> tuple[datetime, datetime, int] | None:
+        """
+        Cached (min, max, len) of path - or None if unknown or outdated.
+        """
+        entry = self._entries.get(self._key(path))
+        if entry is None:
+            return None
+        stat = path.stat()
+        if entry["mtime"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            return None
+        return (
+            datetime.fromtimestamp(entry["start"] / 1000, tz=UTC),
+            datetime.fromtimestamp(entry["end"] / 1000, tz=UTC),
+            entry["rows"],
+        )
+
+    def set(self, path: Path, min_max: tuple[datetime, datetime, int]) -> None:
+        stat = path.stat()
+        self._entries[self._key(path)] = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "start": int(min_max[0].timestamp() * 1000),
+            "end": int(min_max[1].timestamp() * 1000),
+            "rows": min_max[2],
+        }
+        self._changed = True
+
+    def save(self) -> None:
+        """
+        Write the catalog, dropping entries of data which no longer exists.
+        Failures (e.g. a read-only datadir) are logged, as the catalog is only a cache.
+        """
+        if not self._changed:
+            return
+        entries = {
+            key: entry
+            for key, entry in self._entries.items()
+            if (self._datadir / key).exists()
+        }
+        tmp_file = self._datadir / f"{CATALOG_FILE}.tmp"
+        try:
+            file_dump_json(tmp_file, {"version": CATALOG_VERSION, "entries": entries}, log=False)
+            tmp_file.replace(self._datadir / CATALOG_FILE)
+        except OSError as e:
+            logger.warning(f"Could not write data catalog to {self._datadir}: {e}")
+        self._changed = False
@@ -1,7 +1,8 @@
 import logging
+from datetime import datetime
 
-from pandas import DataFrame, read_feather, to_datetime
-from pyarrow import dataset
+from pandas import DataFrame, read_feather
+from pyarrow import dataset, feather
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
@@ -60,25 +61,37 @@ class FeatherDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
         try:
-            pairdata = read_feather(filename)
-            pairdata.columns = self._columns
-            pairdata = pairdata.astype(
-                dtype={
-                    "open": "float",
-                    "high": "float",
-                    "low": "float",
-                    "close": "float",
-                    "volume": "float",
-                }
-            )
-            pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
-            return pairdata
+            return self._ohlcv_from_arrow(feather.read_table(filename))
         except Exception as e:
             logger.exception(
                 f"Error loading data from {filename}. Exception: {e}. Returning empty dataframe."
             )
             return DataFrame(columns=self._columns)
 
+    def ohlcv_data_min_max(
+        self, pair: str, timeframe: str, candle_type: CandleType
+    ) -> tuple[datetime, datetime, int]:
+        """
+        Returns the min and max timestamp for the given pair and timeframe.
+        Only the date column is read (memory mapped).
+        :param pair: Pair to get min/max for
+        :param timeframe: Timeframe to get min/max for
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: (min, max, len)
+        """
+        filename = self._ohlcv_data_path(pair, timeframe, candle_type)
+        if filename is None:
+            return super().ohlcv_data_min_max(pair, timeframe, candle_type)
+        try:
+            dates = feather.read_table(filename, columns=["date"], memory_map=True)
+        except Exception as e:
+            logger.warning(f"Could not read dates from {filename}: {e}. Loading all data.")
+            return super().ohlcv_data_min_max(pair, timeframe, candle_type)
+        if dates.num_rows == 0:
+            return super().ohlcv_data_min_max(pair, timeframe, candle_type)
+        ends = dates.take([0, dates.num_rows - 1]).to_pandas()["date"]
+        return *self._dates_min_max(ends), dates.num_rows
+
     def ohlcv_append(
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
     ) -> None:
@@ -11,7 +11,8 @@ from copy import deepcopy
 from datetime import UTC, datetime
 from pathlib import Path
 
-from pandas import DataFrame, to_datetime
+from pandas import DataFrame, Series, to_datetime
+from pyarrow import Table
 
 from freqtrade import misc
 from freqtrade.configuration import TimeRange
@@ -26,6 +27,8 @@ from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import timeframe_to_seconds
 
+from .datacatalog import DataCatalog
+
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +36,8 @@ logger = logging.getLogger(__name__)
 class IDataHandler(ABC):
     _OHLCV_REGEX = r"^([a-zA-Z_\d-]+)\-(\d+[a-zA-Z]{1,2})\-?([a-zA-Z_]*)?(?=\.)"
     _TRADES_REGEX = r"^([a-zA-Z_\d-]+)\-(trades)?(?=\.)"
+    # ohlcv_append() is implemented - so new candles don't require rewriting all data
+    ohlcv_append_supported = False
 
     def __init__(self, datadir: Path) -> None:
         self._datadir = datadir
@@ -124,6 +129,70 @@ class IDataHandler(ABC):
             )
         return df.iloc[0]["date"].to_pydatetime(), df.iloc[-1]["date"].to_pydatetime(), len(df)
 
+    def ohlcv_data_min_max_all(
+        self, paircombs: ListPairsWithTimeframes
+    ) -> list[tuple[str, str, CandleType, datetime, datetime, int]]:
+        """
+        ohlcv_data_min_max() for multiple pairs / timeframes.
+        Results are cached in a catalog file in the datadir, and only recalculated for
+        data which changed since.
+        :param paircombs: List of Tuples of (pair, timeframe, CandleType)
+        :return: List of Tuples of (pair, timeframe, CandleType, min, max, len)
+        """
+        catalog = DataCatalog(self._datadir)
+        result = []
+        for pair, timeframe, candle_type in paircombs:
+            path = self._ohlcv_data_path(pair, timeframe, candle_type)
+            min_max = catalog.get(path) if path else None
+            if min_max is None:
+                min_max = self.ohlcv_data_min_max(pair, timeframe, candle_type)
+                if path:
+                    catalog.set(path, min_max)
+            result.append((pair, timeframe, candle_type, *min_max))
+        catalog.save()
+        return result
+
+    def _ohlcv_data_path(self, pair: str, timeframe: str, candle_type: CandleType) -> Path | None:
+        """
+        Path holding the data of this pair / timeframe - or None if there is no data.
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            # Fallback mode for 1M files
+            filename = self._pair_data_filename(
+                self._datadir, pair, timeframe, candle_type=candle_type, no_timeframe_modify=True
+            )
+            if not filename.exists():
+                return None
+        return filename
+
+    def _ohlcv_from_arrow(self, table: Table) -> DataFrame:
+        """
+        Convert an arrow table with ohlcv data to a dataframe.
+        Columns are not consolidated into one block - so they can be taken over without copying
+        (arrow memory is released during the conversion).
+        Columns which already have the final type are not converted again.
+        :param table: Arrow table, columns as in _columns
+        :return: DataFrame with ohlcv data
+        """
+        pairdata = table.to_pandas(split_blocks=True, self_destruct=True)
+        pairdata.columns = self._columns
+        float_columns = {
+            col: "float" for col in self._columns if col != "date" and pairdata[col].dtype != float
+        }
+        if float_columns:
+            pairdata = pairdata.astype(dtype=float_columns)
+        pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
+        return pairdata
+
+    @staticmethod
+    def _dates_min_max(dates: Series) -> tuple[datetime, datetime]:
+        """
+        First and last date of dates - as stored, so either as datetime or in ms.
+        """
+        dates = to_datetime(dates.iloc[[0, -1]], unit="ms", utc=True)
+        return dates.iloc[0].to_pydatetime(), dates.iloc[-1].to_pydatetime()
+
     @abstractmethod
     def _ohlcv_load(
         self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
@@ -565,6 +634,10 @@ def get_datahandlerclass(datatype: str) -> type[IDataHandler]:
         from .parquetdatahandler import ParquetDataHandler
 
         return ParquetDataHandler
+    elif datatype == "partitioned":
+        from .partitioneddatahandler import PartitionedDataHandler
+
+        return PartitionedDataHandler
     else:
         raise ValueError(f"No datahandler for datatype {datatype} available.")
 
@@ -1,6 +1,9 @@
 import logging
+from datetime import datetime
 
-from pandas import DataFrame, read_parquet, to_datetime
+import pyarrow as pa
+from pandas import DataFrame, read_parquet
+from pyarrow import parquet
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
@@ -57,25 +60,52 @@ class ParquetDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
         try:
-            pairdata = read_parquet(filename)
-            pairdata.columns = self._columns
-            pairdata = pairdata.astype(
-                dtype={
-                    "open": "float",
-                    "high": "float",
-                    "low": "float",
-                    "close": "float",
-                    "volume": "float",
-                }
-            )
-            pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
-            return pairdata
+            return self._ohlcv_from_arrow(parquet.read_table(filename))
         except Exception as e:
             logger.exception(
                 f"Error loading data from {filename}. Exception: {e}. Returning empty dataframe."
             )
             return DataFrame(columns=self._columns)
 
+    def ohlcv_data_min_max(
+        self, pair: str, timeframe: str, candle_type: CandleType
+    ) -> tuple[datetime, datetime, int]:
+        """
+        Returns the min and max timestamp for the given pair and timeframe.
+        Uses the statistics of the parquet file - falls back to reading the date column
+        if the file has no statistics.
+        :param pair: Pair to get min/max for
+        :param timeframe: Timeframe to get min/max for
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: (min, max, len)
+        """
+        filename = self._ohlcv_data_path(pair, timeframe, candle_type)
+        if filename is None:
+            return super().ohlcv_data_min_max(pair, timeframe, candle_type)
+        try:
+            parquet_file = parquet.ParquetFile(filename)
+            metadata = parquet_file.metadata
+            if metadata.num_rows == 0:
+                return super().ohlcv_data_min_max(pair, timeframe, candle_type)
+            date_type = parquet_file.schema_arrow.field("date").type
+            column = parquet_file.schema_arrow.get_field_index("date")
+            stats = [
+                metadata.row_group(i).column(column).statistics
+                for i in range(metadata.num_row_groups)
+            ]
+            if all(stat is not None and stat.has_min_max for stat in stats):
+                ends = pa.array(
+                    [min(stat.min for stat in stats), max(stat.max for stat in stats)],
+                    type=date_type,
+                ).to_pandas()
+            else:
+                dates = parquet_file.read(columns=["date"])["date"]
+                ends = dates.take([0, len(dates) - 1]).to_pandas()
+        except Exception as e:
+            logger.warning(f"Could not read dates from {filename}: {e}. Loading all data.")
+            return super().ohlcv_data_min_max(pair, timeframe, candle_type)
+        return *self._dates_min_max(ends), metadata.num_rows
+
     def ohlcv_append(
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
     ) -> None:
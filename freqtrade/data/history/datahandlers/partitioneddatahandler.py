@@ -0,0 +1,242 @@
+import logging
+import shutil
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pandas import DataFrame, Series, concat, read_parquet, to_datetime
+
+from freqtrade.configuration import TimeRange
+from freqtrade.data.converter import clean_ohlcv_dataframe
+from freqtrade.enums import CandleType, TradingMode
+from freqtrade.exchange import timeframe_to_seconds
+from freqtrade.misc import file_dump_json, file_load_json
+
+from .parquetdatahandler import ParquetDataHandler
+
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+
+
+class PartitionedDataHandler(ParquetDataHandler):
+    """
+    Stores the candles of every pair / timeframe / candle type in a directory, split into
+    monthly (yearly for timeframes of 1h and above) parquet segments.
+    A manifest lists the date range and length of every segment - so appending candles only
+    rewrites the segments they fall into, and loading a timerange only reads the segments
+    overlapping it.
+    Trades are stored in regular parquet files.
+    """
+
+    ohlcv_append_supported = True
+
+    @staticmethod
+    def _partition_keys(dates: Series, timeframe: str) -> Series:
+        """
+        Segment name of every candle - YYYY-MM, or YYYY for timeframes of 1h and above.
+        """
+        year = dates.dt.year.astype(str)
+        if timeframe_to_seconds(timeframe) < 3600:
+            return year + "-" + dates.dt.month.astype(str).str.zfill(2)
+        return year
+
+    def _pair_data_dir(self, pair: str, timeframe: str, candle_type: CandleType) -> Path:
+        dirname = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not dirname.is_dir():
+            # Fallback mode for 1M files
+            fallback = self._pair_data_filename(
+                self._datadir, pair, timeframe, candle_type=candle_type, no_timeframe_modify=True
+            )
+            if fallback.is_dir():
+                return fallback
+        return dirname
+
+    @staticmethod
+    def _load_manifest(dirname: Path) -> list[dict]:
+        """
+        :return: List of segments (dicts with name, start, end, rows), sorted by date
+        """
+        manifest = file_load_json(dirname / MANIFEST_FILE)
+        return manifest["segments"] if manifest else []
+
+    @staticmethod
+    def _store_manifest(dirname: Path, segments: list[dict]) -> None:
+        tmp_file = dirname / f"{MANIFEST_FILE}.tmp"
+        file_dump_json(
+            tmp_file, {"segments": sorted(segments, key=lambda s: s["start"])}, log=False
+        )
+        tmp_file.replace(dirname / MANIFEST_FILE)
+
+    def _write_segments(
+        self, dirname: Path, segments: dict[str, dict], data: DataFrame, timeframe: str
+    ) -> None:
+        """
+        Write data (clean, sorted candles) into the segments it belongs to.
+        Existing segments are replaced.
+        """
+        if data.empty:
+            return
+        data = data.reset_index(drop=True).loc[:, self._columns]
+        for name, part in data.groupby(self._partition_keys(data["date"], timeframe)):
+            part.reset_index(drop=True).to_parquet(dirname / f"{name}.parquet")
+            segments[name] = {
+                "name": name,
+                "start": int(part["date"].iloc[0].timestamp() * 1000),
+                "end": int(part["date"].iloc[-1].timestamp() * 1000),
+                "rows": len(part),
+            }
+
+    def ohlcv_store(
+        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
+    ) -> None:
+        """
+        Store data, replacing all existing data of this pair / timeframe.
+        :param pair: Pair - used to generate the directory name
+        :param timeframe: Timeframe - used to generate the directory name
+        :param data: Dataframe containing OHLCV data
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: None
+        """
+        dirname = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self.create_dir_if_needed(dirname)
+        if dirname.is_dir():
+            shutil.rmtree(dirname)
+        dirname.mkdir()
+
+        segments: dict[str, dict] = {}
+        self._write_segments(dirname, segments, data, timeframe)
+        self._store_manifest(dirname, list(segments.values()))
+
+    def _ohlcv_load(
+        self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
+    ) -> DataFrame:
+        """
+        Internal method used to load data for one pair from disk.
+        Implements the loading and conversion to a Pandas dataframe.
+        Timerange trimming and dataframe validation happens outside of this method.
+        :param pair: Pair to load data
+        :param timeframe: Timeframe (e.g. "5m")
+        :param timerange: Limit data to be loaded to this timerange.
+                        Only segments overlapping the timerange are read.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: DataFrame with ohlcv data, or empty DataFrame
+        """
+        dirname = self._pair_data_dir(pair, timeframe, candle_type)
+        if not dirname.is_dir():
+            return DataFrame(columns=self._columns)
+        try:
+            segments = self._load_manifest(dirname)
+            if timerange:
+                if timerange.starttype == "date":
+                    segments = [s for s in segments if s["end"] >= timerange.startts * 1000]
+                if timerange.stoptype == "date":
+                    segments = [s for s in segments if s["start"] <= timerange.stopts * 1000]
+            if not segments:
+                return DataFrame(columns=self._columns)
+            pairdata = concat(
+                [read_parquet(dirname / f"{s['name']}.parquet") for s in segments],
+                ignore_index=True,
+            )
+            pairdata.columns = self._columns
+            pairdata = pairdata.astype(
+                dtype={
+                    "open": "float",
+                    "high": "float",
+                    "low": "float",
+                    "close": "float",
+                    "volume": "float",
+                }
+            )
+            pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
+            return pairdata
+        except Exception as e:
+            logger.exception(
+                f"Error loading data from {dirname}. Exception: {e}. Returning empty dataframe."
+            )
+            return DataFrame(columns=self._columns)
+
+    def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
+        """
+        Remove stored data for the specified pair
+        :param pair: Delete data for this pair.
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: True when deleted, false if the data did not exist.
+        """
+        dirname = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if dirname.is_dir():
+            shutil.rmtree(dirname)
+            return True
+        return False
+
+    def ohlcv_append(
+        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
+    ) -> None:
+        """
+        Merge new candles into the stored data. Only the segments the new candles fall into
+        are rewritten. Candles already stored are updated (like clean_ohlcv_dataframe()).
+        :param pair: Pair
+        :param timeframe: Timeframe this ohlcv data is for
+        :param data: Data to append.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        """
+        if data.empty:
+            return
+        dirname = self._pair_data_dir(pair, timeframe, candle_type)
+        if not dirname.is_dir():
+            self.ohlcv_store(pair, timeframe, data, candle_type)
+            return
+
+        segments = {s["name"]: s for s in self._load_manifest(dirname)}
+        data = data.reset_index(drop=True)
+        for name, part in data.groupby(self._partition_keys(data["date"], timeframe)):
+            if name in segments:
+                existing = read_parquet(dirname / f"{name}.parquet")
+                existing["date"] = to_datetime(existing["date"], unit="ms", utc=True)
+                part = concat([existing, part.loc[:, self._columns]], axis=0)
+            part = clean_ohlcv_dataframe(
+                part, timeframe, pair, fill_missing=False, drop_incomplete=False
+            )
+            self._write_segments(dirname, segments, part, timeframe)
+        self._store_manifest(dirname, list(segments.values()))
+
+    def ohlcv_data_min_max(
+        self, pair: str, timeframe: str, candle_type: CandleType
+    ) -> tuple[datetime, datetime, int]:
+        """
+        Returns the min and max timestamp for the given pair and timeframe - from the manifest.
+        :param pair: Pair to get min/max for
+        :param timeframe: Timeframe to get min/max for
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: (min, max, len)
+        """
+        dirname = self._pair_data_dir(pair, timeframe, candle_type)
+        segments = self._load_manifest(dirname) if dirname.is_dir() else []
+        if not segments:
+            return (
+                datetime.fromtimestamp(0, tz=UTC),
+                datetime.fromtimestamp(0, tz=UTC),
+                0,
+            )
+        return (
+            datetime.fromtimestamp(segments[0]["start"] / 1000, tz=UTC),
+            datetime.fromtimestamp(segments[-1]["end"] / 1000, tz=UTC),
+            sum(s["rows"] for s in segments),
+        )
+
+    @classmethod
+    def _pair_trades_filename(cls, datadir: Path, pair: str, trading_mode: TradingMode) -> Path:
+        return ParquetDataHandler._pair_trades_filename(datadir, pair, trading_mode)
+
+    @classmethod
+    def trades_get_available_data(cls, datadir: Path, trading_mode: TradingMode) -> list[str]:
+        return ParquetDataHandler.trades_get_available_data(datadir, trading_mode)
+
+    @classmethod
+    def trades_get_pairs(cls, datadir: Path) -> list[str]:
+        return ParquetDataHandler.trades_get_pairs(datadir)
+
+    @classmethod
+    def _get_file_extension(cls):
+        return "partitioned"
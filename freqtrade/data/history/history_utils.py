@@ -1,5 +1,7 @@
 import logging
 import operator
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -25,6 +27,7 @@ from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import Exchange
 from freqtrade.exchange.exchange_utils import date_minus_candles
+from freqtrade.optimize.bt_progress import BTProgress
 from freqtrade.plugins.pairlist.pairlist_helpers import dynamic_expand_pairlist
 from freqtrade.util import dt_now, dt_ts, format_ms_time, format_ms_time_det
 from freqtrade.util.migrations import migrate_data
@@ -76,6 +79,22 @@ def load_pair_history(
     )
 
 
+def _load_in_parallel(
+    load_pair: Callable[[str], DataFrame], pairs: list[str], workers: int
+) -> Iterator[tuple[str, DataFrame]]:
+    """
+    Load pairs using up to workers threads.
+    Reading and converting arrow data mostly releases the GIL - so threads suffice.
+    :return: Iterator of (pair, dataframe), in the order of pairs
+    """
+    if workers <= 1 or len(pairs) <= 1:
+        for pair in pairs:
+            yield pair, load_pair(pair)
+        return
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ft_dataload") as executor:
+        yield from zip(pairs, executor.map(load_pair, pairs), strict=True)
+
+
 def load_data(
     datadir: Path,
     timeframe: str,
@@ -88,6 +107,8 @@ def load_data(
     data_format: str = "feather",
     candle_type: CandleType = CandleType.SPOT,
     user_futures_funding_rate: int | None = None,
+    workers: int = 1,
+    progress: BTProgress | None = None,
 ) -> dict[str, DataFrame]:
     """
     Load ohlcv history data for a list of pairs.
@@ -101,6 +122,8 @@ def load_data(
     :param fail_without_data: Raise OperationalException if no data is found.
     :param data_format: Data format which should be used. Defaults to json
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param workers: Number of threads loading pairs in parallel
+    :param progress: Progress to increment once per loaded pair
     :return: dict(<pair>:<Dataframe>)
     """
     result: dict[str, DataFrame] = {}
@@ -109,8 +132,8 @@ def load_data(
 
     data_handler = get_datahandler(datadir, data_format)
 
-    for pair in pairs:
-        hist = load_pair_history(
+    def load_pair(pair: str) -> DataFrame:
+        return load_pair_history(
             pair=pair,
             timeframe=timeframe,
             datadir=datadir,
@@ -120,6 +143,10 @@ def load_data(
             data_handler=data_handler,
             candle_type=candle_type,
         )
+
+    for pair, hist in _load_in_parallel(load_pair, pairs, workers):
+        if progress:
+            progress.increment()
         if not hist.empty:
             result[pair] = hist
         else:
@@ -191,11 +218,22 @@ def _load_cached_data_for_updating(
         if timerange.stoptype == "date":
             end = timerange.stopdt
 
-    # Intentionally don't pass timerange in - since we need to load the full dataset.
+    load_timerange = None
+    data_start = None
+    if data_handler.ohlcv_append_supported and not prepend:
+        # New candles will be appended - so only the last candles are needed.
+        data_start, data_end, data_len = data_handler.ohlcv_data_min_max(
+            pair, timeframe, candle_type
+        )
+        if data_len > 0:
+            tail_start = date_minus_candles(timeframe, 2, data_end)
+            load_timerange = TimeRange("date", None, int(tail_start.timestamp()), 0)
+
+    # Otherwise don't pass timerange in - since we need to load the full dataset.
     data = data_handler.ohlcv_load(
         pair,
         timeframe=timeframe,
-        timerange=None,
+        timerange=load_timerange,
         fill_missing=False,
         drop_incomplete=True,
         warn_no_data=False,
@@ -205,14 +243,16 @@ def _load_cached_data_for_updating(
         if prepend:
             end = data.iloc[0]["date"]
         else:
-            if start and start < data.iloc[0]["date"]:
+            if data_start is None:
+                data_start = data.iloc[0]["date"]
+            if start and start < data_start:
                 # Earlier data than existing data requested, Update start date
                 logger.info(
                     f"{pair}, {timeframe}, {candle_type}: "
                     f"Requested start date {start:{DATETIME_PRINT_FORMAT}} earlier than local "
-                    f"data start date {data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}. "
+                    f"data start date {data_start:{DATETIME_PRINT_FORMAT}}. "
                     f"Use `--prepend` to download data prior "
-                    f"to {data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}, or "
+                    f"to {data_start:{DATETIME_PRINT_FORMAT}}, or "
                     "`--erase` to redownload all data."
                 )
             start = data.iloc[-1]["date"]
@@ -315,6 +355,17 @@ def _download_pair_history(
                 f"Downloaded data for {pair} with length {len(new_dataframe)}. Parallel Method."
             )
 
+        if not data.empty and not prepend and data_handler.ohlcv_append_supported:
+            # Only the new candles are written - existing candles are merged by the handler.
+            data_handler.ohlcv_append(pair, timeframe, new_dataframe, candle_type=candle_type)
+            logger.debug(
+                "New End: %s",
+                f"{new_dataframe.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}"
+                if not new_dataframe.empty
+                else "None",
+            )
+            return True
+
         if data.empty:
             data = new_dataframe
         else:
@@ -7,7 +7,8 @@ import asyncio
 import inspect
 import logging
 import signal
-from collections.abc import Coroutine, Generator
+from collections import deque
+from collections.abc import Callable, Coroutine, Generator
 from copy import deepcopy
 from datetime import UTC, datetime, timedelta
 from math import floor, isnan
@@ -100,6 +101,7 @@ from freqtrade.exchange.exchange_utils_timeframe import (
     timeframe_to_seconds,
 )
 from freqtrade.exchange.exchange_ws import ExchangeWS
+from freqtrade.exchange.kline_buffer import KlineBuffer
 from freqtrade.misc import (
     chunks,
     deep_merge_dicts,
@@ -138,6 +140,8 @@ class Exchange:
         "ohlcv_has_history": True,  # Some exchanges (Kraken) don't provide history via ohlcv
         "ohlcv_partial_candle": True,
         "ohlcv_require_since": False,
+        "ohlcv_refresh_concurrency": 100,  # Max. concurrent jobs in refresh_latest_ohlcv
+        "ohlcv_refresh_timeout": 60,  # Timeout (seconds) for one refresh_latest_ohlcv job
         "download_data_parallel_quick": True,
         "always_require_api_keys": False,  # purge API keys for Dry-run. Must default to false.
         # Check https://github.com/ccxt/ccxt/issues/10767 for removal of ohlcv_volume_currency
@@ -237,9 +241,15 @@ class Exchange:
         # Shouldn't be too high either, as it'll freeze UI updates in case of open orders.
         self._exit_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=300)
         self._entry_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=300)
+        # Tickers / orderbooks fetched by prefetch_rates() - valid for one bot iteration.
+        self._prefetched_tickers: dict[str, Ticker] = {}
+        self._prefetched_order_books: dict[str, OrderBook] = {}
+        self._prefetched_order_book_limit = 0
 
         # Holds candles
         self._klines: dict[PairWithTimeframe, DataFrame] = {}
+        # Incrementally updated storage backing _klines
+        self._kline_buffers: dict[PairWithTimeframe, KlineBuffer] = {}
         self._expiring_candle_cache: dict[tuple[str, int], PeriodicCache] = {}
 
         # Holds public_trades
@@ -2171,12 +2181,12 @@ class Exchange:
         if conf_strategy.get("use_order_book", False):
             order_book_top = conf_strategy.get("order_book_top", 1)
             if order_book is None:
-                order_book = self.fetch_l2_order_book(pair, order_book_top)
+                order_book = self._get_pricing_order_book(pair, order_book_top)
             rate = self._get_rate_from_ob(pair, side, order_book, name, price_side, order_book_top)
         else:
             logger.debug(f"Using Last {price_side.capitalize()} / Last Price")
             if ticker is None:
-                ticker = self.fetch_ticker(pair)
+                ticker = self._get_pricing_ticker(pair)
             rate = self._get_rate_from_ticker(side, ticker, conf_strategy, price_side)
 
         if rate is None:
@@ -2252,10 +2262,10 @@ class Exchange:
             order_book_top = max(
                 entry_pricing.get("order_book_top", 1), exit_pricing.get("order_book_top", 1)
             )
-            order_book = self.fetch_l2_order_book(pair, order_book_top)
+            order_book = self._get_pricing_order_book(pair, order_book_top)
             entry_rate = self.get_rate(pair, refresh, "entry", is_short, order_book=order_book)
         elif not entry_rate:
-            ticker = self.fetch_ticker(pair)
+            ticker = self._get_pricing_ticker(pair)
             entry_rate = self.get_rate(pair, refresh, "entry", is_short, ticker=ticker)
         if not exit_rate:
             exit_rate = self.get_rate(
@@ -2263,6 +2273,161 @@ class Exchange:
             )
         return entry_rate, exit_rate
 
+    def _get_pricing_ticker(self, pair: str) -> Ticker:
+        """
+        Ticker from the current prefetch_rates() call - or fetched from the exchange.
+        """
+        with self._cache_lock:
+            ticker = self._prefetched_tickers.get(pair)
+        if ticker is None:
+            ticker = self.fetch_ticker(pair)
+        return ticker
+
+    def _get_pricing_order_book(self, pair: str, limit: int) -> OrderBook:
+        """
+        Orderbook from the current prefetch_rates() call - or fetched from the exchange.
+        """
+        with self._cache_lock:
+            order_book = self._prefetched_order_books.get(pair)
+            if limit > self._prefetched_order_book_limit:
+                order_book = None
+        if order_book is None:
+            order_book = self.fetch_l2_order_book(pair, limit)
+        return order_book
+
+    def prefetch_rates(self, trade_pairs: dict[str, bool], whitelist: list[str]) -> None:
+        """
+        Fetch pricing data (tickers / orderbooks) for all pairs evaluated in one bot iteration
+        at once, instead of one request per pair in get_rate() / get_rates().
+        Tickers are fetched in bulk if the exchange supports it - otherwise tickers and
+        orderbooks are fetched concurrently through the async api.
+        The prefetched data is used by get_rate() until clear_prefetched_rates() is called.
+        Pairs which fail to prefetch fall back to fetching them on demand.
+        :param trade_pairs: Pairs with open trades - mapped to the trade direction (is_short)
+        :param whitelist: Pairs which may be entered. Only included when tickers can be fetched
+            in bulk - individual requests are limited to pairs with open trades.
+        """
+        entry_pricing = self._config.get("entry_pricing", {})
+        exit_pricing = self._config.get("exit_pricing", {})
+        order_book_tops = [
+            conf.get("order_book_top", 1)
+            for conf in (entry_pricing, exit_pricing)
+            if conf.get("use_order_book", False)
+        ]
+        order_book_top = max(order_book_tops, default=0)
+        # Tickers are required unless both sides use the orderbook
+        use_tickers = len(order_book_tops) < 2
+        bulk_tickers = (
+            use_tickers
+            and self.exchange_has("fetchTickers")
+            and self._ft_has["tickers_have_bid_ask"]
+        )
+        pairs = dict.fromkeys([*trade_pairs, *(whitelist if bulk_tickers else [])])
+        self._size_rate_caches(len(dict.fromkeys([*trade_pairs, *whitelist])))
+
+        tickers: dict[str, Ticker] = {}
+        if bulk_tickers and pairs:
+            try:
+                tickers = {
+                    pair: ticker
+                    # No symbol filter - keeps the shared tickers cache complete.
+                    for pair, ticker in self.get_tickers().items()
+                    if pair in pairs and ticker.get("bid") and ticker.get("ask")
+                }
+            except (TemporaryError, OperationalException) as e:
+                logger.warning(f"Could not prefetch tickers: {e}")
+        to_fetch = [
+            pair
+            for pair in trade_pairs
+            if pair in self.markets and self.markets[pair].get("active", False)
+        ]
+        if use_tickers:
+            tickers.update(
+                self._fetch_pricing_async(
+                    [pair for pair in to_fetch if pair not in tickers],
+                    self._api_async.fetch_ticker,
+                )
+            )
+        order_books: dict[str, OrderBook] = {}
+        if order_book_top:
+            limit = self.get_next_limit_in_list(
+                order_book_top,
+                self._ft_has["l2_limit_range"],
+                self._ft_has["l2_limit_range_required"],
+                self._ft_has["l2_limit_upper"],
+            )
+            order_books = self._fetch_pricing_async(
+                to_fetch, lambda pair: self._api_async.fetch_l2_order_book(pair, limit)
+            )
+
+        with self._cache_lock:
+            self._prefetched_tickers = tickers
+            self._prefetched_order_books = order_books
+            self._prefetched_order_book_limit = order_book_top
+        logger.debug(
+            f"Prefetched pricing data: {len(tickers)} tickers, {len(order_books)} orderbooks."
+        )
+
+        # Fill the rate caches (used by RPC methods)
+        for pair in pairs:
+            if use_tickers and pair not in tickers:
+                continue
+            if order_book_top and pair not in order_books:
+                continue
+            is_short = trade_pairs.get(pair, False)
+            for side in ("entry", "exit"):
+                try:
+                    self.get_rate(pair, refresh=True, side=side, is_short=is_short)
+                except (PricingError, ExchangeError) as e:
+                    logger.debug(f"Could not determine {side} rate for {pair}: {e}")
+
+    def clear_prefetched_rates(self) -> None:
+        """
+        Drop data fetched by prefetch_rates(), so further calls fetch current data again.
+        """
+        with self._cache_lock:
+            self._prefetched_tickers = {}
+            self._prefetched_order_books = {}
+            self._prefetched_order_book_limit = 0
+
+    def _size_rate_caches(self, pair_count: int) -> None:
+        """
+        Grow the entry / exit rate caches so they can hold a rate for every evaluated pair.
+        """
+        with self._cache_lock:
+            if pair_count > self._entry_rate_cache.maxsize:
+                self._entry_rate_cache = TTLCache(maxsize=pair_count, ttl=300)
+                self._exit_rate_cache = TTLCache(maxsize=pair_count, ttl=300)
+
+    def _fetch_pricing_async(
+        self, pairs: list[str], fetch: Callable[[str], Coroutine[Any, Any, Any]]
+    ) -> dict[str, Any]:
+        """
+        Run fetch concurrently for all pairs.
+        :return: Dict of pair -> result for all successful requests
+        """
+        if not pairs:
+            return {}
+
+        async def fetch_pair(pair: str):
+            return await fetch(pair)
+
+        async def gather_results():
+            return await asyncio.gather(
+                *(fetch_pair(pair) for pair in pairs), return_exceptions=True
+            )
+
+        with self._loop_lock:
+            results = self.loop.run_until_complete(gather_results())
+
+        data = {}
+        for pair, res in zip(pairs, results, strict=True):
+            if isinstance(res, BaseException):
+                logger.debug(f"Could not prefetch pricing data for {pair}: {repr(res)}")
+                continue
+            data[pair] = res
+        return data
+
     # Fee handling
 
     @retrier
@@ -2538,7 +2703,7 @@ class Exchange:
         if self._can_use_websocket(self._exchange_ws, pair, timeframe, candle_type):
             candle_ts = dt_ts(timeframe_to_prev_date(timeframe))
             prev_candle_ts = dt_ts(date_minus_candles(timeframe, 1))
-            candles = self._exchange_ws.ohlcvs(pair, timeframe)
+            candles = self._exchange_ws.ohlcv_snapshot(pair, timeframe)
             half_candle = int(candle_ts - (candle_ts - prev_candle_ts) * 0.5)
             last_refresh_time = int(
                 self._exchange_ws.klines_last_refresh.get((pair, timeframe, candle_type), 0)
@@ -2547,9 +2712,9 @@ class Exchange:
             if (
                 candles
                 and (
-                    (len(candles) > 1 and candles[-1][0] >= prev_candle_ts)
+                    (len(candles) > 1 and candles.last_date >= prev_candle_ts)
                     # Edgecase on reconnect, where 1 candle is available but it's the current one
-                    or (len(candles) == 1 and candles[-1][0] < candle_ts)
+                    or (len(candles) == 1 and candles.last_date < candle_ts)
                 )
                 and last_refresh_time >= half_candle
             ):
@@ -2608,6 +2773,7 @@ class Exchange:
                     f"Time jump detected. Evicting cache for {pair}, {timeframe}, {candle_type}"
                 )
                 del self._klines[(pair, timeframe, candle_type)]
+                self._kline_buffers.pop((pair, timeframe, candle_type), None)
 
         if not since_ms and (self._ft_has["ohlcv_require_since"] or not_all_data):
             # Multiple calls for one pair - to get more history
@@ -2630,13 +2796,14 @@ class Exchange:
 
     def _build_ohlcv_dl_jobs(
         self, pair_list: ListPairsWithTimeframes, since_ms: int | None, cache: bool
-    ) -> tuple[list[Coroutine], list[PairWithTimeframe]]:
+    ) -> tuple[list[tuple[PairWithTimeframe, Coroutine]], list[PairWithTimeframe]]:
         """
         Build Coroutines to execute as part of refresh_latest_ohlcv
+        Jobs keep the order of pair_list (which defines their priority).
         """
-        input_coroutines: list[Coroutine[Any, Any, OHLCVResponse]] = []
+        input_coroutines: list[tuple[PairWithTimeframe, Coroutine[Any, Any, OHLCVResponse]]] = []
         cached_pairs = []
-        for pair, timeframe, candle_type in set(pair_list):
+        for pair, timeframe, candle_type in dict.fromkeys(pair_list):
             invalid_funding = (
                 candle_type == CandleType.FUNDING_RATE
                 and timeframe != self.get_option("funding_fee_timeframe")
@@ -2664,7 +2831,10 @@ class Exchange:
                 or self._now_is_time_to_refresh(pair, timeframe, candle_type)
             ):
                 input_coroutines.append(
-                    self._build_coroutine(pair, timeframe, candle_type, since_ms, cache)
+                    (
+                        (pair, timeframe, candle_type),
+                        self._build_coroutine(pair, timeframe, candle_type, since_ms, cache),
+                    )
                 )
 
             else:
@@ -2697,18 +2867,29 @@ class Exchange:
         if cache:
             if (pair, timeframe, c_type) in self._klines:
                 old = self._klines[(pair, timeframe, c_type)]
-                # Reassign so we return the updated, combined df
-                ohlcv_df = clean_ohlcv_dataframe(
-                    concat([old, ohlcv_df], axis=0),
-                    timeframe,
-                    pair,
-                    fill_missing=True,
-                    drop_incomplete=False,
-                )
                 candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
-                # Age out old candles
-                ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
-                ohlcv_df = ohlcv_df.reset_index(drop=True)
+                maxlen = candle_limit + self._startup_candle_count
+                buffer = self._kline_buffers.get((pair, timeframe, c_type))
+                if buffer is None or buffer.df is not old or buffer.maxlen != maxlen:
+                    # First update - or the cache was replaced.
+                    buffer = KlineBuffer.from_dataframe(old, timeframe, maxlen)
+                if buffer is not None and buffer.update(ohlcv_df, pair):
+                    # Only the new candles were merged - the buffer ages out old candles.
+                    self._kline_buffers[(pair, timeframe, c_type)] = buffer
+                    ohlcv_df = buffer.df
+                else:
+                    # Reassign so we return the updated, combined df
+                    ohlcv_df = clean_ohlcv_dataframe(
+                        concat([old, ohlcv_df], axis=0),
+                        timeframe,
+                        pair,
+                        fill_missing=True,
+                        drop_incomplete=False,
+                    )
+                    # Age out old candles
+                    ohlcv_df = ohlcv_df.tail(maxlen)
+                    ohlcv_df = ohlcv_df.reset_index(drop=True)
+                    self._kline_buffers.pop((pair, timeframe, c_type), None)
                 self._klines[(pair, timeframe, c_type)] = ohlcv_df
             else:
                 self._klines[(pair, timeframe, c_type)] = ohlcv_df
@@ -2725,6 +2906,8 @@ class Exchange:
         """
         Refresh in-memory OHLCV asynchronously and set `_klines` with the result
         Loops asynchronously over pair_list and downloads all pairs async (semi-parallel).
+        Downloads are started in the order of pair_list - so more important pairs
+        should come first.
         Only used in the dataprovider.refresh() method.
         :param pair_list: List of 2 element tuples containing pair, interval to refresh
         :param since_ms: time since when to download, in milliseconds
@@ -2739,27 +2922,23 @@ class Exchange:
         ohlcv_dl_jobs, cached_pairs = self._build_ohlcv_dl_jobs(pair_list, since_ms, cache)
 
         results_df = {}
-        # Chunk requests into batches of 100 to avoid overwhelming ccxt Throttling
-        for dl_jobs_batch in chunks(ohlcv_dl_jobs, 100):
 
-            async def gather_coroutines(coro):
-                return await asyncio.gather(*coro, return_exceptions=True)
+        def process_result(res: OHLCVResponse) -> None:
+            # Deconstruct tuple (has 5 elements)
+            pair, timeframe, c_type, ticks, drop_hint = res
+            drop_incomplete_ = drop_hint if drop_incomplete is None else drop_incomplete
+            ohlcv_df = self._process_ohlcv_df(
+                pair, timeframe, c_type, ticks, cache, drop_incomplete_
+            )
 
-            with self._loop_lock:
-                results = self.loop.run_until_complete(gather_coroutines(dl_jobs_batch))
+            results_df[(pair, timeframe, c_type)] = ohlcv_df
 
-            for res in results:
-                if isinstance(res, Exception):
-                    logger.warning(f"Async code raised an exception: {repr(res)}")
-                    continue
-                # Deconstruct tuple (has 5 elements)
-                pair, timeframe, c_type, ticks, drop_hint = res
-                drop_incomplete_ = drop_hint if drop_incomplete is None else drop_incomplete
-                ohlcv_df = self._process_ohlcv_df(
-                    pair, timeframe, c_type, ticks, cache, drop_incomplete_
-                )
-
-                results_df[(pair, timeframe, c_type)] = ohlcv_df
+        # Downloads of a longer history (since_ms) may take many calls - so they don't time out.
+        timeout = None if since_ms else self._ft_has["ohlcv_refresh_timeout"]
+        with self._loop_lock:
+            self.loop.run_until_complete(
+                self._run_ohlcv_dl_jobs(ohlcv_dl_jobs, process_result, timeout)
+            )
 
         # Return cached klines
         for pair, timeframe, c_type in cached_pairs:
@@ -2769,6 +2948,55 @@ class Exchange:
 
         return results_df
 
+    def _ohlcv_refresh_concurrency(self, timeout: float | None) -> int:
+        """
+        Number of refresh_latest_ohlcv jobs to run concurrently.
+        ccxt's throttle starts one request per "rateLimit" - so jobs beyond what the rate limit
+        can serve within half the timeout would only wait in the throttle (and time out)
+        without finishing the refresh any faster.
+        """
+        concurrency = self._ft_has["ohlcv_refresh_concurrency"]
+        if timeout and self._api_async.enableRateLimit:
+            rate_limit = float(self._api_async.rateLimit) / 1000
+            if rate_limit > 0:
+                concurrency = min(concurrency, int(timeout / 2 / rate_limit))
+        return max(concurrency, 1)
+
+    async def _run_ohlcv_dl_jobs(
+        self,
+        dl_jobs: list[tuple[PairWithTimeframe, Coroutine[Any, Any, OHLCVResponse]]],
+        process_result: Callable[[OHLCVResponse], None],
+        timeout: float | None,
+    ) -> None:
+        """
+        Run download jobs with a bounded number of workers.
+        Jobs are started in the given order, and each result is processed as soon as it's
+        available - so one slow pair doesn't delay the remaining pairs.
+        :param dl_jobs: List of (pair/timeframe/candle_type, coroutine) tuples
+        :param process_result: Called with the result of each successful job
+        :param timeout: Timeout (seconds) per job. None to disable.
+        """
+        queue = deque(dl_jobs)
+
+        async def worker() -> None:
+            while queue:
+                (pair, timeframe, candle_type), job = queue.popleft()
+                try:
+                    res = await asyncio.wait_for(job, timeout)
+                except TimeoutError:
+                    logger.warning(
+                        f"Refreshing candle (OHLCV) data for {pair}, {timeframe}, {candle_type} "
+                        f"timed out after {timeout}s."
+                    )
+                    continue
+                except Exception as e:
+                    logger.warning(f"Async code raised an exception: {repr(e)}")
+                    continue
+                process_result(res)
+
+        workers = min(self._ohlcv_refresh_concurrency(timeout), len(queue))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
     def refresh_ohlcv_with_cache(
         self, pairs: list[PairWithTimeframe], since_ms: int
     ) -> dict[PairWithTimeframe, DataFrame]:
@@ -1,7 +1,6 @@
 import asyncio
 import logging
 import time
-from copy import deepcopy
 from functools import partial
 from threading import Thread
 
@@ -9,10 +8,9 @@ import ccxt
 
 from freqtrade.constants import Config, PairWithTimeframe
 from freqtrade.enums.candletype import CandleType
-from freqtrade.exceptions import TemporaryError
-from freqtrade.exchange.common import retrier
 from freqtrade.exchange.exchange import timeframe_to_seconds
 from freqtrade.exchange.exchange_types import OHLCVResponse
+from freqtrade.exchange.ws_candle_buffer import WSCandleBuffer, WSCandleSnapshot
 from freqtrade.util import dt_ts, format_ms_time, format_ms_time_det
 
 
@@ -29,6 +27,10 @@ class ExchangeWS:
         self._klines_scheduled: set[PairWithTimeframe] = set()
         self.klines_last_refresh: dict[PairWithTimeframe, float] = {}
         self.klines_last_request: dict[PairWithTimeframe, float] = {}
+        # Candles received via websocket, keyed by (pair, timeframe)
+        self._candle_buffers: dict[tuple[str, str], WSCandleBuffer] = {}
+        # Time (ms) between receiving the last candle update and handing it to the bot
+        self.klines_handoff_latency: dict[PairWithTimeframe, int] = {}
         self._thread = Thread(name="ccxt_ws", target=self._start_forever)
         self._thread.start()
         self.__cleanup_called = False
@@ -74,6 +76,7 @@ class ExchangeWS:
             # Clear the cache.
             # Not doing this will cause problems on startup with dynamic pairlists
             self._ccxt_object.ohlcvs.clear()
+            self._candle_buffers.clear()
         except Exception:
             logger.exception("Exception in _cleanup_async")
         finally:
@@ -84,21 +87,37 @@ class ExchangeWS:
         Remove history for a pair/timeframe combination from ccxt cache
         """
         self._ccxt_object.ohlcvs.get(paircomb[0], {}).pop(paircomb[1], None)
+        self._candle_buffers.pop((paircomb[0], paircomb[1]), None)
         self.klines_last_refresh.pop(paircomb, None)
 
-    @retrier(retries=3)
+    def _store_ohlcv(self, pair: str, timeframe: str, received: int) -> None:
+        """
+        Merge new candles from ccxt's cache into the candle buffer.
+        Runs in the websocket thread - which is also the only thread modifying ccxt's cache.
+        """
+        candles = self._ccxt_object.ohlcvs.get(pair, {}).get(timeframe, [])
+        if (pair, timeframe) not in self._candle_buffers:
+            self._candle_buffers[(pair, timeframe)] = WSCandleBuffer()
+        self._candle_buffers[(pair, timeframe)].update(candles, received)
+
+    def ohlcv_snapshot(self, pair: str, timeframe: str) -> WSCandleSnapshot | None:
+        """
+        Returns a consistent, read-only snapshot of the klines for a pair/timeframe combination
+        Note: this will only contain the data received from the websocket
+            so the data will build up over time.
+        """
+        if buffer := self._candle_buffers.get((pair, timeframe)):
+            return buffer.snapshot()
+        return None
+
     def ohlcvs(self, pair: str, timeframe: str) -> list[list]:
         """
         Returns a copy of the klines for a pair/timeframe combination
         Note: this will only contain the data received from the websocket
             so the data will build up over time.
         """
-        try:
-            return deepcopy(self._ccxt_object.ohlcvs.get(pair, {}).get(timeframe, []))
-        except RuntimeError as e:
-            # Capture runtime errors and retry
-            # TemporaryError does not cause backoff - so we're essentially retrying immediately
-            raise TemporaryError(f"Error deepcopying: {e}") from e
+        snapshot = self.ohlcv_snapshot(pair, timeframe)
+        return snapshot.tolist() if snapshot else []
 
     def cleanup_expired(self) -> None:
         """
@@ -175,6 +194,7 @@ class ExchangeWS:
                 start = dt_ts()
                 data = await self._ccxt_object.watch_ohlcv(pair, timeframe)
                 self.klines_last_refresh[(pair, timeframe, candle_type)] = dt_ts()
+                self._store_ohlcv(pair, timeframe, dt_ts())
                 logger.debug(
                     f"watch done {pair}, {timeframe}, data {len(data)} "
                     f"in {(dt_ts() - start) / 1000:.3f}s"
@@ -207,10 +227,13 @@ class ExchangeWS:
         Returns cached klines from ccxt's "watch" cache.
         :param candle_ts: timestamp of the end-time of the candle we expect.
         """
-        # Deepcopy the response - as it might be modified in the background as new messages arrive
-        candles = self.ohlcvs(pair, timeframe)
+        # Snapshot - the buffer is modified in the background as new messages arrive
+        snapshot = self.ohlcv_snapshot(pair, timeframe)
+        candles = snapshot.tolist() if snapshot else []
         refresh_date = self.klines_last_refresh[(pair, timeframe, candle_type)]
         received_ts = candles[-1][0] if candles else 0
+        latency = dt_ts() - snapshot.received if snapshot else 0
+        self.klines_handoff_latency[(pair, timeframe, candle_type)] = latency
         drop_hint = received_ts >= candle_ts
         if received_ts > refresh_date:
             logger.warning(
@@ -222,6 +245,7 @@ class ExchangeWS:
             f"watch result for {pair}, {timeframe} with length {len(candles)}, "
             f"r_ts={format_ms_time(received_ts)}, "
             f"lref={format_ms_time_det(refresh_date)}, "
-            f"candle_ts={format_ms_time(candle_ts)}, {drop_hint=}"
+            f"candle_ts={format_ms_time(candle_ts)}, {drop_hint=}, "
+            f"latency={latency / 1000:.3f}s"
         )
         return pair, timeframe, candle_type, candles, drop_hint
@@ -0,0 +1,163 @@
+"""
+Incremental in-memory storage of candle (OHLCV) data, used by Exchange to cache klines.
+"""
+
+import logging
+
+import numpy as np
+from pandas import DataFrame, to_datetime
+
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+from freqtrade.exchange.exchange_utils_timeframe import (
+    timeframe_to_msecs,
+    timeframe_to_resample_freq,
+)
+
+
+logger = logging.getLogger(__name__)
+
+_OPEN, _HIGH, _LOW, _CLOSE, _VOLUME = range(5)
+
+
+class KlineBuffer:
+    """
+    Bounded buffer of gap-free candles for one (pair, timeframe, candle_type).
+
+    Candles are stored in preallocated arrays with twice the required capacity.
+    New candles are appended (or merged into existing candles) in place - and the buffer is
+    only compacted once it's full - so a refresh only touches the new candles instead of
+    rebuilding (concat, group, resample) the whole dataframe.
+    Merging follows clean_ohlcv_dataframe() - existing open, max high, min low,
+    new close, max volume - and missing candles are filled like ohlcv_fill_up_missing_data().
+    """
+
+    def __init__(self, timeframe: str, maxlen: int) -> None:
+        self.timeframe_ms = timeframe_to_msecs(timeframe)
+        self.maxlen = maxlen
+        self._dates = np.empty(maxlen * 2, dtype=np.int64)
+        self._values = np.empty((maxlen * 2, 5), dtype=np.float64)
+        self._start = 0
+        self._stop = 0
+        # Dataframe handed out for the current buffer content
+        self.df = DataFrame(columns=DEFAULT_DATAFRAME_COLUMNS)
+
+    @staticmethod
+    def supports_timeframe(timeframe: str) -> bool:
+        """
+        Only timeframes with a fixed length can be stored - monthly / yearly candles
+        are handled by the regular (resample based) logic.
+        """
+        return timeframe_to_resample_freq(timeframe).endswith("s")
+
+    @classmethod
+    def from_dataframe(cls, df: DataFrame, timeframe: str, maxlen: int) -> "KlineBuffer | None":
+        """
+        Create a buffer from an existing, cleaned OHLCV dataframe.
+        :return: KlineBuffer - or None if the dataframe is empty or not gap-free.
+        """
+        if df.empty or not cls.supports_timeframe(timeframe):
+            return None
+        buffer = cls(timeframe, maxlen)
+        dates = df["date"].values.astype("datetime64[ms]").view(np.int64)[-maxlen:]
+        if (np.diff(dates) != buffer.timeframe_ms).any():
+            return None
+        count = len(dates)
+        buffer._dates[:count] = dates
+        buffer._values[:count] = df[DEFAULT_DATAFRAME_COLUMNS[1:]].to_numpy(dtype=np.float64)[
+            -maxlen:
+        ]
+        buffer._stop = count
+        buffer.df = df
+        return buffer
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def update(self, new_df: DataFrame, pair: str) -> bool:
+        """
+        Merge new candles into the buffer.
+        :param new_df: Cleaned (grouped and sorted) OHLCV dataframe, may contain gaps.
+        :param pair: Pair this data is for (used for logging)
+        :return: False if the candles can't be merged incrementally (they start before the
+            buffered data or are not aligned to it). The buffer is unchanged in this case.
+        """
+        if new_df.empty:
+            return True
+        new_dates = new_df["date"].values.astype("datetime64[ms]").view(np.int64)
+        new_values = new_df[DEFAULT_DATAFRAME_COLUMNS[1:]].to_numpy(dtype=np.float64)
+        first = self._dates[self._start]
+        last = self._dates[self._stop - 1]
+        if new_dates[0] < first or ((new_dates - first) % self.timeframe_ms).any():
+            return False
+
+        # Candles which are already buffered
+        overlap = new_dates <= last
+        if overlap.any():
+            pos = self._start + (new_dates[overlap] - first) // self.timeframe_ms
+            current = self._values[pos]
+            merged = new_values[overlap]
+            current[:, _HIGH] = np.maximum(current[:, _HIGH], merged[:, _HIGH])
+            current[:, _LOW] = np.minimum(current[:, _LOW], merged[:, _LOW])
+            current[:, _CLOSE] = merged[:, _CLOSE]
+            current[:, _VOLUME] = np.maximum(current[:, _VOLUME], merged[:, _VOLUME])
+            self._values[pos] = current
+
+        # New candles - including eventually missing candles in between.
+        add_dates = new_dates[~overlap]
+        if len(add_dates) > 0:
+            count = int((add_dates[-1] - last) // self.timeframe_ms)
+            if count > len(add_dates):
+                logger.debug(
+                    f"Missing data fillup for {pair}: {count - len(add_dates)} candles filled."
+                )
+            self._reserve(count)
+            rows = slice(self._stop, self._stop + count)
+            self._dates[rows] = last + np.arange(1, count + 1, dtype=np.int64) * self.timeframe_ms
+            positions = (add_dates - last) // self.timeframe_ms - 1
+            # View - rows are written directly into the buffer.
+            values = self._values[rows]
+            values[:] = np.nan
+            values[positions] = new_values[~overlap]
+            filled = np.isnan(values[:, _CLOSE])
+            if filled.any():
+                # Forward-fill close (from the last buffered candle) into missing candles
+                closes = np.concatenate(([self._values[self._stop - 1, _CLOSE]], values[:, _CLOSE]))
+                idx = np.where(np.isnan(closes), 0, np.arange(len(closes)))
+                closes = closes[np.maximum.accumulate(idx)][1:]
+                values[filled, _OPEN : _CLOSE + 1] = closes[filled, None]
+                values[filled, _VOLUME] = 0.0
+            self._stop += count
+
+        # Age out old candles
+        self._start = max(self._start, self._stop - self.maxlen)
+        self.df = self._to_dataframe()
+        return True
+
+    def _reserve(self, count: int) -> None:
+        """
+        Make sure count candles can be appended, compacting or growing the arrays if necessary.
+        """
+        if self._stop + count <= len(self._dates):
+            return
+        keep = min(len(self), self.maxlen)
+        capacity = max(len(self._dates), 2 * (keep + count))
+        dates = np.empty(capacity, dtype=np.int64)
+        values = np.empty((capacity, 5), dtype=np.float64)
+        dates[:keep] = self._dates[self._stop - keep : self._stop]
+        values[:keep] = self._values[self._stop - keep : self._stop]
+        self._dates, self._values = dates, values
+        self._start, self._stop = 0, keep
+
+    def _to_dataframe(self) -> DataFrame:
+        # Copy - the buffer is modified in place on the next update.
+        values = self._values[self._start : self._stop]
+        return DataFrame(
+            {
+                "date": to_datetime(self._dates[self._start : self._stop], unit="ms", utc=True),
+                "open": values[:, _OPEN].copy(),
+                "high": values[:, _HIGH].copy(),
+                "low": values[:, _LOW].copy(),
+                "close": values[:, _CLOSE].copy(),
+                "volume": values[:, _VOLUME].copy(),
+            }
+        )
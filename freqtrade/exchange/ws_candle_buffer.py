@@ -0,0 +1,111 @@
+"""
+Candle storage shared between the websocket thread (writer) and the bot (reader).
+"""
+
+from dataclasses import dataclass
+from threading import Lock
+
+import numpy as np
+
+
+# Number of candles kept per pair - matches ccxt's default "OHLCVLimit".
+WS_CANDLE_LIMIT = 1000
+
+
+@dataclass(frozen=True)
+class WSCandleSnapshot:
+    """
+    Immutable view of the candles of one pair / timeframe.
+    Arrays are read-only and never modified after the snapshot was created.
+    """
+
+    version: int
+    # Candle open times in ms
+    dates: np.ndarray
+    # open, high, low, close, volume
+    values: np.ndarray
+    # Time (ms) the websocket delivered the latest update
+    received: int
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def last_date(self) -> int:
+        return int(self.dates[-1]) if len(self.dates) else 0
+
+    def tolist(self) -> list[list]:
+        """Candles in the format returned by ccxt (fetch_ohlcv / watch_ohlcv)."""
+        return [[d, *v] for d, v in zip(self.dates.tolist(), self.values.tolist(), strict=True)]
+
+
+class WSCandleBuffer:
+    """
+    Preallocated, lock protected candle buffer for one pair / timeframe.
+    The websocket thread merges new candles in place. Readers get a versioned snapshot,
+    which is only copied (once) after the buffer changed - so reading neither requires
+    deepcopying ccxt's cache nor retrying when the cache is modified while copying.
+    """
+
+    def __init__(self, maxlen: int = WS_CANDLE_LIMIT) -> None:
+        self.maxlen = maxlen
+        self._lock = Lock()
+        self._dates = np.empty(maxlen * 2, dtype=np.int64)
+        self._values = np.empty((maxlen * 2, 5), dtype=np.float64)
+        self._start = 0
+        self._stop = 0
+        self.version = 0
+        self._received = 0
+        self._snapshot = self._create_snapshot()
+
+    def update(self, candles: list[list], received: int) -> None:
+        """
+        Merge candles (as received from ccxt) into the buffer.
+        Only candles starting at or after the last buffered candle are considered.
+        Must only be called from the websocket thread.
+        :param candles: List of candles, sorted by date
+        :param received: Time (ms) the candles were received
+        """
+        with self._lock:
+            last = self._dates[self._stop - 1] if self._stop > self._start else -1
+            # Find the first candle which is not buffered yet (or updates the last candle).
+            first_new = len(candles)
+            while first_new > 0 and candles[first_new - 1][0] >= last:
+                first_new -= 1
+            new_candles = candles[first_new:]
+            if not new_candles:
+                return
+            if new_candles[0][0] == last:
+                # Update of the currently open candle
+                self._values[self._stop - 1] = new_candles[0][1:6]
+                new_candles = new_candles[1:]
+            new_candles = new_candles[-self.maxlen :]
+            if self._stop + len(new_candles) > len(self._dates):
+                keep = min(self._stop - self._start, self.maxlen - len(new_candles))
+                self._dates[:keep] = self._dates[self._stop - keep : self._stop]
+                self._values[:keep] = self._values[self._stop - keep : self._stop]
+                self._start, self._stop = 0, keep
+            for candle in new_candles:
+                self._dates[self._stop] = candle[0]
+                self._values[self._stop] = candle[1:6]
+                self._stop += 1
+            self._start = max(self._start, self._stop - self.maxlen)
+            self.version += 1
+            self._received = received
+
+    def snapshot(self) -> WSCandleSnapshot:
+        """
+        Return a consistent snapshot of the buffered candles.
+        The snapshot is shared between readers until the buffer changes.
+        """
+        with self._lock:
+            if self._snapshot.version != self.version:
+                self._snapshot = self._create_snapshot()
+            return self._snapshot
+
+    def _create_snapshot(self) -> WSCandleSnapshot:
+        dates = self._dates[self._start : self._stop].copy()
+        values = self._values[self._start : self._stop].copy()
+        dates.flags.writeable = False
+        values.flags.writeable = False
+        return WSCandleSnapshot(self.version, dates, values, self._received)
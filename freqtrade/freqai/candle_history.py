@@ -0,0 +1,126 @@
+"""
+In-memory candle history used by FreqAI for training.
+"""
+
+import logging
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from freqtrade.exceptions import OperationalException
+
+
+logger = logging.getLogger(__name__)
+
+# Smallest number of candles allocated when growing a history
+MIN_CAPACITY = 1024
+
+
+def _date_values(dates: pd.Series) -> np.ndarray:
+    return dates.values.astype("datetime64[ns]").view(np.int64)
+
+
+class CandleHistory:
+    """
+    Append-only candle history of one pair / timeframe.
+    Candles are stored in arrays with spare capacity, which are only grown once full - so
+    appending the latest candles is amortized O(1) instead of concatenating the full history.
+    Every history has its own lock, so updating one pair doesn't block training on another.
+    """
+
+    def __init__(self, df: DataFrame) -> None:
+        self.columns = [col for col in df.columns if col != "date"]
+        self._lock = threading.Lock()
+        self._dates = _date_values(df["date"])
+        self._values = df[self.columns].to_numpy(dtype=np.float64)
+        self._len = len(df)
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def last_date(self) -> pd.Timestamp | None:
+        """Date of the newest candle"""
+        with self._lock:
+            if self._len == 0:
+                return None
+            return pd.Timestamp(self._dates[self._len - 1], tz="UTC")
+
+    def append(self, df: DataFrame, pair: str, timeframe: str) -> int:
+        """
+        Append all candles of df newer than the newest stored candle.
+        :param df: Sorted candles (e.g. from the dataprovider), overlapping the stored candles
+        :param pair: Pair of this history (used for messages)
+        :param timeframe: Timeframe of this history (used for messages)
+        :return: Number of appended candles
+        """
+        if df.empty:
+            return 0
+        new_dates = _date_values(df["date"])
+        with self._lock:
+            start = 0
+            if self._len > 0:
+                last = self._dates[self._len - 1]
+                start = int(np.searchsorted(new_dates, last, side="right"))
+                if start == len(new_dates):
+                    return 0
+                if start == 0:
+                    raise OperationalException(
+                        "In memory historical data is older than "
+                        f"oldest DataProvider candle for {pair} on "
+                        f"timeframe {timeframe}"
+                    )
+                if new_dates[start - 1] != last:
+                    # Only the latest candle is appended - as it's unclear where the gap is.
+                    start = len(new_dates) - 1
+                    logger.warning(
+                        f"No common dates in historical data and dataprovider for {pair}. "
+                        f"Appending latest dataprovider candle to historical data "
+                        "but please be aware that there is likely a gap in the historical "
+                        "data. \n"
+                        f"Historical data ends at {pd.Timestamp(last, tz='UTC')} "
+                        f"while dataprovider starts at {df['date'].iloc[0]} and "
+                        f"ends at {df['date'].iloc[-1]}."
+                    )
+            count = len(new_dates) - start
+            self._reserve(count)
+            rows = slice(self._len, self._len + count)
+            self._dates[rows] = new_dates[start:]
+            self._values[rows] = df[self.columns].to_numpy(dtype=np.float64)[start:]
+            self._len += count
+            return count
+
+    def slice(self, start: datetime, stop: datetime | None = None) -> DataFrame:
+        """
+        Candles with start <= date < stop.
+        :param start: First candle date to include
+        :param stop: Candle date to stop at - None to include the newest candle
+        :return: DataFrame (with a fresh index)
+        """
+        with self._lock:
+            dates = self._dates[: self._len]
+            first = int(np.searchsorted(dates, pd.Timestamp(start).value, side="left"))
+            end = self._len
+            if stop is not None:
+                end = int(np.searchsorted(dates, pd.Timestamp(stop).value, side="left"))
+            end = max(first, end)
+            # Copy - the arrays are modified in place by later appends.
+            df = DataFrame(self._values[first:end].copy(), columns=self.columns)
+            df.insert(0, "date", pd.to_datetime(dates[first:end], unit="ns", utc=True))
+            return df
+
+    def _reserve(self, count: int) -> None:
+        """
+        Make sure count candles can be appended, growing the arrays if necessary.
+        """
+        if self._len + count <= len(self._dates):
+            return
+        capacity = max(2 * (self._len + count), MIN_CAPACITY)
+        dates = np.empty(capacity, dtype=np.int64)
+        values = np.empty((capacity, len(self.columns)), dtype=np.float64)
+        dates[: self._len] = self._dates[: self._len]
+        values[: self._len] = self._values[: self._len]
+        self._dates, self._values = dates, values
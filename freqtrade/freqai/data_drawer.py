@@ -22,7 +22,9 @@ from freqtrade.constants import Config
 from freqtrade.data.history import load_pair_history
 from freqtrade.enums import CandleType
 from freqtrade.exceptions import OperationalException
+from freqtrade.freqai.candle_history import CandleHistory
 from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
+from freqtrade.freqai.historic_predictions import HistoricPredictions
 from freqtrade.strategy.interface import IStrategy
 
 
@@ -77,9 +79,13 @@ class FreqaiDataDrawer:
         # all additional metadata that we want to keep in ram
         self.meta_data_dictionary: dict[str, dict[str, Any]] = {}
         self.model_return_values: dict[str, DataFrame] = {}
-        self.historic_data: dict[str, dict[str, DataFrame]] = {}
-        self.historic_predictions: dict[str, DataFrame] = {}
+        self.historic_data: dict[str, dict[str, CandleHistory]] = {}
         self.full_path = full_path
+        self.historic_predictions = HistoricPredictions(
+            self.full_path / "historic_predictions",
+            self.freqai_info.get("historic_predictions_max_candles", 0),
+        )
+        # Single file format used by previous versions - converted on load
         self.historic_predictions_path = Path(self.full_path / "historic_predictions.pkl")
         self.historic_predictions_bkp_path = Path(
             self.full_path / "historic_predictions.backup.pkl"
@@ -92,7 +98,6 @@ class FreqaiDataDrawer:
         self.metric_tracker: dict[str, dict[str, dict[str, list]]] = {}
         self.load_metric_tracker_from_disk()
         self.training_queue: dict[str, int] = {}
-        self.history_lock = threading.Lock()
         self.save_lock = threading.Lock()
         self.pair_dict_lock = threading.Lock()
         self.metric_tracker_lock = threading.Lock()
@@ -174,38 +179,48 @@ class FreqaiDataDrawer:
         Locate and load a previously saved historic predictions.
         :return: bool - whether or not the drawer was located
         """
-        exists = self.historic_predictions_path.is_file()
-        if exists:
-            try:
-                with self.historic_predictions_path.open("rb") as fp:
-                    self.historic_predictions = cloudpickle.load(fp)
-                logger.info(
-                    f"Found existing historic predictions at {self.full_path}, but beware "
-                    "that statistics may be inaccurate if the bot has been offline for "
-                    "an extended period of time."
-                )
-            except EOFError:
-                logger.warning(
-                    "Historical prediction file was corrupted. Trying to load backup file."
-                )
-                with self.historic_predictions_bkp_path.open("rb") as fp:
-                    self.historic_predictions = cloudpickle.load(fp)
-                logger.warning("FreqAI successfully loaded the backup historical predictions file.")
+        exists = self.historic_predictions.load()
+        if not exists and self.historic_predictions_path.is_file():
+            self.convert_legacy_historic_predictions()
+            exists = True
 
+        if exists:
+            logger.info(
+                f"Found existing historic predictions at {self.full_path}, but beware "
+                "that statistics may be inaccurate if the bot has been offline for "
+                "an extended period of time."
+            )
         else:
             logger.info("Could not find existing historic_predictions, starting from scratch")
 
         return exists
 
+    def convert_legacy_historic_predictions(self):
+        """
+        Convert historic predictions saved as one pickle file (historic_predictions.pkl)
+        to one file per pair. The old files are kept, but no longer updated.
+        """
+        try:
+            with self.historic_predictions_path.open("rb") as fp:
+                historic_predictions = cloudpickle.load(fp)
+        except EOFError:
+            logger.warning("Historical prediction file was corrupted. Trying to load backup file.")
+            with self.historic_predictions_bkp_path.open("rb") as fp:
+                historic_predictions = cloudpickle.load(fp)
+            logger.warning("FreqAI successfully loaded the backup historical predictions file.")
+
+        for pair, df in historic_predictions.items():
+            self.historic_predictions[pair] = df
+        self.historic_predictions.save()
+        logger.info(
+            f"Converted {self.historic_predictions_path.name} to {self.historic_predictions.path}."
+        )
+
     def save_historic_predictions_to_disk(self):
         """
-        Save historic predictions pickle to disk
+        Save the historic predictions added since the last save to disk
         """
-        with self.historic_predictions_path.open("wb") as fp:
-            cloudpickle.dump(self.historic_predictions, fp, protocol=cloudpickle.DEFAULT_PROTOCOL)
-
-        # create a backup
-        shutil.copy(self.historic_predictions_path, self.historic_predictions_bkp_path)
+        self.historic_predictions.save()
 
     def save_metric_tracker_to_disk(self):
         """
@@ -347,55 +362,32 @@ class FreqaiDataDrawer:
         """
 
         len_df = len(strat_df)
-        index = self.historic_predictions[pair].index[-1:]
-        columns = self.historic_predictions[pair].columns
-
-        zeros_df = pd.DataFrame(np.zeros((1, len(columns))), index=index, columns=columns)
-        self.historic_predictions[pair] = pd.concat(
-            [self.historic_predictions[pair], zeros_df], ignore_index=True, axis=0
-        )
-        df = self.historic_predictions[pair]
+        dtypes = self.historic_predictions.dtypes(pair)
+        row: dict[str, Any] = {}
 
         # model outputs and associated statistics
         for label in predictions.columns:
-            label_loc = df.columns.get_loc(label)
-            pred_label_loc = predictions.columns.get_loc(label)
-            df.iloc[-1, label_loc] = predictions.iloc[-1, pred_label_loc]
-            if df[label].dtype == object:
+            row[label] = predictions[label].iloc[-1]
+            if dtypes[label] == object:
                 continue
-            label_mean_loc = df.columns.get_loc(f"{label}_mean")
-            label_std_loc = df.columns.get_loc(f"{label}_std")
-            df.iloc[-1, label_mean_loc] = dk.data["labels_mean"][label]
-            df.iloc[-1, label_std_loc] = dk.data["labels_std"][label]
+            row[f"{label}_mean"] = dk.data["labels_mean"][label]
+            row[f"{label}_std"] = dk.data["labels_std"][label]
 
         # outlier indicators
-        do_predict_loc = df.columns.get_loc("do_predict")
-        df.iloc[-1, do_predict_loc] = do_preds[-1]
+        row["do_predict"] = do_preds[-1]
         if self.freqai_info["feature_parameters"].get("DI_threshold", 0) > 0:
-            DI_values_loc = df.columns.get_loc("DI_values")
-            df.iloc[-1, DI_values_loc] = dk.DI_values[-1]
+            row["DI_values"] = dk.DI_values[-1]
 
         # extra values the user added within custom prediction model
-        if dk.data["extra_returns_per_train"]:
-            rets = dk.data["extra_returns_per_train"]
-            for return_str in rets:
-                return_loc = df.columns.get_loc(return_str)
-                df.iloc[-1, return_loc] = rets[return_str]
-
-        high_price_loc = df.columns.get_loc("high_price")
-        high_loc = strat_df.columns.get_loc("high")
-        df.iloc[-1, high_price_loc] = strat_df.iloc[-1, high_loc]
-        low_price_loc = df.columns.get_loc("low_price")
-        low_loc = strat_df.columns.get_loc("low")
-        df.iloc[-1, low_price_loc] = strat_df.iloc[-1, low_loc]
-        close_price_loc = df.columns.get_loc("close_price")
-        close_loc = strat_df.columns.get_loc("close")
-        df.iloc[-1, close_price_loc] = strat_df.iloc[-1, close_loc]
-        date_pred_loc = df.columns.get_loc("date_pred")
-        date_loc = strat_df.columns.get_loc("date")
-        df.iloc[-1, date_pred_loc] = strat_df.iloc[-1, date_loc]
-
-        self.model_return_values[pair] = df.tail(len_df).reset_index(drop=True)
+        row.update(dk.data["extra_returns_per_train"])
+
+        row["high_price"] = strat_df["high"].iloc[-1]
+        row["low_price"] = strat_df["low"].iloc[-1]
+        row["close_price"] = strat_df["close"].iloc[-1]
+        row["date_pred"] = strat_df["date"].iloc[-1]
+
+        self.historic_predictions.append(pair, row)
+        self.model_return_values[pair] = self.historic_predictions.tail(pair, len_df)
 
     def attach_return_values_to_return_dataframe(
         self, pair: str, dataframe: DataFrame
@@ -637,50 +629,14 @@ class FreqaiDataDrawer:
         :param dataframe: DataFrame = strategy provided dataframe
         """
         feat_params = self.freqai_info["feature_parameters"]
-        with self.history_lock:
-            history_data = self.historic_data
-
-            for pair in dk.all_pairs:
-                for tf in feat_params.get("include_timeframes"):
-                    hist_df = history_data[pair][tf]
-                    # check if newest candle is already appended
-                    df_dp = strategy.dp.get_pair_dataframe(pair, tf)
-                    if len(df_dp.index) == 0:
-                        continue
-                    if str(hist_df.iloc[-1]["date"]) == str(df_dp.iloc[-1:]["date"].iloc[-1]):
-                        continue
-
-                    try:
-                        index = df_dp.loc[df_dp["date"] == hist_df.iloc[-1]["date"]].index[0] + 1
-                    except IndexError:
-                        if hist_df.iloc[-1]["date"] < df_dp["date"].iloc[0]:
-                            raise OperationalException(
-                                "In memory historical data is older than "
-                                f"oldest DataProvider candle for {pair} on "
-                                f"timeframe {tf}"
-                            )
-                        else:
-                            index = -1
-                            logger.warning(
-                                f"No common dates in historical data and dataprovider for {pair}. "
-                                f"Appending latest dataprovider candle to historical data "
-                                "but please be aware that there is likely a gap in the historical "
-                                "data. \n"
-                                f"Historical data ends at {hist_df.iloc[-1]['date']} "
-                                f"while dataprovider starts at {df_dp['date'].iloc[0]} and"
-                                f"ends at {df_dp['date'].iloc[0]}."
-                            )
-
-                    history_data[pair][tf] = pd.concat(
-                        [
-                            hist_df,
-                            df_dp.iloc[index:],
-                        ],
-                        ignore_index=True,
-                        axis=0,
-                    )
+        for pair in dk.all_pairs:
+            for tf in feat_params.get("include_timeframes"):
+                df_dp = strategy.dp.get_pair_dataframe(pair, tf)
+                self.historic_data[pair][tf].append(df_dp, pair, tf)
 
-            self.current_candle = history_data[dk.pair][self.config["timeframe"]].iloc[-1]["date"]
+        last_date = self.historic_data[dk.pair][self.config["timeframe"]].last_date
+        if last_date is not None:
+            self.current_candle = last_date
 
     def load_all_pair_histories(self, timerange: TimeRange, dk: FreqaiDataKitchen) -> None:
         """
@@ -695,13 +651,15 @@ class FreqaiDataDrawer:
             if pair not in history_data:
                 history_data[pair] = {}
             for tf in self.freqai_info["feature_parameters"].get("include_timeframes"):
-                history_data[pair][tf] = load_pair_history(
-                    datadir=self.config["datadir"],
-                    timeframe=tf,
-                    pair=pair,
-                    timerange=timerange,
-                    data_format=self.config.get("dataformat_ohlcv", "feather"),
-                    candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+                history_data[pair][tf] = CandleHistory(
+                    load_pair_history(
+                        datadir=self.config["datadir"],
+                        timeframe=tf,
+                        pair=pair,
+                        timerange=timerange,
+                        data_format=self.config.get("dataformat_ohlcv", "feather"),
+                        candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+                    )
                 )
 
     def get_base_and_corr_dataframes(
@@ -714,25 +672,22 @@ class FreqaiDataDrawer:
                           for training according to user defined train_period_days
         :param metadata: dict = strategy furnished pair metadata
         """
-        with self.history_lock:
-            corr_dataframes: dict[Any, Any] = {}
-            base_dataframes: dict[Any, Any] = {}
-            historic_data = self.historic_data
-            pairs = self.freqai_info["feature_parameters"].get("include_corr_pairlist", [])
-
-            for tf in self.freqai_info["feature_parameters"].get("include_timeframes"):
-                base_dataframes[tf] = dk.slice_dataframe(
-                    timerange, historic_data[pair][tf]
-                ).reset_index(drop=True)
-                if pairs:
-                    for p in pairs:
-                        if pair in p:
-                            continue  # dont repeat anything from whitelist
-                        if p not in corr_dataframes:
-                            corr_dataframes[p] = {}
-                        corr_dataframes[p][tf] = dk.slice_dataframe(
-                            timerange, historic_data[p][tf]
-                        ).reset_index(drop=True)
+        corr_dataframes: dict[Any, Any] = {}
+        base_dataframes: dict[Any, Any] = {}
+        historic_data = self.historic_data
+        pairs = self.freqai_info["feature_parameters"].get("include_corr_pairlist", [])
+        # Live training uses all candles up to the latest one
+        stop = None if dk.live else timerange.stopdt
+
+        for tf in self.freqai_info["feature_parameters"].get("include_timeframes"):
+            base_dataframes[tf] = historic_data[pair][tf].slice(timerange.startdt, stop)
+            if pairs:
+                for p in pairs:
+                    if pair in p:
+                        continue  # dont repeat anything from whitelist
+                    if p not in corr_dataframes:
+                        corr_dataframes[p] = {}
+                    corr_dataframes[p][tf] = historic_data[p][tf].slice(timerange.startdt, stop)
 
         return corr_dataframes, base_dataframes
 
@@ -741,14 +696,12 @@ class FreqaiDataDrawer:
         Returns timerange information based on historic predictions file
         :return: timerange calculated from saved live data
         """
-        if not self.historic_predictions_path.is_file():
+        if not self.load_historic_predictions_from_disk():
             raise OperationalException(
                 "Historic predictions not found. Historic predictions data is required "
                 "to run backtest with the freqai-backtest-live-models option "
             )
 
-        self.load_historic_predictions_from_disk()
-
         all_pairs_end_dates = []
         for pair in self.historic_predictions:
             pair_historic_data = self.historic_predictions[pair]
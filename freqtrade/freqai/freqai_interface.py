@@ -1,8 +1,10 @@
+import copy
 import logging
 import threading
 import time
 from abc import ABC, abstractmethod
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal
@@ -114,6 +116,15 @@ class IFreqaiModel(ABC):
             self.ft_params.update({"principal_component_analysis": False})
             logger.warning("User tried to use PCA with continual learning. Deactivating PCA.")
         self.activate_tensorboard: bool = self.freqai_info.get("activate_tensorboard", True)
+        self.backtest_training_workers: int = self.freqai_info.get("backtest_training_workers", 1)
+        if self.backtest_training_workers > 1 and (
+            self.continual_learning or self.dd.model_type != "joblib"
+        ):
+            logger.warning(
+                "backtest_training_workers is only supported for joblib based models "
+                "without continual learning. Training backtesting windows sequentially."
+            )
+            self.backtest_training_workers = 1
 
         record_params(config, self.full_path)
 
@@ -289,116 +300,203 @@ class IFreqaiModel(ABC):
         pair = metadata["pair"]
         populate_indicators = True
         check_features = True
+        workers = self.backtest_training_workers
+        executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        # Windows which are not finished yet, in backtesting order
+        pending: deque[tuple[FreqaiDataKitchen, Future | None, DataFrame | None, int]] = deque()
         # Loop enforcing the sliding window training/backtesting paradigm
         # tr_train is the training time range e.g. 1 historical month
         # tr_backtest is the backtesting time range e.g. the week directly
         # following tr_train. Both of these windows slide through the
         # entire backtest
-        for tr_train, tr_backtest in zip(
-            dk.training_timeranges, dk.backtesting_timeranges, strict=False
-        ):
-            (_, _) = self.dd.get_pair_dict_info(pair)
-            train_it += 1
-            total_trains = len(dk.backtesting_timeranges)
-            self.training_timerange = tr_train
-            len_backtest_df = len(
-                dataframe.loc[
-                    (dataframe["date"] >= tr_backtest.startdt)
-                    & (dataframe["date"] < tr_backtest.stopdt),
-                    :,
-                ]
-            )
+        try:
+            for tr_train, tr_backtest in zip(
+                dk.training_timeranges, dk.backtesting_timeranges, strict=False
+            ):
+                (_, _) = self.dd.get_pair_dict_info(pair)
+                train_it += 1
+                total_trains = len(dk.backtesting_timeranges)
+                self.training_timerange = tr_train
+                len_backtest_df = len(
+                    dataframe.loc[
+                        (dataframe["date"] >= tr_backtest.startdt)
+                        & (dataframe["date"] < tr_backtest.stopdt),
+                        :,
+                    ]
+                )
 
-            if not self.ensure_data_exists(len_backtest_df, tr_backtest, pair):
-                continue
+                if not self.ensure_data_exists(len_backtest_df, tr_backtest, pair):
+                    continue
+
+                self.log_backtesting_progress(tr_train, pair, train_it, total_trains)
 
-            self.log_backtesting_progress(tr_train, pair, train_it, total_trains)
+                timestamp_model_id = int(tr_train.stopts)
+                if dk.backtest_live_models:
+                    timestamp_model_id = int(tr_backtest.startts)
 
-            timestamp_model_id = int(tr_train.stopts)
-            if dk.backtest_live_models:
-                timestamp_model_id = int(tr_backtest.startts)
+                # Windows trained in the background need their own datakitchen
+                window_dk = self._copy_datakitchen(dk) if executor else dk
+                window_dk.set_paths(pair, timestamp_model_id)
 
-            dk.set_paths(pair, timestamp_model_id)
+                window_dk.set_new_model_names(pair, timestamp_model_id)
 
-            dk.set_new_model_names(pair, timestamp_model_id)
+                if window_dk.check_if_backtest_prediction_is_valid(len_backtest_df):
+                    if check_features:
+                        self.dd.load_metadata(window_dk)
+                        df_fts = self.dk.use_strategy_to_populate_indicators(
+                            strategy, prediction_dataframe=dataframe.tail(1), pair=pair
+                        )
+                        df_fts = window_dk.remove_special_chars_from_feature_names(df_fts)
+                        window_dk.find_features(df_fts)
+                        self.check_if_feature_list_matches_strategy(window_dk)
+                        check_features = False
+                    pending.append((window_dk, None, None, 0))
+                else:
+                    if populate_indicators:
+                        dataframe = self.dk.use_strategy_to_populate_indicators(
+                            strategy, prediction_dataframe=dataframe, pair=pair
+                        )
+                        populate_indicators = False
 
-            if dk.check_if_backtest_prediction_is_valid(len_backtest_df):
-                if check_features:
-                    self.dd.load_metadata(dk)
-                    df_fts = self.dk.use_strategy_to_populate_indicators(
-                        strategy, prediction_dataframe=dataframe.tail(1), pair=pair
+                    dataframe_base_train = dataframe.loc[dataframe["date"] < tr_train.stopdt, :]
+                    dataframe_base_train = strategy.set_freqai_targets(
+                        dataframe_base_train, metadata=metadata
                     )
-                    df_fts = dk.remove_special_chars_from_feature_names(df_fts)
-                    dk.find_features(df_fts)
-                    self.check_if_feature_list_matches_strategy(dk)
-                    check_features = False
-                append_df = dk.get_backtesting_prediction()
-                dk.append_predictions(append_df)
-            else:
-                if populate_indicators:
-                    dataframe = self.dk.use_strategy_to_populate_indicators(
-                        strategy, prediction_dataframe=dataframe, pair=pair
+                    dataframe_base_backtest = dataframe.loc[
+                        dataframe["date"] < tr_backtest.stopdt, :
+                    ]
+                    dataframe_base_backtest = strategy.set_freqai_targets(
+                        dataframe_base_backtest, metadata=metadata
                     )
-                    populate_indicators = False
-
-                dataframe_base_train = dataframe.loc[dataframe["date"] < tr_train.stopdt, :]
-                dataframe_base_train = strategy.set_freqai_targets(
-                    dataframe_base_train, metadata=metadata
-                )
-                dataframe_base_backtest = dataframe.loc[dataframe["date"] < tr_backtest.stopdt, :]
-                dataframe_base_backtest = strategy.set_freqai_targets(
-                    dataframe_base_backtest, metadata=metadata
-                )
 
-                tr_train = dk.buffer_timerange(tr_train)
+                    tr_train = window_dk.buffer_timerange(tr_train)
 
-                dataframe_train = dk.slice_dataframe(tr_train, dataframe_base_train)
-                dataframe_backtest = dk.slice_dataframe(tr_backtest, dataframe_base_backtest)
+                    dataframe_train = window_dk.slice_dataframe(tr_train, dataframe_base_train)
+                    dataframe_backtest = window_dk.slice_dataframe(
+                        tr_backtest, dataframe_base_backtest
+                    )
 
-                dataframe_train = dk.remove_special_chars_from_feature_names(dataframe_train)
-                dataframe_backtest = dk.remove_special_chars_from_feature_names(dataframe_backtest)
-                dk.get_unique_classes_from_labels(dataframe_train)
+                    dataframe_train = window_dk.remove_special_chars_from_feature_names(
+                        dataframe_train
+                    )
+                    dataframe_backtest = window_dk.remove_special_chars_from_feature_names(
+                        dataframe_backtest
+                    )
+                    window_dk.get_unique_classes_from_labels(dataframe_train)
+
+                    training: Future | None = None
+                    if not self.model_exists(window_dk):
+                        if executor:
+                            training = executor.submit(
+                                self.train_backtest_window, dataframe_train, pair, window_dk
+                            )
+                        else:
+                            training = Future()
+                            training.set_result(
+                                self.train_backtest_window(dataframe_train, pair, window_dk)
+                            )
+                    pending.append(
+                        (window_dk, training, dataframe_backtest, int(tr_train.stopts))
+                    )
 
-                if not self.model_exists(dk):
-                    dk.find_features(dataframe_train)
-                    dk.find_labels(dataframe_train)
+                # Keep at most one window per worker in flight
+                while len(pending) > (workers - 1 if executor else 0):
+                    self._finish_backtest_window(dk, pair, *pending.popleft())
 
-                    try:
-                        self.tb_logger = get_tb_logger(
-                            self.dd.model_type, dk.data_path, self.activate_tensorboard
-                        )
-                        self.model = self.train(dataframe_train, pair, dk)
-                        self.tb_logger.close()
-                    except Exception as msg:
-                        logger.warning(
-                            f"Training {pair} raised exception {msg.__class__.__name__}. "
-                            f"Message: {msg}, skipping.",
-                            exc_info=True,
-                        )
-                        self.model = None
-
-                    self.dd.pair_dict[pair]["trained_timestamp"] = int(tr_train.stopts)
-                    if self.plot_features and self.model is not None:
-                        plot_feature_importance(self.model, pair, dk, self.plot_features)
-                    if self.save_backtest_models and self.model is not None:
-                        logger.info("Saving backtest model to disk.")
-                        self.dd.save_data(self.model, pair, dk)
-                    else:
-                        logger.info("Saving metadata to disk.")
-                        self.dd.save_metadata(dk)
-                else:
-                    self.model = self.dd.load_data(pair, dk)
-
-                pred_df, do_preds = self.predict(dataframe_backtest, dk)
-                append_df = dk.get_predictions_to_append(pred_df, do_preds, dataframe_backtest)
-                dk.append_predictions(append_df)
-                dk.save_backtesting_prediction(append_df)
+            while pending:
+                self._finish_backtest_window(dk, pair, *pending.popleft())
+        finally:
+            if executor:
+                executor.shutdown(wait=True, cancel_futures=True)
 
         self.backtesting_fit_live_predictions(dk)
         dk.fill_predictions(dataframe)
 
         return dk
 
+    def train_backtest_window(
+        self, dataframe_train: DataFrame, pair: str, dk: FreqaiDataKitchen
+    ) -> Any:
+        """
+        Train the model of one backtesting window.
+        Runs in a worker thread if "backtest_training_workers" is set.
+        :param dataframe_train: DataFrame = training data of this window
+        :param pair: str = current pair
+        :param dk: FreqaiDataKitchen = datakitchen of this window
+        :return: Trained model - or None if training failed
+        """
+        dk.find_features(dataframe_train)
+        dk.find_labels(dataframe_train)
+
+        try:
+            tb_logger = get_tb_logger(self.dd.model_type, dk.data_path, self.activate_tensorboard)
+            self.tb_logger = tb_logger
+            model = self.train(dataframe_train, pair, dk)
+            tb_logger.close()
+        except Exception as msg:
+            logger.warning(
+                f"Training {pair} raised exception {msg.__class__.__name__}. "
+                f"Message: {msg}, skipping.",
+                exc_info=True,
+            )
+            model = None
+        return model
+
+    def _finish_backtest_window(
+        self,
+        dk: FreqaiDataKitchen,
+        pair: str,
+        window_dk: FreqaiDataKitchen,
+        training: Future | None,
+        dataframe_backtest: DataFrame | None,
+        trained_timestamp: int,
+    ) -> None:
+        """
+        Predict one backtesting window and append the predictions.
+        Windows are finished in backtesting order - so the results don't depend on
+        the number of training workers.
+        :param training: Future returning the trained model, None if an existing model
+            is loaded from disk
+        :param dataframe_backtest: DataFrame to predict on - None if existing predictions
+            are used
+        """
+        if dataframe_backtest is None:
+            dk.append_predictions(window_dk.get_backtesting_prediction())
+        else:
+            if training is not None:
+                self.model = training.result()
+                self.dd.pair_dict[pair]["trained_timestamp"] = trained_timestamp
+                if self.plot_features and self.model is not None:
+                    plot_feature_importance(self.model, pair, window_dk, self.plot_features)
+                if self.save_backtest_models and self.model is not None:
+                    logger.info("Saving backtest model to disk.")
+                    self.dd.save_data(self.model, pair, window_dk)
+                else:
+                    logger.info("Saving metadata to disk.")
+                    self.dd.save_metadata(window_dk)
+            else:
+                self.model = self.dd.load_data(pair, window_dk)
+
+            pred_df, do_preds = self.predict(dataframe_backtest, window_dk)
+            append_df = window_dk.get_predictions_to_append(pred_df, do_preds, dataframe_backtest)
+            dk.append_predictions(append_df)
+            window_dk.save_backtesting_prediction(append_df)
+
+        if window_dk is not dk:
+            # Leave the datakitchen in the state of the last finished window
+            vars(dk).update({k: v for k, v in vars(window_dk).items() if k != "full_df"})
+
+    @staticmethod
+    def _copy_datakitchen(dk: FreqaiDataKitchen) -> FreqaiDataKitchen:
+        """
+        Copy of the datakitchen for training one backtesting window in the background.
+        """
+        window_dk = copy.copy(dk)
+        window_dk.data = dk.data.copy()
+        window_dk.data_dictionary = {}
+        window_dk.unique_classes = {}
+        return window_dk
+
     def start_live(
         self, dataframe: DataFrame, metadata: dict, strategy: IStrategy, dk: FreqaiDataKitchen
     ) -> FreqaiDataKitchen:
@@ -666,8 +764,7 @@ class IFreqaiModel(ABC):
         :param strat_df: DataFrame = dataframe coming from strategy
         """
 
-        self.dd.historic_predictions[pair] = pred_df
-        hist_preds_df = self.dd.historic_predictions[pair]
+        hist_preds_df = pred_df
 
         self.set_start_dry_live_date(strat_df)
 
@@ -690,6 +787,8 @@ class IFreqaiModel(ABC):
         hist_preds_df["close_price"] = strat_df["close"]
         hist_preds_df["date_pred"] = strat_df["date"]
 
+        self.dd.historic_predictions[pair] = hist_preds_df
+
     def fit_live_predictions(self, dk: FreqaiDataKitchen, pair: str) -> None:
         """
         Fit the labels with a gaussian distribution
@@ -701,10 +800,11 @@ class IFreqaiModel(ABC):
 
         num_candles = self.freqai_info.get("fit_live_predictions_candles", 100)
         dk.data["labels_mean"], dk.data["labels_std"] = {}, {}
+        hist_preds = self.dd.historic_predictions.tail(dk.pair, num_candles)
         for label in full_labels:
-            if self.dd.historic_predictions[dk.pair][label].dtype == object:
+            if hist_preds[label].dtype == object:
                 continue
-            f = spy.stats.norm.fit(self.dd.historic_predictions[dk.pair][label].tail(num_candles))
+            f = spy.stats.norm.fit(hist_preds[label])
             dk.data["labels_mean"][label], dk.data["labels_std"][label] = f[0], f[1]
 
         return
@@ -0,0 +1,295 @@
+"""
+Storage of the historic (live) predictions made by FreqAI.
+"""
+
+import logging
+import threading
+from collections.abc import Iterator, MutableMapping
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from joblib.externals import cloudpickle
+from pandas import DataFrame, DatetimeTZDtype
+
+from freqtrade.misc import pair_to_filename
+
+
+logger = logging.getLogger(__name__)
+
+# Smallest number of rows allocated per pair
+MIN_CAPACITY = 1024
+# Pair files are rewritten in one piece once they consist of this many segments
+MAX_SEGMENTS = 500
+
+
+def _column_to_numpy(series: pd.Series) -> tuple[np.ndarray, Any]:
+    """
+    Convert a column to the array stored in the buffer.
+    :return: Tuple of (array, dtype of the column when converted back to a dataframe)
+    """
+    dtype = series.dtype
+    if isinstance(dtype, DatetimeTZDtype):
+        return series.dt.tz_convert(None).to_numpy(), dtype
+    if dtype.kind in "biu":
+        # New rows start out as zeros (floats) - the same as float columns.
+        return series.to_numpy(dtype=np.float64, na_value=np.nan), np.dtype(np.float64)
+    values = series.to_numpy()
+    return values, values.dtype
+
+
+def _column_from_numpy(values: np.ndarray, dtype: Any) -> Any:
+    if isinstance(dtype, DatetimeTZDtype):
+        return pd.DatetimeIndex(values).tz_localize("UTC").tz_convert(dtype.tz)
+    return values
+
+
+def _storage_value(array: np.ndarray, value: Any) -> Any:
+    if array.dtype.kind == "M":
+        if value is None:
+            return np.datetime64("NaT")
+        timestamp = pd.Timestamp(value)
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.tz_convert(None)
+        return timestamp.to_datetime64()
+    return 0 if value is None else value
+
+
+class PredictionBuffer:
+    """
+    Historic predictions of one pair, stored column-wise in preallocated arrays.
+    Arrays are only grown - or compacted, if the number of rows is limited - once they are full,
+    so appending a candle is amortized O(1) instead of copying the whole history.
+    """
+
+    def __init__(self, df: DataFrame, max_rows: int = 0) -> None:
+        self.max_rows = max_rows
+        keep = len(df) if not max_rows else min(len(df), max_rows)
+        df = df.iloc[len(df) - keep :]
+        # No spare capacity yet - dataframes are often replaced without ever being appended to.
+        capacity = keep
+        self.columns: list[str] = list(df.columns)
+        self.dtypes: dict[str, Any] = {}
+        self._arrays: dict[str, np.ndarray] = {}
+        for column in self.columns:
+            values, dtype = _column_to_numpy(df[column])
+            array = np.empty(capacity, dtype=values.dtype)
+            array[:keep] = values
+            self._arrays[column] = array
+            self.dtypes[column] = dtype
+        self._start = 0
+        self._stop = keep
+        # Number of rows appended since the buffer was last written to disk
+        self.unsaved = keep
+        # Dataframe of the current buffer content, created on first access
+        self._frame: DataFrame | None = None
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def append(self, row: dict[str, Any]) -> None:
+        """
+        Append one row. Columns missing in row are set to 0 (NaT for dates).
+        :param row: Dict of column -> value
+        """
+        unknown = row.keys() - self._arrays.keys()
+        if unknown:
+            raise KeyError(f"Unknown historic prediction columns: {sorted(unknown)}")
+        self._reserve(1)
+        for column, array in self._arrays.items():
+            array[self._stop] = _storage_value(array, row.get(column))
+        self._stop += 1
+        if self.max_rows:
+            self._start = max(self._start, self._stop - self.max_rows)
+        self.unsaved += 1
+        self._frame = None
+
+    def frame(self) -> DataFrame:
+        """
+        Dataframe of all rows. Shared between callers until the next append - don't modify it.
+        """
+        if self._frame is None:
+            self._frame = self._to_dataframe(self._start, self._stop)
+        return self._frame
+
+    def tail(self, count: int) -> DataFrame:
+        """
+        Dataframe of the last count rows (with a fresh index).
+        """
+        return self._to_dataframe(max(self._start, self._stop - count), self._stop)
+
+    def pop_unsaved(self, all_rows: bool = False) -> DataFrame:
+        """
+        Dataframe of the rows appended since the last call - and mark them as saved.
+        :param all_rows: Return all rows instead
+        """
+        count = len(self) if all_rows else min(self.unsaved, len(self))
+        self.unsaved = 0
+        return self._to_dataframe(self._stop - count, self._stop)
+
+    def _reserve(self, count: int) -> None:
+        """
+        Make sure count rows can be appended, compacting or growing the arrays if necessary.
+        """
+        capacity = len(self._arrays[self.columns[0]]) if self.columns else 0
+        if self._stop + count <= capacity:
+            return
+        keep = len(self)
+        capacity = max(2 * (keep + count), MIN_CAPACITY)
+        for column, array in self._arrays.items():
+            new_array = np.empty(capacity, dtype=array.dtype)
+            new_array[:keep] = array[self._start : self._stop]
+            self._arrays[column] = new_array
+        self._start, self._stop = 0, keep
+
+    def _to_dataframe(self, start: int, stop: int) -> DataFrame:
+        # Copy - the arrays are modified in place by later appends.
+        return DataFrame(
+            {
+                column: _column_from_numpy(self._arrays[column][start:stop].copy(), dtype)
+                for column, dtype in self.dtypes.items()
+            },
+            columns=self.columns,
+        )
+
+
+class HistoricPredictions(MutableMapping[str, DataFrame]):
+    """
+    Historic predictions of all pairs, readable (and replaceable) as one dataframe per pair.
+    In live operation, use append() and tail() - which don't touch the full history.
+
+    On disk, every pair has one file holding a sequence of pickled (pair, dataframe) segments.
+    Saving only appends the rows added since the last save. Pair files are rewritten once they
+    were replaced in memory or consist of MAX_SEGMENTS segments.
+    """
+
+    def __init__(self, path: Path, max_rows: int = 0) -> None:
+        """
+        :param path: Directory holding the pair files
+        :param max_rows: Number of rows kept per pair, 0 to keep all rows
+        """
+        self.path = path
+        self.max_rows = max_rows
+        self._buffers: dict[str, PredictionBuffer] = {}
+        # Number of segments in the file of each pair - pairs missing here are rewritten
+        self._segments: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, pair: str) -> DataFrame:
+        with self._lock:
+            return self._buffers[pair].frame()
+
+    def __setitem__(self, pair: str, df: DataFrame) -> None:
+        with self._lock:
+            self._buffers[pair] = PredictionBuffer(df, self.max_rows)
+            self._segments.pop(pair, None)
+
+    def __delitem__(self, pair: str) -> None:
+        with self._lock:
+            del self._buffers[pair]
+
+    def __contains__(self, pair: object) -> bool:
+        return pair in self._buffers
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._buffers))
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def dtypes(self, pair: str) -> dict[str, Any]:
+        return self._buffers[pair].dtypes
+
+    def append(self, pair: str, row: dict[str, Any]) -> None:
+        """
+        Append the predictions of one candle.
+        :param pair: Pair the predictions are for
+        :param row: Dict of column -> value. Missing columns are set to 0 (NaT for dates).
+        """
+        with self._lock:
+            self._buffers[pair].append(row)
+
+    def tail(self, pair: str, count: int) -> DataFrame:
+        """
+        Last count rows of the historic predictions of pair (with a fresh index).
+        """
+        with self._lock:
+            return self._buffers[pair].tail(count)
+
+    def _pair_path(self, pair: str) -> Path:
+        return self.path / f"{pair_to_filename(pair)}.pkl"
+
+    def save(self) -> None:
+        """
+        Write all rows which were added since the last save to disk.
+        """
+        with self._lock:
+            self.path.mkdir(parents=True, exist_ok=True)
+            for pair in [pair for pair in self._segments if pair not in self._buffers]:
+                self._pair_path(pair).unlink(missing_ok=True)
+                del self._segments[pair]
+
+            for pair, buffer in self._buffers.items():
+                file = self._pair_path(pair)
+                segments = self._segments.get(pair)
+                if segments is None or segments >= MAX_SEGMENTS:
+                    tmp_file = file.with_suffix(".tmp")
+                    with tmp_file.open("wb") as fp:
+                        cloudpickle.dump(
+                            (pair, buffer.pop_unsaved(all_rows=True)),
+                            fp,
+                            protocol=cloudpickle.DEFAULT_PROTOCOL,
+                        )
+                    tmp_file.replace(file)
+                    self._segments[pair] = 1
+                elif buffer.unsaved:
+                    with file.open("ab") as fp:
+                        cloudpickle.dump(
+                            (pair, buffer.pop_unsaved()), fp, protocol=cloudpickle.DEFAULT_PROTOCOL
+                        )
+                    self._segments[pair] = segments + 1
+
+    def load(self) -> bool:
+        """
+        Load the historic predictions of all pairs from disk.
+        :return: bool - whether or not historic predictions were found
+        """
+        with self._lock:
+            self._buffers = {}
+            self._segments = {}
+            if not self.path.is_dir():
+                return False
+            for file in sorted(self.path.glob("*.pkl")):
+                pair, segments = self._load_pair_file(file)
+                if pair is not None:
+                    self._buffers[pair].unsaved = 0
+                    self._segments[pair] = len(segments)
+            return len(self._buffers) > 0
+
+    def _load_pair_file(self, file: Path) -> tuple[str | None, list[DataFrame]]:
+        """
+        Read all segments of one pair file.
+        An incomplete last segment (e.g. the bot was killed while saving) is removed.
+        """
+        pair = None
+        segments: list[DataFrame] = []
+        size = file.stat().st_size
+        with file.open("rb+") as fp:
+            while (offset := fp.tell()) < size:
+                try:
+                    pair, segment = cloudpickle.load(fp)
+                except Exception as e:
+                    logger.warning(
+                        f"Historic predictions file {file.name} is corrupted ({e}). "
+                        f"Dropping everything after segment {len(segments)}."
+                    )
+                    fp.truncate(offset)
+                    break
+                segments.append(segment)
+        if pair is None or not segments:
+            return None, segments
+        self._buffers[pair] = PredictionBuffer(
+            pd.concat(segments, ignore_index=True), self.max_rows
+        )
+        return pair, segments
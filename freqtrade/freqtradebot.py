@@ -265,6 +265,7 @@ class FreqtradeBot(LoggingMixin):
         self.dataprovider.refresh(
             self.pairlists.create_pair_list(self.active_pair_whitelist),
             self.strategy.gather_informative_pairs(),
+            priority_pairs=[trade.pair for trade in trades],
         )
 
         strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
@@ -274,27 +275,35 @@ class FreqtradeBot(LoggingMixin):
         with self._measure_execution:
             self.strategy.analyze(self.active_pair_whitelist)
 
-        with self._exit_lock:
-            # Check for exchange cancellations, timeouts and user requested replace
-            self.manage_open_orders()
-
-        # Protect from collisions with force_exit.
-        # Without this, freqtrade may try to recreate stoploss_on_exchange orders
-        # while exiting is in process, since telegram messages arrive in an different thread.
-        with self._exit_lock:
-            trades = Trade.get_open_trades()
-            # First process current opened trades (positions)
-            self.exit_positions(trades)
-            Trade.commit()
+        # Fetch prices for all pairs at once, instead of one request per trade / pair.
+        self.exchange.prefetch_rates(
+            {trade.pair: trade.is_short for trade in trades}, self.active_pair_whitelist
+        )
+        try:
+            with self._exit_lock:
+                # Check for exchange cancellations, timeouts and user requested replace
+                self.manage_open_orders()
 
-        # Check if we need to adjust our current positions before attempting to enter new trades.
-        if self.strategy.position_adjustment_enable:
+            # Protect from collisions with force_exit.
+            # Without this, freqtrade may try to recreate stoploss_on_exchange orders
+            # while exiting is in process, since telegram messages arrive in an different thread.
             with self._exit_lock:
-                self.process_open_trade_positions()
+                trades = Trade.get_open_trades()
+                # First process current opened trades (positions)
+                self.exit_positions(trades)
+                Trade.commit()
+
+            # Check if we need to adjust our current positions before attempting to enter
+            # new trades.
+            if self.strategy.position_adjustment_enable:
+                with self._exit_lock:
+                    self.process_open_trade_positions()
 
-        # Then looking for entry opportunities
-        if self.state == State.RUNNING and self.get_free_open_trades():
-            self.enter_positions()
+            # Then looking for entry opportunities
+            if self.state == State.RUNNING and self.get_free_open_trades():
+                self.enter_positions()
+        finally:
+            self.exchange.clear_prefetched_rates()
         self._schedule.run_pending()
         Trade.commit()
         self.rpc.process_msg_queue(self.dataprovider._msg_queue)
@@ -0,0 +1,304 @@
+"""
+Columnar (NumPy backed) storage of analyzed backtest data.
+Used by the "columnar" backtest engine instead of the list-of-lists representation,
+and for spreading main candles into detail timeframe candles.
+"""
+
+from datetime import datetime
+
+import numpy as np
+from pandas import DataFrame, Timestamp, factorize
+
+from freqtrade.constants import LongShort
+from freqtrade.util import dt_ts
+
+
+# Column order follows backtesting.HEADERS
+_OHLC_COLUMNS = ["open", "high", "low", "close"]
+_SIGNAL_COLUMNS = ["enter_long", "exit_long", "enter_short", "exit_short"]
+
+_DIR_NONE = 0
+_DIR_LONG = 1
+_DIR_SHORT = -1
+
+# Tolerance for the (fee-less) ROI pre-check, to not miss exits due to rounding.
+_ROI_TOLERANCE = 1e-6
+# Number of candles scanned at once when searching for the next exit candidate.
+_SCAN_WINDOW = 64
+
+
+def _intern_tags(column) -> tuple[np.ndarray, list[str]]:
+    """
+    Convert a tag column to integer ids and a lookup table.
+    Missing tags (None / NaN) are represented by -1.
+    """
+    codes, uniques = factorize(column, use_na_sentinel=True)
+    return codes.astype(np.int32), list(uniques)
+
+
+class ColumnarPairData:
+    """
+    Analyzed (and signal-shifted) candles of one pair, stored as contiguous NumPy arrays.
+    Rows are addressed by position - a row tuple (in HEADERS order) is only built on access.
+    """
+
+    __slots__ = (
+        "dates",
+        "ohlc",
+        "signals",
+        "trade_dirs",
+        "entry_rows",
+        "enter_tag_ids",
+        "exit_tag_ids",
+        "enter_tags",
+        "exit_tags",
+    )
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        ohlc: np.ndarray,
+        signals: np.ndarray,
+        trade_dirs: np.ndarray,
+        enter_tag_ids: np.ndarray,
+        exit_tag_ids: np.ndarray,
+        enter_tags: list[str],
+        exit_tags: list[str],
+    ) -> None:
+        self.dates = dates
+        self.ohlc = ohlc
+        self.signals = signals
+        self.trade_dirs = trade_dirs
+        self.entry_rows = np.flatnonzero(trade_dirs)
+        self.enter_tag_ids = enter_tag_ids
+        self.exit_tag_ids = exit_tag_ids
+        self.enter_tags = enter_tags
+        self.exit_tags = exit_tags
+
+    @classmethod
+    def from_dataframe(cls, df: DataFrame, can_short: bool) -> "ColumnarPairData":
+        """
+        Build columnar data from an analyzed dataframe containing all HEADERS columns.
+        :param df: Dataframe with shifted entry / exit signals
+        :param can_short: Short signals are only considered if shorting is possible
+        """
+        dates = df["date"].values.astype("datetime64[ms]").view(np.int64)
+        ohlc = np.ascontiguousarray(df[_OHLC_COLUMNS].to_numpy(dtype=np.float64))
+        signals = np.ascontiguousarray(df[_SIGNAL_COLUMNS].fillna(0).to_numpy(dtype=np.int8))
+        enter_tag_ids, enter_tags = _intern_tags(df["enter_tag"])
+        exit_tag_ids, exit_tags = _intern_tags(df["exit_tag"])
+
+        # Mirrors Backtesting.check_for_trade_entry() for all candles at once.
+        enter_long = signals[:, 0] == 1
+        exit_long = signals[:, 1] == 1
+        enter_short = (signals[:, 2] == 1) & can_short
+        exit_short = (signals[:, 3] == 1) & can_short
+        trade_dirs = np.full(len(df), _DIR_NONE, dtype=np.int8)
+        trade_dirs[enter_long & ~exit_long & ~enter_short] = _DIR_LONG
+        trade_dirs[enter_short & ~exit_short & ~enter_long] = _DIR_SHORT
+
+        return cls(
+            dates=dates,
+            ohlc=ohlc,
+            signals=signals,
+            trade_dirs=trade_dirs,
+            enter_tag_ids=enter_tag_ids,
+            exit_tag_ids=exit_tag_ids,
+            enter_tags=enter_tags,
+            exit_tags=exit_tags,
+        )
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, idx: int) -> tuple:
+        """
+        Build the row tuple for the given position.
+        Supports negative indexes, raises IndexError like a list would.
+        """
+        length = len(self.dates)
+        if idx < 0:
+            idx += length
+        if not 0 <= idx < length:
+            raise IndexError("ColumnarPairData index out of range")
+        enter_tag_id = self.enter_tag_ids[idx]
+        exit_tag_id = self.exit_tag_ids[idx]
+        return (
+            Timestamp(int(self.dates[idx]), unit="ms", tz="UTC"),
+            *self.ohlc[idx].tolist(),
+            *self.signals[idx].tolist(),
+            self.enter_tags[enter_tag_id] if enter_tag_id >= 0 else None,
+            self.exit_tags[exit_tag_id] if exit_tag_id >= 0 else None,
+        )
+
+    def is_valid(self, idx: int, current_time: datetime) -> bool:
+        """
+        Equivalent of Backtesting.validate_row() without building the row.
+        :return: True if the row exists and is not after current_time.
+        """
+        return idx < len(self.dates) and self.dates[idx] <= dt_ts(current_time)
+
+    def trade_direction(self, idx: int) -> LongShort | None:
+        """
+        Precomputed result of Backtesting.check_for_trade_entry() for the given position.
+        """
+        direction = self.trade_dirs[idx]
+        if direction == _DIR_LONG:
+            return "long"
+        if direction == _DIR_SHORT:
+            return "short"
+        return None
+
+    def process_times(self, first_time: int, timeframe_ms: int) -> np.ndarray:
+        """
+        Times at which the backtest loop processes each row (see Backtesting.validate_row()).
+        A row is processed once the loop reached its date, and at most one row is processed
+        per candle - so rows can lag behind their date.
+        :param first_time: First loop time as epoch milliseconds
+        :param timeframe_ms: Length of the timeframe in milliseconds
+        :return: Processing time of every row, as epoch milliseconds
+        """
+        steps = np.arange(len(self.dates), dtype=np.int64) * timeframe_ms
+        # Earliest loop time at or after the row date
+        earliest = first_time + np.maximum(
+            -(-(self.dates - first_time) // timeframe_ms) * timeframe_ms, 0
+        )
+        return np.maximum.accumulate(earliest - steps) + steps
+
+    def next_entry_row(self, start: int) -> int:
+        """
+        :return: First row from start on with an entry signal, or len(self) if there is none.
+        """
+        pos = np.searchsorted(self.entry_rows, start)
+        return int(self.entry_rows[pos]) if pos < len(self.entry_rows) else len(self.dates)
+
+    def next_exit_candidate(
+        self,
+        start: int,
+        open_date: int,
+        open_rate: float,
+        stop_loss: float,
+        max_rate: float | None,
+        roi_table: tuple[np.ndarray, np.ndarray],
+        exit_signal: bool,
+    ) -> int:
+        """
+        Find the first row from start on where an open long trade may exit.
+        Conditions are necessary, not sufficient ones - returned rows must still be evaluated
+        by the regular backtest logic. All rows before the returned row can't cause an exit.
+        :param open_date: Trade open date as epoch milliseconds
+        :param stop_loss: Current stoploss of the trade
+        :param max_rate: Highest rate seen so far - rows with a higher high move a trailing
+            stoploss, so they're returned as well. None if the stoploss can't move.
+        :param roi_table: Sorted minimal_roi durations (minutes) and the matching roi values
+        :param exit_signal: Consider rows with an exit signal
+        :return: Row index, or len(self) if the trade can't exit until the end of the data.
+        """
+        roi_minutes, roi_values = roi_table
+        length = len(self.dates)
+        window = _SCAN_WINDOW
+        while start < length:
+            stop = min(start + window, length)
+            high = self.ohlc[start:stop, 1]
+            candidates = self.ohlc[start:stop, 2] <= stop_loss
+            if max_rate is not None:
+                candidates |= high > max_rate
+            if exit_signal:
+                candidates |= self.signals[start:stop, 1] == 1
+            if len(roi_minutes) > 0:
+                durations = (self.dates[start:stop] - open_date) // 60_000
+                roi_idx = np.searchsorted(roi_minutes, durations, side="right") - 1
+                # Fees only lower the profit - so the rate alone is enough for the pre-check.
+                roi_rate = open_rate * (1 + roi_values[np.maximum(roi_idx, 0)])
+                candidates |= (roi_idx >= 0) & (high >= roi_rate * (1 - _ROI_TOLERANCE))
+            found = np.flatnonzero(candidates)
+            if len(found) > 0:
+                return start + int(found[0])
+            start = stop
+            window *= 2
+        return length
+
+    def high_low(self, start: int, stop: int) -> tuple[float, float] | None:
+        """
+        :return: Highest high and lowest low of rows start to stop (exclusive), or None.
+        """
+        if stop <= start:
+            return None
+        return float(self.ohlc[start:stop, 1].max()), float(self.ohlc[start:stop, 2].min())
+
+
+class DetailCandleView:
+    """
+    Zero-copy view on the detail candles of one main candle.
+    Signal columns are taken from the main candle row when a detail row is accessed.
+    """
+
+    __slots__ = ("dates", "ohlc", "signal_values")
+
+    def __init__(self, dates: np.ndarray, ohlc: np.ndarray, signal_values: tuple) -> None:
+        self.dates = dates
+        self.ohlc = ohlc
+        self.signal_values = signal_values
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, idx: int) -> tuple:
+        return (
+            Timestamp(int(self.dates[idx]), unit="ms", tz="UTC"),
+            *self.ohlc[idx].tolist(),
+            *self.signal_values,
+        )
+
+
+class DetailPairData:
+    """
+    Detail timeframe candles of one pair, stored as sorted arrays.
+    Start / stop offsets are precomputed for every main candle, so spreading a main candle
+    into its detail candles is a dictionary lookup.
+    """
+
+    __slots__ = ("dates", "ohlc", "offsets")
+
+    def __init__(self, dates: np.ndarray, ohlc: np.ndarray) -> None:
+        self.dates = dates
+        self.ohlc = ohlc
+        self.offsets: dict[int, tuple[int, int]] = {}
+
+    @classmethod
+    def from_dataframe(cls, df: DataFrame) -> "DetailPairData":
+        if not df["date"].is_monotonic_increasing:
+            df = df.sort_values("date")
+        dates = df["date"].values.astype("datetime64[ms]").view(np.int64)
+        ohlc = np.ascontiguousarray(df[_OHLC_COLUMNS].to_numpy(dtype=np.float64))
+        return cls(dates, ohlc)
+
+    def build_offsets(self, main_dates: np.ndarray, timeframe_ms: int) -> None:
+        """
+        Precompute the detail candle range for each main candle.
+        :param main_dates: Sorted main candle dates, as epoch milliseconds
+        :param timeframe_ms: Length of the main timeframe in milliseconds
+        """
+        starts = np.searchsorted(self.dates, main_dates, side="left")
+        stops = np.searchsorted(self.dates, main_dates + timeframe_ms, side="left")
+        has_detail = stops > starts
+        self.offsets = dict(
+            zip(
+                main_dates[has_detail].tolist(),
+                zip(starts[has_detail].tolist(), stops[has_detail].tolist(), strict=True),
+                strict=True,
+            )
+        )
+
+    def get_candles(self, main_date: int, signal_values: tuple) -> DetailCandleView | None:
+        """
+        Get the detail candles belonging to the main candle starting at main_date.
+        :param main_date: Main candle date as epoch milliseconds
+        :param signal_values: Signal and tag values of the main candle (HEADERS[5:] order)
+        :return: DetailCandleView or None if no detail candles exist for this candle.
+        """
+        offset = self.offsets.get(main_date)
+        if offset is None:
+            return None
+        start, stop = offset
+        return DetailCandleView(self.dates[start:stop], self.ohlc[start:stop], signal_values)
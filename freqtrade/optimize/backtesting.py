@@ -5,11 +5,14 @@ This module contains the backtesting logic
 """
 
 import logging
+from bisect import bisect_right
 from collections import defaultdict
 from copy import deepcopy
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
+from heapq import heappop, heappush
 
-from numpy import isnan, nan
+import numpy as np
+from numpy import nan
 from pandas import DataFrame, Series
 
 from freqtrade import constants
@@ -49,6 +52,11 @@ from freqtrade.ft_types import (
 from freqtrade.leverage.liquidation_price import update_liquidation_prices
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.backtest_columnar import (
+    ColumnarPairData,
+    DetailCandleView,
+    DetailPairData,
+)
 from freqtrade.optimize.bt_progress import BTProgress
 from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
@@ -69,15 +77,33 @@ from freqtrade.persistence import (
 from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.plugins.protectionmanager import ProtectionManager
 from freqtrade.resolvers import ExchangeResolver, StrategyResolver
+from freqtrade.resolvers.strategy_resolver import check_override
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
-from freqtrade.util import FtPrecise, dt_now
+from freqtrade.util import FtPrecise, dt_now, dt_ts
 from freqtrade.util.migrations import migrate_data
 from freqtrade.wallets import Wallets
 
 
 logger = logging.getLogger(__name__)
 
+# Strategy callbacks which can be called for candles without signal.
+# Overriding any of them disables the signal-only backtest loop.
+SIGNAL_ONLY_INCOMPATIBLE_CALLBACKS = [
+    "bot_loop_start",
+    "custom_entry_price",
+    "custom_exit_price",
+    "custom_stake_amount",
+    "confirm_trade_entry",
+    "confirm_trade_exit",
+    "order_filled",
+    "adjust_order_price",
+    "adjust_entry_price",
+    "adjust_exit_price",
+    "check_entry_timeout",
+    "check_exit_timeout",
+]
+
 # Indexes for backtest tuples
 DATE_IDX = 0
 OPEN_IDX = 1
@@ -126,6 +152,8 @@ class Backtesting:
 
         self.config["dry_run"] = True
         self.price_pair_prec: dict[str, Series] = {}
+        # Precision changes per pair as (timestamps, precisions) - for fast lookups by date
+        self._price_pair_prec_lookup: dict[str, tuple[list[float], list[float]]] = {}
         self.run_ids: dict[str, str] = {}
         self.strategylist: list[IStrategy] = []
         self.all_bt_content: dict[str, BacktestContentType] = {}
@@ -212,6 +240,12 @@ class Backtesting:
         self._position_stacking: bool = self.config.get("position_stacking", False)
         self.enable_protections: bool = self.config.get("enable_protections", False)
         self.dynamic_pairlist: bool = self.config.get("enable_dynamic_pairlist", False)
+        self.backtest_engine: str = self.config.get(
+            "backtest_engine", constants.BACKTEST_ENGINE_DEFAULT
+        )
+        # Set by hyperopt if entry / exit signals don't change between backtest runs.
+        self.signal_only: bool = False
+        self._signal_only_cache: tuple[dict, dict] | None = None
         migrate_data(config, self.exchange)
 
         self.init_backtest()
@@ -270,6 +304,7 @@ class Backtesting:
         else:
             self.timeframe_detail_td = timedelta(seconds=0)
         self.detail_data: dict[str, DataFrame] = {}
+        self._detail_columns: dict[str, DetailPairData] = {}
         self.futures_data: dict[str, DataFrame] = {}
 
     def init_backtest(self):
@@ -306,7 +341,9 @@ class Backtesting:
         Loads backtest data and returns the data combined with the timerange
         as tuple.
         """
-        self.progress.init_step(BacktestState.DATALOAD, 1)
+        # One step per pair and loaded timeframe / candle type
+        loads = 1 + bool(self.timeframe_detail) + 2 * (self.trading_mode == TradingMode.FUTURES)
+        self.progress.init_step(BacktestState.DATALOAD, loads * len(self.pairlists.whitelist))
 
         data = history.load_data(
             datadir=self.config["datadir"],
@@ -317,6 +354,8 @@ class Backtesting:
             fail_without_data=True,
             data_format=self.config["dataformat_ohlcv"],
             candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+            workers=self.config.get("dataload_workers", 1),
+            progress=self.progress,
         )
 
         min_date, max_date = history.get_timerange(data)
@@ -332,13 +371,19 @@ class Backtesting:
             timeframe_to_seconds(self.timeframe), self.required_startup, min_date
         )
 
-        self.progress.set_new_value(1)
         self._load_bt_data_detail()
         self.price_pair_prec = {}
+        self._price_pair_prec_lookup = {}
         for pair in self.pairlists.whitelist:
             if pair in data:
                 # Load price precision logic
                 self.price_pair_prec[pair] = get_tick_size_over_time(data[pair])
+                # Missing values are skipped (like Series.asof())
+                precision = self.price_pair_prec[pair].dropna()
+                self._price_pair_prec_lookup[pair] = (
+                    [date.timestamp() for date in precision.index],
+                    precision.tolist(),
+                )
         return data, self.timerange
 
     def _load_bt_data_detail(self) -> None:
@@ -355,9 +400,12 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+                workers=self.config.get("dataload_workers", 1),
+                progress=self.progress,
             )
         else:
             self.detail_data = {}
+        self._detail_columns = {}
         if self.trading_mode == TradingMode.FUTURES:
             funding_fee_timeframe: str = self.exchange.get_option("funding_fee_timeframe")
             self.funding_fee_timeframe_secs: int = timeframe_to_seconds(funding_fee_timeframe)
@@ -373,6 +421,8 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=CandleType.FUNDING_RATE,
+                workers=self.config.get("dataload_workers", 1),
+                progress=self.progress,
             )
 
             # For simplicity, assign to CandleType.Mark (might contain index candles!)
@@ -385,6 +435,8 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price")),
+                workers=self.config.get("dataload_workers", 1),
+                progress=self.progress,
             )
             # Combine data to avoid combining the data per trade.
             unavailable_pairs = []
@@ -415,13 +467,14 @@ class Backtesting:
         :param current_time: Time to get precision for
         :return: tuple of price precision, precision_mode_price for the pair at that given time.
         """
-        precision_series = self.price_pair_prec.get(pair)
-        if precision_series is not None:
-            precision = precision_series.asof(current_time)
-
-            if not isnan(precision):
+        precision_lookup = self._price_pair_prec_lookup.get(pair)
+        if precision_lookup is not None:
+            dates, precisions = precision_lookup
+            # Last precision at or before current_time
+            idx = bisect_right(dates, current_time.timestamp()) - 1
+            if idx >= 0:
                 # Force tick size if we define the precision
-                return precision, TICK_SIZE
+                return precisions[idx], TICK_SIZE
         return self.exchange.get_precision_price(pair), self.precision_mode_price
 
     def disable_database_use(self):
@@ -508,9 +561,13 @@ class Backtesting:
 
             df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
 
-            # Convert from Pandas to list for performance reasons
-            # (Looping Pandas is slow.)
-            data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
+            if (self.backtest_engine == "columnar" or self.signal_only) and not df_analyzed.empty:
+                # Keep contiguous arrays - rows are only materialized when needed.
+                data[pair] = ColumnarPairData.from_dataframe(df_analyzed, self._can_short)
+            else:
+                # Convert from Pandas to list for performance reasons
+                # (Looping Pandas is slow.)
+                data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
         return data
 
     def _get_close_rate(
@@ -699,7 +756,7 @@ class Backtesting:
                     entry_tag1=order_tag,
                 )
                 if pos_trade is not None:
-                    self.wallets.update()
+                    self.wallets.update_trade(pos_trade)
                     return pos_trade
 
         if stake_amount is not None and stake_amount < 0.0:
@@ -795,7 +852,7 @@ class Backtesting:
                 trade.close(order.ft_price, show_msg=False)
 
                 LocalTrade.close_bt_trade(trade)
-            self.wallets.update()
+            self.wallets.update_trade(trade)
             self.run_protections(pair, current_time, trade.trade_direction)
 
     def _get_exit_for_signal(
@@ -1222,7 +1279,9 @@ class Backtesting:
         return trade
 
     def handle_left_open(
-        self, open_trades: dict[str, list[LocalTrade]], data: dict[str, list[tuple]]
+        self,
+        open_trades: dict[str, list[LocalTrade]],
+        data: dict[str, list[tuple] | ColumnarPairData],
     ) -> None:
         """
         Handling of left open trades at the end of backtesting
@@ -1472,7 +1531,7 @@ class Backtesting:
             if self.manage_open_orders(t, current_time, row):
                 # Remove trade (initial open order never filled)
                 LocalTrade.remove_bt_trade(t)
-                self.wallets.update()
+                self.wallets.update_trade(t)
 
         # 2. Process entries.
         # without positionstacking, we can only have one open trade per pair.
@@ -1488,7 +1547,7 @@ class Backtesting:
             if self.trade_slot_available(LocalTrade.bt_open_open_trade_count):
                 trade = self._enter_trade(pair, row, trade_dir)
                 if trade:
-                    self.wallets.update()
+                    self.wallets.update_trade(trade)
             else:
                 self._collate_rejected(pair, row)
 
@@ -1496,7 +1555,7 @@ class Backtesting:
             # 3. Process entry orders.
             order = trade.select_order(trade.entry_side, is_open=True)
             if self._try_close_open_order(order, trade, current_time, row):
-                self.wallets.update()
+                self.wallets.update_trade(trade)
 
             # 4. Create exit orders (if any)
             if trade.has_open_position:
@@ -1511,26 +1570,29 @@ class Backtesting:
             return exiting_dir
         return None
 
-    def get_detail_data(self, pair: str, row: tuple) -> list[tuple] | None:
+    def _prepare_detail_data(self, processed: dict[str, DataFrame]) -> None:
+        """
+        Convert detail data to arrays (once) and precompute the detail candle offsets
+        for every main candle, so get_detail_data() doesn't need to scan the detail data.
+        :param processed: Trimmed, analyzed dataframes as returned by _get_ohlcv_as_lists()
+        """
+        timeframe_ms = self.timeframe_secs * 1000
+        for pair, detail_df in self.detail_data.items():
+            if pair not in processed:
+                continue
+            if pair not in self._detail_columns:
+                self._detail_columns[pair] = DetailPairData.from_dataframe(detail_df)
+            main_dates = processed[pair]["date"].values.astype("datetime64[ms]").view("int64")
+            self._detail_columns[pair].build_offsets(main_dates, timeframe_ms)
+
+    def get_detail_data(self, pair: str, row: tuple) -> DetailCandleView | None:
         """
         Spread into detail data
         """
-        current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
-        exit_candle_end = current_detail_time + self.timeframe_td
-        detail_data = self.detail_data[pair]
-        detail_data = detail_data.loc[
-            (detail_data["date"] >= current_detail_time) & (detail_data["date"] < exit_candle_end)
-        ].copy()
-
-        if len(detail_data) == 0:
+        detail_columns = self._detail_columns.get(pair)
+        if detail_columns is None:
             return None
-        detail_data.loc[:, "enter_long"] = row[LONG_IDX]
-        detail_data.loc[:, "exit_long"] = row[ELONG_IDX]
-        detail_data.loc[:, "enter_short"] = row[SHORT_IDX]
-        detail_data.loc[:, "exit_short"] = row[ESHORT_IDX]
-        detail_data.loc[:, "enter_tag"] = row[ENTER_TAG_IDX]
-        detail_data.loc[:, "exit_tag"] = row[EXIT_TAG_IDX]
-        return detail_data[HEADERS].values.tolist()
+        return detail_columns.get_candles(dt_ts(row[DATE_IDX]), tuple(row[LONG_IDX:]))
 
     def _time_generator(self, start_date: datetime, end_date: datetime):
         current_time = start_date + self.timeframe_td
@@ -1568,7 +1630,7 @@ class Backtesting:
         start_date: datetime,
         end_date: datetime,
         pairs: list[str],
-        data: dict[str, list[tuple]],
+        data: dict[str, list[tuple] | ColumnarPairData],
     ):
         """
         Backtest time and pair generator
@@ -1596,7 +1658,7 @@ class Backtesting:
             strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
                 current_time=current_time
             )
-            pair_detail_cache: dict[str, list[tuple]] = {}
+            pair_detail_cache: dict[str, DetailCandleView] = {}
             pair_tradedir_cache: dict[str, LongShort | None] = {}
             pairs_with_open_trades = [t.pair for t in LocalTrade.bt_trades_open]
 
@@ -1611,9 +1673,14 @@ class Backtesting:
                 if is_first:
                     # Main candle
                     row_index = indexes[pair]
-                    row = self.validate_row(data, pair, row_index, current_time)
-                    if not row:
-                        continue
+                    pair_data = data[pair]
+                    if isinstance(pair_data, ColumnarPairData):
+                        if not pair_data.is_valid(row_index, current_time):
+                            continue
+                    else:
+                        row = self.validate_row(data, pair, row_index, current_time)
+                        if not row:
+                            continue
 
                     row_index += 1
                     indexes[pair] = row_index
@@ -1621,7 +1688,16 @@ class Backtesting:
                     self.dataprovider._set_dataframe_max_index(
                         pair, self.required_startup + row_index
                     )
-                    trade_dir = self.check_for_trade_entry(row)
+                    if isinstance(pair_data, ColumnarPairData):
+                        trade_dir = pair_data.trade_direction(row_index - 1)
+                        if trade_dir is None and len(LocalTrade.bt_trades_open_pp[pair]) == 0:
+                            # Neither a signal nor an open trade - nothing can happen
+                            # for this pair during this candle, so skip building the row.
+                            self.dataprovider._set_dataframe_max_date(current_time_det)
+                            continue
+                        row = pair_data[row_index - 1]
+                    else:
+                        trade_dir = self.check_for_trade_entry(row)
                     pair_tradedir_cache[pair] = trade_dir
 
                 else:
@@ -1676,6 +1752,161 @@ class Backtesting:
                 yield current_time_det, pair, row, is_last_row, trade_dir
             self.progress.increment()
 
+    def supports_signal_only(self) -> bool:
+        """
+        Check if the signal-only backtest loop can be used for the current strategy.
+        It requires long-only spot trading without detail timeframe, protections
+        or position stacking - and no strategy callbacks which could act on candles
+        without signal.
+        """
+        strategy = self.strategy
+        if (
+            self._can_short
+            or self.timeframe_detail
+            or self.enable_protections
+            or self._position_stacking
+            or self.dynamic_pairlist
+            or self.fee < 0
+            or strategy.position_adjustment_enable
+            or strategy.use_custom_stoploss
+            or strategy.use_custom_roi
+        ):
+            return False
+        callbacks = SIGNAL_ONLY_INCOMPATIBLE_CALLBACKS
+        if strategy.use_exit_signal:
+            callbacks = [*callbacks, "custom_exit"]
+        return not any(check_override(strategy, IStrategy, cb) for cb in callbacks)
+
+    def _next_signal_only_row(
+        self,
+        pair_data: ColumnarPairData,
+        pair: str,
+        start: int,
+        roi_table: tuple[np.ndarray, np.ndarray],
+    ) -> int:
+        """
+        Next row of this pair which can change the backtest state.
+        Without open trade, that's the next entry signal - otherwise the next candle where
+        the open trade may exit (or adjust its trailing stoploss).
+        """
+        open_trades = LocalTrade.bt_trades_open_pp[pair]
+        if not open_trades:
+            return pair_data.next_entry_row(start)
+        trade = open_trades[0]
+        strategy = self.strategy
+        if trade.has_open_orders or (
+            strategy.trailing_stop
+            and not strategy.trailing_only_offset_is_reached
+            and strategy.trailing_stop_positive is not None
+            and abs(strategy.trailing_stop_positive) > abs(strategy.stoploss)
+        ):
+            # Trailing stoploss could move on any candle - evaluate every candle.
+            return start
+        return pair_data.next_exit_candidate(
+            start,
+            open_date=dt_ts(trade.open_date_utc),
+            open_rate=trade.open_rate,
+            stop_loss=trade.stop_loss,
+            max_rate=(trade.max_rate or trade.open_rate) if strategy.trailing_stop else None,
+            roi_table=roi_table,
+            exit_signal=strategy.use_exit_signal,
+        )
+
+    def _backtest_signal_only(
+        self,
+        data: dict[str, list[tuple] | ColumnarPairData],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> None:
+        """
+        Event driven variant of the backtest loop, used if only roi / stoploss / trailing
+        settings change between runs.
+        Only candles with an entry signal (for pairs without open trade), and candles on which
+        an open trade may exit are evaluated - using backtest_loop(), in the same order
+        time_pair_generator() would yield them. All other candles can't change the result.
+        """
+        timeframe_ms = self.timeframe_secs * 1000
+        first_time = dt_ts(start_date + self.timeframe_td)
+        end_time = dt_ts(end_date)
+        self.progress.init_step(
+            BacktestState.BACKTEST, int((end_date - start_date) / self.timeframe_td)
+        )
+        roi = sorted(self.strategy.minimal_roi.items())
+        roi_table = (
+            np.array([int(k) for k, _ in roi], dtype=np.int64),
+            np.array([v for _, v in roi], dtype=np.float64),
+        )
+
+        # Pairs without data are stored as empty lists.
+        columnar = {
+            pair: pair_data
+            for pair, pair_data in data.items()
+            if isinstance(pair_data, ColumnarPairData)
+        }
+        pairs = list(columnar.keys())
+        pair_rows: dict[str, int] = {}
+        process_times: dict[str, np.ndarray] = {}
+        last_rows: dict[str, int] = {}
+        # Heap of (process time, pair position, row index)
+        events: list[tuple[int, int, int]] = []
+
+        def schedule(pos: int, pair: str, start: int) -> None:
+            row_index = self._next_signal_only_row(columnar[pair], pair, start, roi_table)
+            if row_index < pair_rows[pair]:
+                heappush(events, (int(process_times[pair][row_index]), pos, row_index))
+
+        for pos, pair in enumerate(pairs):
+            process_times[pair] = columnar[pair].process_times(first_time, timeframe_ms)
+            pair_rows[pair] = int(np.searchsorted(process_times[pair], end_time, side="right"))
+            schedule(pos, pair, 0)
+
+        while events:
+            self.check_abort()
+            current_ts = events[0][0]
+            current_pairs: dict[str, tuple[int, int]] = {}
+            while events and events[0][0] == current_ts:
+                _, pos, row_index = heappop(events)
+                current_pairs[pairs[pos]] = (pos, row_index)
+            current_time = datetime.fromtimestamp(current_ts / 1000, tz=UTC)
+            self.progress.set_new_value((current_ts - first_time) // timeframe_ms)
+
+            # Pairs that have open trades should be processed first
+            open_pairs = [t.pair for t in LocalTrade.bt_trades_open]
+            for pair in sorted(
+                current_pairs,
+                key=lambda p: (
+                    (0, open_pairs.index(p)) if p in open_pairs else (1, current_pairs[p][0])
+                ),
+            ):
+                pos, row_index = current_pairs[pair]
+                pair_data = columnar[pair]
+                open_trades = LocalTrade.bt_trades_open_pp[pair]
+                if open_trades:
+                    # Account for the candles skipped since the last evaluation
+                    skipped = pair_data.high_low(last_rows[pair] + 1, row_index)
+                    if skipped:
+                        open_trades[0].adjust_min_max_rates(*skipped)
+
+                self.dataprovider._set_dataframe_max_index(
+                    pair, self.required_startup + row_index + 1
+                )
+                self.dataprovider._set_dataframe_max_date(current_time)
+                self.backtest_loop(
+                    pair_data[row_index],
+                    pair,
+                    current_time,
+                    pair_data.trade_direction(row_index),
+                    current_time != end_date,
+                )
+                last_rows[pair] = row_index
+                schedule(pos, pair, row_index + 1)
+
+        for pair, open_trades in LocalTrade.bt_trades_open_pp.items():
+            if open_trades and pair in last_rows:
+                skipped = columnar[pair].high_low(last_rows[pair] + 1, pair_rows[pair])
+                if skipped:
+                    open_trades[0].adjust_min_max_rates(*skipped)
+
     def backtest(
         self, processed: dict, start_date: datetime, end_date: datetime
     ) -> BacktestContentTypeIcomplete:
@@ -1695,30 +1926,42 @@ class Backtesting:
         self.reset_backtest(self.enable_protections)
         # Ensure wallets are up-to-date (important for --strategy-list)
         self.wallets.update()
-        # Use dict of lists with data for performance
-        # (looping lists is a lot faster than pandas DataFrames)
-        data: dict = self._get_ohlcv_as_lists(processed)
-
-        # Loop timerange and get candle for each pair at that point in time
-        for (
-            current_time,
-            pair,
-            row,
-            is_last_row,
-            trade_dir,
-        ) in self.time_pair_generator(start_date, end_date, list(data.keys()), data):
-            if not self._can_short or trade_dir is None:
-                # No need to reverse position if shorting is disabled or there's no new signal
-                self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
-            else:
-                # Conditionally call backtest_loop a 2nd time if shorting is enabled,
-                # a position closed and a new signal in the other direction is available.
-
-                for _ in (0, 1):
-                    a = self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
-                    if not a or a == trade_dir:
-                        # the trade didn't close or position change is in the same direction
-                        break
+        data: dict
+        if self.signal_only and self._signal_only_cache is not None:
+            # Signals did not change since the last run - reuse the converted data.
+            data, trimmed = self._signal_only_cache
+            processed.update(trimmed)
+        else:
+            # Use dict of lists with data for performance
+            # (looping lists is a lot faster than pandas DataFrames)
+            data = self._get_ohlcv_as_lists(processed)
+            if self.signal_only:
+                self._signal_only_cache = (data, {pair: processed[pair] for pair in data})
+        self._prepare_detail_data(processed)
+
+        if self.signal_only:
+            self._backtest_signal_only(data, start_date, end_date)
+        else:
+            # Loop timerange and get candle for each pair at that point in time
+            for (
+                current_time,
+                pair,
+                row,
+                is_last_row,
+                trade_dir,
+            ) in self.time_pair_generator(start_date, end_date, list(data.keys()), data):
+                if not self._can_short or trade_dir is None:
+                    # No need to reverse position if shorting is disabled or there's no new signal
+                    self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+                else:
+                    # Conditionally call backtest_loop a 2nd time if shorting is enabled,
+                    # a position closed and a new signal in the other direction is available.
+
+                    for _ in (0, 1):
+                        a = self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+                        if not a or a == trade_dir:
+                            # the trade didn't close or position change is in the same direction
+                            break
 
         self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
         self.wallets.update()
@@ -13,14 +13,16 @@ from pathlib import Path
 from typing import Any
 
 import rapidjson
-from joblib import Parallel, cpu_count
+from joblib import Parallel, cpu_count, effective_n_jobs
 from optuna.trial import FrozenTrial, Trial, TrialState
 
 from freqtrade.constants import FTHYPT_FILEVERSION, LAST_BT_RESULT_FN, Config
 from freqtrade.enums import HyperoptState
 from freqtrade.misc import file_dump_json, plural
+from freqtrade.optimize.hyperopt.hyperopt_data import hyperopt_data_manifest
 from freqtrade.optimize.hyperopt.hyperopt_optimizer import INITIAL_POINTS, HyperOptimizer
 from freqtrade.optimize.hyperopt.hyperopt_output import HyperoptOutput
+from freqtrade.optimize.hyperopt.hyperopt_worker_pool import HyperoptWorkerPool
 from freqtrade.optimize.hyperopt_tools import (
     HyperoptStateContainer,
     HyperoptTools,
@@ -57,7 +59,7 @@ class Hyperopt:
             / f"strategy_{strategy}_{time_now}.fthypt"
         )
         self.data_pickle_file = (
-            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
+            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.bin"
         )
         self.total_epochs = config.get("epochs", 0)
 
@@ -85,9 +87,13 @@ class Hyperopt:
 
     def clean_hyperopt(self) -> None:
         """
-        Remove hyperopt pickle files to restart hyperopt.
+        Remove hyperopt data and result files to restart hyperopt.
         """
-        for f in [self.data_pickle_file, self.results_file]:
+        for f in [
+            self.data_pickle_file,
+            hyperopt_data_manifest(self.data_pickle_file),
+            self.results_file,
+        ]:
             p = Path(f)
             if p.is_file():
                 logger.info(f"Removing `{p}`.")
@@ -216,6 +222,86 @@ class Hyperopt:
 
         self._save_result(val)
 
+    def run_optimizer_batches(self, pbar, task, start: int, jobs: int) -> None:
+        """
+        Evaluate epochs in batches of `jobs` epochs, using joblib.
+        Every batch waits for its slowest epoch before the next batch is asked for.
+        """
+        with Parallel(n_jobs=jobs) as parallel:
+            evals = ceil((self.total_epochs - start) / jobs)
+            for i in range(evals):
+                # Correct the number of epochs to be processed for the last
+                # iteration (should not exceed self.total_epochs in total)
+                n_rest = (i + 1) * jobs - (self.total_epochs - start)
+                current_jobs = jobs - n_rest if n_rest > 0 else jobs
+
+                asked, is_random = self.get_asked_points(
+                    n_points=current_jobs, dimensions=self.hyperopter.o_dimensions
+                )
+
+                f_val = self.run_optimizer_parallel(
+                    parallel,
+                    [asked1.params for asked1 in asked],
+                )
+
+                f_val_loss = [v["loss"] for v in f_val]
+                for o_ask, v in zip(asked, f_val_loss, strict=False):
+                    self.opt.tell(o_ask, v)
+
+                for j, val in enumerate(f_val):
+                    # Use human-friendly indexes here (starting from 1)
+                    current = i * jobs + j + 1 + start
+
+                    self.evaluate_result(val, current, is_random[j])
+                    pbar.update(task, advance=1)
+                self.hyperopter.handle_mp_logging()
+                gc.collect()
+
+                if (
+                    self.hyperopter.es_epochs > 0
+                    and self.hyperopter.es_terminator.should_terminate(self.opt)
+                ):
+                    logger.info(f"Early stopping after {(i + 1) * jobs} epochs")
+                    break
+
+    def run_optimizer_pool(self, pbar, task, start: int, jobs: int) -> None:
+        """
+        Evaluate epochs on a persistent pool of worker processes.
+        Workers keep their HyperOptimizer (and data) for the whole run, and a new epoch is
+        asked for as soon as one worker becomes idle - there is no barrier between batches.
+        """
+        current = start
+        asked_epochs = start
+        with HyperoptWorkerPool(self.hyperopter, jobs) as pool:
+            while asked_epochs < self.total_epochs or pool.pending > 0:
+                while asked_epochs < self.total_epochs and pool.pending < jobs:
+                    asked, is_random = self.get_asked_points(
+                        n_points=1, dimensions=self.hyperopter.o_dimensions
+                    )
+                    asked_epochs += 1
+                    for o_ask, rand in zip(asked, is_random, strict=False):
+                        pool.submit(o_ask.params, (o_ask, rand))
+
+                if pool.pending == 0:
+                    # All remaining points were duplicates.
+                    continue
+
+                for (o_ask, rand), val in pool.wait_completed():
+                    self.opt.tell(o_ask, val["loss"])
+                    # Use human-friendly indexes here (starting from 1)
+                    current += 1
+                    self.evaluate_result(val, current, rand)
+                    pbar.update(task, advance=1)
+                self.hyperopter.handle_mp_logging()
+
+                if (
+                    self.hyperopter.es_epochs > 0
+                    and self.hyperopter.es_terminator.should_terminate(self.opt)
+                ):
+                    # Epochs which did not start yet are cancelled when leaving the pool.
+                    logger.info(f"Early stopping after {current} epochs")
+                    break
+
     def start(self) -> None:
         self.random_state = self._set_random_state(self.config.get("hyperopt_random_state"))
         logger.info(f"Using optimizer random state: {self.random_state}")
@@ -227,65 +313,33 @@ class Hyperopt:
         config_jobs = self.config.get("hyperopt_jobs", -1)
         logger.info(f"Number of parallel jobs set as: {config_jobs}")
 
+        jobs = effective_n_jobs(config_jobs)
+        logger.info(f"Effective number of parallel workers used: {jobs}")
+
         self.opt = self.hyperopter.get_optimizer(self.random_state)
         try:
-            with Parallel(n_jobs=config_jobs) as parallel:
-                jobs = parallel._effective_n_jobs()
-                logger.info(f"Effective number of parallel workers used: {jobs}")
-
-                # Define progressbar
-                with get_progress_tracker(cust_callables=[self._hyper_out]) as pbar:
-                    task = pbar.add_task("Epochs", total=self.total_epochs)
-
-                    start = 0
-
-                    if self.analyze_per_epoch:
-                        # First analysis not in parallel mode when using --analyze-per-epoch.
-                        # This allows dataprovider to load it's informative cache.
-                        asked, is_random = self.get_asked_points(
-                            n_points=1, dimensions=self.hyperopter.o_dimensions
-                        )
-                        f_val0 = self.hyperopter.generate_optimizer(asked[0].params)
-                        self.opt.tell(asked[0], [f_val0["loss"]])
-                        self.evaluate_result(f_val0, 1, is_random[0])
-                        pbar.update(task, advance=1)
-                        start += 1
-
-                    evals = ceil((self.total_epochs - start) / jobs)
-                    for i in range(evals):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - (self.total_epochs - start)
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked, is_random = self.get_asked_points(
-                            n_points=current_jobs, dimensions=self.hyperopter.o_dimensions
-                        )
-
-                        f_val = self.run_optimizer_parallel(
-                            parallel,
-                            [asked1.params for asked1 in asked],
-                        )
-
-                        f_val_loss = [v["loss"] for v in f_val]
-                        for o_ask, v in zip(asked, f_val_loss, strict=False):
-                            self.opt.tell(o_ask, v)
-
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1 + start
-
-                            self.evaluate_result(val, current, is_random[j])
-                            pbar.update(task, advance=1)
-                        self.hyperopter.handle_mp_logging()
-                        gc.collect()
-
-                        if (
-                            self.hyperopter.es_epochs > 0
-                            and self.hyperopter.es_terminator.should_terminate(self.opt)
-                        ):
-                            logger.info(f"Early stopping after {(i + 1) * jobs} epochs")
-                            break
+            # Define progressbar
+            with get_progress_tracker(cust_callables=[self._hyper_out]) as pbar:
+                task = pbar.add_task("Epochs", total=self.total_epochs)
+
+                start = 0
+
+                if self.analyze_per_epoch:
+                    # First analysis not in parallel mode when using --analyze-per-epoch.
+                    # This allows dataprovider to load it's informative cache.
+                    asked, is_random = self.get_asked_points(
+                        n_points=1, dimensions=self.hyperopter.o_dimensions
+                    )
+                    f_val0 = self.hyperopter.generate_optimizer(asked[0].params)
+                    self.opt.tell(asked[0], [f_val0["loss"]])
+                    self.evaluate_result(f_val0, 1, is_random[0])
+                    pbar.update(task, advance=1)
+                    start += 1
+
+                if jobs > 1:
+                    self.run_optimizer_pool(pbar, task, start, jobs)
+                else:
+                    self.run_optimizer_batches(pbar, task, start, jobs)
 
         except KeyboardInterrupt:
             print("User interrupted..")
@@ -0,0 +1,118 @@
+"""
+Storage of preprocessed hyperopt data in a flat, memory-mapped file.
+
+Columns of all pairs are written once into one binary file (plus a small manifest).
+Hyperopt worker processes attach to this file once and reuse the read-only column arrays
+for every epoch - so the data is shared through the OS page cache and memory usage
+does not grow with the number of workers.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from joblib import dump, load
+from pandas import DataFrame, Series
+
+
+logger = logging.getLogger(__name__)
+
+_ALIGNMENT = 64
+_ARRAY_KINDS = "biufcmM"
+
+# Data attached by the current process, keyed by (datafile, modification time)
+_attached_data: dict[tuple[str, int], dict[str, DataFrame]] = {}
+
+
+def hyperopt_data_manifest(datafile: Path) -> Path:
+    """Return the manifest filename belonging to the given data file."""
+    return datafile.with_name(f"{datafile.name}.meta")
+
+
+def store_hyperopt_data(data: dict[str, DataFrame], datafile: Path) -> None:
+    """
+    Store a dictionary of dataframes as a flat binary file for zero-copy loading.
+    Numeric and datetime columns are written as raw arrays, all other columns
+    (usually none) are kept in the manifest.
+    :param data: Dictionary of dataframes, keyed by pair
+    :param datafile: Path of the binary file. The manifest is stored next to it.
+    """
+    manifest: dict[str, dict[str, Any]] = {}
+    offset = 0
+    with datafile.open("wb") as f:
+        for pair, df in data.items():
+            columns: list[dict[str, Any]] = []
+            for pos, col in enumerate(df.columns):
+                series = df.iloc[:, pos]
+                if series.dtype.kind not in _ARRAY_KINDS:
+                    columns.append({"name": col, "values": series.to_numpy()})
+                    continue
+                # .values returns UTC based datetime64 values for timezone aware columns.
+                values = np.ascontiguousarray(series.values)
+                padding = -offset % _ALIGNMENT
+                f.write(b"\0" * padding)
+                offset += padding
+                f.write(values.view(np.uint8))
+                columns.append(
+                    {
+                        "name": col,
+                        "dtype": values.dtype.str,
+                        "tz": getattr(series.dtype, "tz", None),
+                        "offset": offset,
+                        "length": len(values),
+                    }
+                )
+                offset += values.nbytes
+            manifest[pair] = {"index": df.index, "columns": columns}
+
+    dump(manifest, hyperopt_data_manifest(datafile))
+    logger.debug(f"Stored hyperopt data for {len(data)} pairs ({offset} bytes) in {datafile}.")
+
+
+def _attach_hyperopt_data(datafile: Path) -> dict[str, DataFrame]:
+    manifest = load(hyperopt_data_manifest(datafile))
+    if datafile.stat().st_size > 0:
+        buffer = np.memmap(datafile, dtype=np.uint8, mode="r")
+    else:
+        buffer = np.empty(0, dtype=np.uint8)
+
+    data: dict[str, DataFrame] = {}
+    for pair, pair_meta in manifest.items():
+        columns: dict[str, Any] = {}
+        for col in pair_meta["columns"]:
+            if "values" in col:
+                columns[col["name"]] = col["values"]
+                continue
+            dtype = np.dtype(col["dtype"])
+            if col["length"] == 0:
+                values = np.empty(0, dtype=dtype)
+            else:
+                values = np.frombuffer(
+                    buffer, dtype=dtype, count=col["length"], offset=col["offset"]
+                )
+            if col["tz"] is not None:
+                values = (
+                    Series(values, copy=False).dt.tz_localize("UTC").dt.tz_convert(col["tz"]).array
+                )
+            columns[col["name"]] = values
+        # copy=False avoids consolidating the columns into new (copied) blocks.
+        data[pair] = DataFrame(columns, index=pair_meta["index"], copy=False)
+    return data
+
+
+def load_hyperopt_data(datafile: Path) -> dict[str, DataFrame]:
+    """
+    Load data stored by store_hyperopt_data().
+    The file is only mapped once per process - following calls return new (shallow) dataframes
+    on top of the same read-only arrays, so columns added during an epoch don't leak into
+    the next epoch.
+    :param datafile: Path of the binary file
+    :return: Dictionary of dataframes, keyed by pair
+    """
+    key = (str(datafile), datafile.stat().st_mtime_ns)
+    if key not in _attached_data:
+        # Release data of previous hyperopt runs.
+        _attached_data.clear()
+        _attached_data[key] = _attach_hyperopt_data(datafile)
+    return {pair: df.copy(deep=False) for pair, df in _attached_data[key].items()}
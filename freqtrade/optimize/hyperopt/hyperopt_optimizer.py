@@ -12,7 +12,7 @@ from pathlib import Path
 from typing import Any
 
 import optuna
-from joblib import delayed, dump, load, wrap_non_picklable_objects
+from joblib import delayed, wrap_non_picklable_objects
 from joblib.externals import cloudpickle
 from optuna.exceptions import ExperimentalWarning
 from optuna.terminator import BestValueStagnationEvaluator, Terminator
@@ -30,6 +30,7 @@ from freqtrade.optimize.backtesting import Backtesting
 
 # Import IHyperOptLoss to allow unpickling classes from these modules
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_data import load_hyperopt_data, store_hyperopt_data
 from freqtrade.optimize.hyperopt.hyperopt_logger import logging_mp_handle, logging_mp_setup
 from freqtrade.optimize.hyperopt_loss.hyperopt_loss_interface import IHyperOptLoss
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer, HyperoptTools
@@ -51,6 +52,9 @@ INITIAL_POINTS = 30
 
 MAX_LOSS = 100000  # just a big enough number to be bad result in loss optimization
 
+# Spaces which don't influence entry / exit signals
+SIGNAL_ONLY_SPACES = {"roi", "stoploss", "trailing", "trades"}
+
 optuna_samplers_dict = {
     "TPESampler": optuna.samplers.TPESampler,
     "GPSampler": optuna.samplers.GPSampler,
@@ -117,6 +121,12 @@ class HyperOptimizer:
         log_queue = m.Queue()
         logger.info(f"manager queue {type(log_queue)}")
 
+    def get_log_queue(self) -> Any:
+        """
+        Return the queue child processes should log to.
+        """
+        return log_queue
+
     def handle_mp_logging(self) -> None:
         """
         Handle logging from child processes.
@@ -130,6 +140,16 @@ class HyperOptimizer:
 
         self.prepare_hyperopt_data()
 
+        if (
+            not self.analyze_per_epoch
+            and set(self.spaces) <= SIGNAL_ONLY_SPACES
+            and self.backtesting.supports_signal_only()
+        ):
+            # Signals are identical for all epochs - only evaluate candles with an entry signal
+            # or a possible exit.
+            logger.info("Only roi / stoploss / trailing spaces selected - using signal-only mode.")
+            self.backtesting.signal_only = True
+
         # We don't need exchange instance anymore while running hyperopt
         self.backtesting.exchange.close()
         self.backtesting.exchange._api = None
@@ -311,8 +331,8 @@ class HyperOptimizer:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open("rb") as f:
-            processed = load(f, mmap_mode="r")
+        # Attaches to the shared data file once per process - near-zero cost for later epochs.
+        processed = load_hyperopt_data(self.data_pickle_file)
         if self.analyze_per_epoch:
             # Data is not yet analyzed, rerun populate_indicators.
             processed = self.advise_and_trim(processed)
@@ -467,6 +487,6 @@ class HyperOptimizer:
                 f"({(self.max_date - self.min_date).days} days).."
             )
             # Store non-trimmed data - will be trimmed after signal generation.
-            dump(preprocessed, self.data_pickle_file)
+            store_hyperopt_data(preprocessed, self.data_pickle_file)
         else:
-            dump(data, self.data_pickle_file)
+            store_hyperopt_data(data, self.data_pickle_file)
@@ -0,0 +1,85 @@
+"""
+Persistent process pool for hyperopt.
+Every worker receives the (pickled) HyperOptimizer once at startup and keeps it - including
+strategy, exchange stub and data - for the whole run.
+Afterwards, only the parameter dict goes to the worker and only the result dict comes back.
+"""
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor
+from concurrent.futures import wait as wait_futures
+from typing import Any
+
+from joblib.externals import cloudpickle
+
+from freqtrade.optimize.hyperopt.hyperopt_logger import logging_mp_setup
+from freqtrade.optimize.hyperopt.hyperopt_optimizer import HyperOptimizer
+
+
+logger = logging.getLogger(__name__)
+
+# HyperOptimizer instance of the current worker process
+_worker_optimizer: HyperOptimizer | None = None
+
+
+def _init_worker(optimizer: bytes, log_queue: Any, log_level: int) -> None:
+    global _worker_optimizer
+    logging_mp_setup(log_queue, log_level)
+    _worker_optimizer = cloudpickle.loads(optimizer)
+
+
+def _run_epoch(params_dict: dict[str, Any]) -> dict[str, Any]:
+    if _worker_optimizer is None:
+        raise RuntimeError("Hyperopt worker has not been initialized.")
+    return _worker_optimizer.generate_optimizer(params_dict)
+
+
+class HyperoptWorkerPool:
+    """
+    Long-lived pool of hyperopt worker processes.
+    Epochs are submitted one at a time, so idle workers can start the next point
+    without waiting for other workers to finish.
+    """
+
+    def __init__(self, hyperopter: HyperOptimizer, n_workers: int) -> None:
+        log_level = logging.INFO if hyperopter.config["verbosity"] < 1 else logging.DEBUG
+        self._executor = ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker,
+            initargs=(cloudpickle.dumps(hyperopter), hyperopter.get_log_queue(), log_level),
+        )
+        self._pending: dict[Future, Any] = {}
+
+    def __enter__(self) -> "HyperoptWorkerPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Don't wait for running epochs when interrupted.
+        self.shutdown(wait=exc_type is None)
+
+    @property
+    def pending(self) -> int:
+        """Number of submitted epochs which did not return yet."""
+        return len(self._pending)
+
+    def submit(self, params_dict: dict[str, Any], context: Any) -> None:
+        """
+        Evaluate one epoch on the next idle worker.
+        :param params_dict: Parameters for this epoch
+        :param context: Arbitrary object returned together with the result
+        """
+        future = self._executor.submit(_run_epoch, params_dict)
+        self._pending[future] = context
+
+    def wait_completed(self) -> list[tuple[Any, dict[str, Any]]]:
+        """
+        Block until at least one epoch completed.
+        :return: List of (context, result) tuples for all completed epochs
+        """
+        done, _ = wait_futures(self._pending, return_when=FIRST_COMPLETED)
+        return [(self._pending.pop(future), future.result()) for future in done]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop all workers, cancelling epochs which did not start yet."""
+        self._pending = {}
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -4,7 +4,7 @@ from datetime import UTC, datetime, timedelta
 from typing import Any, Literal
 
 import numpy as np
-from pandas import DataFrame, Series, concat, to_datetime
+from pandas import DataFrame, DatetimeIndex, Series, to_datetime
 
 from freqtrade.constants import BACKTEST_BREAKDOWNS, DATETIME_PRINT_FORMAT
 from freqtrade.data.metrics import (
@@ -29,47 +29,67 @@ from freqtrade.util import decimals_per_coin, fmt_coin, format_duration, get_dry
 logger = logging.getLogger(__name__)
 
 
+def _date_values(dates) -> np.ndarray:
+    """
+    Convert dates to int64 (UTC nanoseconds) for use with np.searchsorted.
+    """
+    return DatetimeIndex(to_datetime(dates, utc=True)).as_unit("ns").asi8
+
+
 def generate_trade_signal_candles(
     preprocessed_df: dict[str, DataFrame], bt_results: BacktestContentType, date_col: str
 ) -> dict[str, DataFrame]:
+    """
+    Get the candle before each trade's date_col (the signal candle) - one row per trade.
+    """
     signal_candles_only = {}
+    resdf = bt_results["results"]
+    results_per_pair = dict(tuple(resdf.groupby("pair", sort=False))) if len(resdf) else {}
     for pair in preprocessed_df.keys():
-        signal_candles_only_df = DataFrame()
-
         pairdf = preprocessed_df[pair]
-        resdf = bt_results["results"]
-        pairresults = resdf.loc[(resdf["pair"] == pair)]
 
         if pairdf.shape[0] > 0:
-            for t, v in pairresults.iterrows():
-                allinds = pairdf.loc[(pairdf["date"] < v[date_col])]
-                signal_inds = allinds.iloc[[-1]]
-                signal_candles_only_df = concat(
-                    [signal_candles_only_df.infer_objects(), signal_inds.infer_objects()]
+            pairresults = results_per_pair.get(pair)
+            if pairresults is None:
+                signal_candles_only[pair] = DataFrame()
+                continue
+            # Last candle before the trade date
+            positions = (
+                np.searchsorted(
+                    _date_values(pairdf["date"]), _date_values(pairresults[date_col]), side="left"
                 )
-
-            signal_candles_only[pair] = signal_candles_only_df
+                - 1
+            )
+            signal_candles_only[pair] = pairdf.iloc[positions[positions >= 0]].infer_objects()
     return signal_candles_only
 
 
 def generate_rejected_signals(
     preprocessed_df: dict[str, DataFrame], rejected_dict: dict[str, DataFrame]
 ) -> dict[str, DataFrame]:
+    """
+    Get the candle of each rejected signal, with pair and enter_tag of the signal.
+    """
     rejected_candles_only = {}
     for pair, signals in rejected_dict.items():
-        rejected_signals_only_df = DataFrame()
         pairdf = preprocessed_df[pair]
+        if not len(signals) or pairdf.empty:
+            rejected_candles_only[pair] = DataFrame()
+            continue
 
-        for t in signals:
-            data_df_row = pairdf.loc[(pairdf["date"] == t[0])].copy()
-            data_df_row["pair"] = pair
-            data_df_row["enter_tag"] = t[1]
+        dates = _date_values(pairdf["date"])
+        signal_dates = _date_values([t[0] for t in signals])
+        positions = np.searchsorted(dates, signal_dates, side="left")
+        found = positions < len(dates)
+        found[found] = dates[positions[found]] == signal_dates[found]
 
-            rejected_signals_only_df = concat(
-                [rejected_signals_only_df.infer_objects(), data_df_row.infer_objects()]
-            )
+        rejected_signals_only_df = pairdf.iloc[positions[found]].copy()
+        rejected_signals_only_df["pair"] = pair
+        rejected_signals_only_df["enter_tag"] = np.array(
+            [t[1] for t in signals], dtype=object
+        )[found]
 
-        rejected_candles_only[pair] = rejected_signals_only_df
+        rejected_candles_only[pair] = rejected_signals_only_df.infer_objects()
     return rejected_candles_only
 
 
@@ -4,7 +4,9 @@ This module defines the interface to apply for strategies
 """
 
 import logging
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from math import isinf, isnan
 
@@ -153,6 +155,10 @@ class IStrategy(ABC, HyperStrategyMixin):
         self.config = config
         # Dict to determine if analysis is necessary
         self.__last_candle_seen_per_pair: dict[str, datetime] = {}
+        # Analyzed dataframes of the running parallel analysis - stored by analyze()
+        self.__parallel_results: dict[str, tuple[DataFrame, bool]] | None = None
+        # Duration (seconds) of the last analysis, per pair
+        self.analysis_timings: dict[str, float] = {}
         super().__init__(config)
 
         # Gather informative pairs from @informative-decorated methods.
@@ -1218,9 +1224,11 @@ class IStrategy(ABC, HyperStrategyMixin):
 
             self.__last_candle_seen_per_pair[pair] = dataframe.iloc[-1]["date"]
 
-            candle_type = self.config.get("candle_type_def", CandleType.SPOT)
-            self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
-            self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+            if self.__parallel_results is not None:
+                # Parallel analysis - results are stored in pair order by analyze()
+                self.__parallel_results[pair] = (dataframe, new_candle)
+            else:
+                self._store_analyzed_df(pair, dataframe, new_candle)
 
         else:
             logger.debug("Skipping TA Analysis for already analyzed candle")
@@ -1230,6 +1238,14 @@ class IStrategy(ABC, HyperStrategyMixin):
 
         return dataframe
 
+    def _store_analyzed_df(self, pair: str, dataframe: DataFrame, new_candle: bool) -> None:
+        """
+        Store the analyzed dataframe in the dataprovider and emit it to consumers.
+        """
+        candle_type = self.config.get("candle_type_def", CandleType.SPOT)
+        self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
+        self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+
     def analyze_pair(self, pair: str) -> None:
         """
         Fetch data for this pair from dataprovider and analyze.
@@ -1262,13 +1278,41 @@ class IStrategy(ABC, HyperStrategyMixin):
             logger.warning("Empty dataframe for pair %s", pair)
             return
 
+    def _timed_analyze_pair(self, pair: str) -> float:
+        start = time.perf_counter()
+        self.analyze_pair(pair)
+        return time.perf_counter() - start
+
     def analyze(self, pairs: list[str]) -> None:
         """
         Analyze all pairs using analyze_pair().
+        With `analysis_workers` > 1, pairs are analyzed in a thread pool. Analyzed dataframes
+        are stored in the dataprovider afterwards - in the order of pairs.
+        The duration of each pair's analysis is available in `analysis_timings`.
         :param pairs: List of pairs to analyze
         """
-        for pair in pairs:
-            self.analyze_pair(pair)
+        workers = min(self.config.get("analysis_workers", 1), len(pairs))
+        if workers > 1:
+            self.__parallel_results = {}
+            try:
+                with ThreadPoolExecutor(workers, thread_name_prefix="analyze") as executor:
+                    timings = list(executor.map(self._timed_analyze_pair, pairs))
+            finally:
+                results, self.__parallel_results = self.__parallel_results, None
+            for pair in pairs:
+                if pair in results:
+                    self._store_analyzed_df(pair, *results[pair])
+        else:
+            timings = [self._timed_analyze_pair(pair) for pair in pairs]
+
+        self.analysis_timings = dict(zip(pairs, timings, strict=True))
+        if self.analysis_timings:
+            slowest = max(self.analysis_timings, key=self.analysis_timings.__getitem__)
+            logger.debug(
+                f"Analyzed {len(pairs)} pairs in {sum(timings):.3f}s of analysis time "
+                f"({workers} workers), slowest: {slowest} "
+                f"({self.analysis_timings[slowest]:.3f}s)."
+            )
 
     def get_latest_candle(
         self,
@@ -3,6 +3,7 @@
 
 import logging
 from datetime import datetime, timedelta
+from math import isclose
 from typing import Literal, NamedTuple
 
 from freqtrade.constants import UNLIMITED_STAKE_AMOUNT, Config, IntOrInf
@@ -33,6 +34,24 @@ class PositionWallet(NamedTuple):
     side: str = "long"
 
 
+class _TradeBalance(NamedTuple):
+    """Contribution of one open trade to the dry-run wallets."""
+
+    # Base currency - None in futures mode
+    currency: str | None
+    amount: float
+    # Amount tied up in open exit orders
+    pending: float
+    stake_amount: float
+    # Stake tied up in open entry orders (spot) / in the position (futures)
+    used_stake: float
+    realized_profit: float
+
+
+# Number of incremental (backtesting) wallet updates between two full recalculations
+LEDGER_RECONCILE_INTERVAL = 1000
+
+
 class Wallets:
     def __init__(self, config: Config, exchange: Exchange, is_backtest: bool = False) -> None:
         self._config = config
@@ -41,6 +60,14 @@ class Wallets:
         self._wallets: dict[str, Wallet] = {}
         self._positions: dict[str, PositionWallet] = {}
         self._start_cap: dict[str, float] = {}
+        # Dry-run ledger - balances of open trades, updated incrementally in backtesting.
+        self._trade_balances: dict[LocalTrade, _TradeBalance] = {}
+        self._currency_balances: dict[str, tuple[int, float, float]] = {}
+        self._open_profit = 0.0
+        self._open_stake = 0.0
+        self._open_used = 0.0
+        self._cross_margin = 0.0
+        self._ledger_updates = 0
 
         self._stake_currency = self._exchange.get_proxy_coin()
 
@@ -103,52 +130,24 @@ class Wallets:
         - Subtract currently tied up stake_amount in open trades
         - update balances for currencies currently in trades
         """
-        # Recreate _wallets to reset closed trade balances
-        _wallets = {}
-        _positions = {}
         open_trades = Trade.get_trades_proxy(is_open=True)
-        if not self._is_backtest:
-            # Live / Dry-run mode
-            tot_profit = Trade.get_total_closed_profit()
-        else:
-            # Backtest mode
-            tot_profit = LocalTrade.bt_total_profit
-        tot_profit += sum(trade.realized_profit for trade in open_trades)
-        tot_in_trades = sum(trade.stake_amount for trade in open_trades)
-        used_stake = 0.0
-
-        if self._config.get("trading_mode", "spot") != TradingMode.FUTURES:
-            for trade in open_trades:
-                curr = self._exchange.get_pair_base_currency(trade.pair)
-                used_stake += sum(
-                    o.stake_amount for o in trade.open_orders if o.ft_order_side == trade.entry_side
-                )
-                pending = sum(
-                    o.amount
-                    for o in trade.open_orders
-                    if o.amount and o.ft_order_side == trade.exit_side
-                )
-                curr_wallet_bal = self._start_cap.get(curr, 0)
-
-                _wallets[curr] = Wallet(
-                    curr,
-                    curr_wallet_bal + trade.amount - pending,
-                    pending,
-                    trade.amount + curr_wallet_bal,
-                )
-        else:
+        # Recreate the ledger to reset closed trade balances
+        self._trade_balances = {trade: self._trade_balance(trade) for trade in open_trades}
+        self._open_profit = sum(bal.realized_profit for bal in self._trade_balances.values())
+        self._open_stake = sum(bal.stake_amount for bal in self._trade_balances.values())
+        self._open_used = sum(bal.used_stake for bal in self._trade_balances.values())
+        self._currency_balances = {}
+        for bal in self._trade_balances.values():
+            if bal.currency is not None:
+                self._add_currency_balance(bal.currency, bal, 1)
+        self._ledger_updates = 0
+
+        self._positions = {}
+        if self._config.get("trading_mode", "spot") == TradingMode.FUTURES:
             for position in open_trades:
-                _positions[position.pair] = PositionWallet(
-                    position.pair,
-                    position=position.amount,
-                    leverage=position.leverage,
-                    collateral=position.stake_amount,
-                    side=position.trade_direction,
-                )
-
-            used_stake = tot_in_trades
+                self._positions[position.pair] = self._position_wallet(position)
 
-        cross_margin = 0.0
+        self._cross_margin = 0.0
         if self._config.get("margin_mode") == "cross":
             # In cross-margin mode, the total balance is used as collateral.
             # This is moved as "free" into the stake currency balance.
@@ -158,23 +157,167 @@ class Wallets:
                     continue
                 rate = self._exchange.get_conversion_rate(curr, self._stake_currency)
                 if rate:
-                    cross_margin += bal * rate
+                    self._cross_margin += bal * rate
+
+        self._wallets = {}
+        for currency in self._currency_balances:
+            self._update_currency_wallet(currency)
+        self._update_stake_wallet()
+        for currency, bal in self._start_cap.items():
+            if currency not in self._wallets:
+                self._wallets[currency] = Wallet(currency, bal, 0, bal)
+
+    def _trade_balance(self, trade: LocalTrade) -> _TradeBalance:
+        """
+        Calculate the contribution of one open trade to the dry-run wallets.
+        """
+        if self._config.get("trading_mode", "spot") != TradingMode.FUTURES:
+            return _TradeBalance(
+                currency=self._exchange.get_pair_base_currency(trade.pair),
+                amount=trade.amount,
+                pending=sum(
+                    o.amount
+                    for o in trade.open_orders
+                    if o.amount and o.ft_order_side == trade.exit_side
+                ),
+                stake_amount=trade.stake_amount,
+                used_stake=sum(
+                    o.stake_amount for o in trade.open_orders if o.ft_order_side == trade.entry_side
+                ),
+                realized_profit=trade.realized_profit,
+            )
+        return _TradeBalance(
+            currency=None,
+            amount=trade.amount,
+            pending=0.0,
+            stake_amount=trade.stake_amount,
+            used_stake=trade.stake_amount,
+            realized_profit=trade.realized_profit,
+        )
 
-        current_stake = self._start_cap.get(self._stake_currency, 0) + tot_profit - tot_in_trades
-        total_stake = current_stake + used_stake
+    @staticmethod
+    def _position_wallet(trade: LocalTrade) -> PositionWallet:
+        return PositionWallet(
+            trade.pair,
+            position=trade.amount,
+            leverage=trade.leverage,
+            collateral=trade.stake_amount,
+            side=trade.trade_direction,
+        )
 
-        _wallets[self._stake_currency] = Wallet(
+    def _add_currency_balance(self, currency: str, bal: _TradeBalance, sign: int) -> None:
+        """
+        Add (sign=1) or remove (sign=-1) a trade's amounts to / from its currency balance.
+        """
+        trades, amount, pending = self._currency_balances.get(currency, (0, 0.0, 0.0))
+        trades += sign
+        if trades == 0:
+            # Last trade in this currency - reset to avoid carrying rounding errors
+            del self._currency_balances[currency]
+        else:
+            self._currency_balances[currency] = (
+                trades,
+                amount + sign * bal.amount,
+                pending + sign * bal.pending,
+            )
+
+    def _update_currency_wallet(self, currency: str) -> None:
+        curr_wallet_bal = self._start_cap.get(currency, 0)
+        if currency in self._currency_balances:
+            _, amount, pending = self._currency_balances[currency]
+            self._wallets[currency] = Wallet(
+                currency,
+                curr_wallet_bal + amount - pending,
+                pending,
+                amount + curr_wallet_bal,
+            )
+        elif currency in self._start_cap:
+            self._wallets[currency] = Wallet(currency, curr_wallet_bal, 0, curr_wallet_bal)
+        else:
+            self._wallets.pop(currency, None)
+
+    def _update_stake_wallet(self) -> None:
+        if not self._is_backtest:
+            # Live / Dry-run mode
+            tot_profit = Trade.get_total_closed_profit()
+        else:
+            # Backtest mode
+            tot_profit = LocalTrade.bt_total_profit
+        tot_profit += self._open_profit
+
+        current_stake = (
+            self._start_cap.get(self._stake_currency, 0) + tot_profit - self._open_stake
+        )
+        total_stake = current_stake + self._open_used
+
+        self._wallets[self._stake_currency] = Wallet(
             currency=self._stake_currency,
-            free=current_stake + cross_margin,
-            used=used_stake,
+            free=current_stake + self._cross_margin,
+            used=self._open_used,
             total=total_stake,
         )
-        for currency, bal in self._start_cap.items():
-            if currency not in _wallets:
-                _wallets[currency] = Wallet(currency, bal, 0, bal)
 
-        self._wallets = _wallets
-        self._positions = _positions
+    def update_trade(self, trade: LocalTrade) -> None:
+        """
+        Apply the changes of a single trade (order filled or cancelled, trade closed or removed)
+        to the wallets - instead of recalculating all open trades.
+        Only supported in backtesting - other modes fall back to a full update().
+        Every LEDGER_RECONCILE_INTERVAL calls, the wallets are recalculated from all open
+        trades, and differences to the incrementally updated balance are logged.
+        :param trade: Trade which changed
+        """
+        if not self._is_backtest:
+            self.update()
+            return
+
+        changed: list[_TradeBalance] = []
+        if (old_bal := self._trade_balances.pop(trade, None)) is not None:
+            self._apply_trade_balance(old_bal, -1)
+            changed.append(old_bal)
+        if trade.is_open and trade in LocalTrade.bt_trades_open_pp[trade.pair]:
+            new_bal = self._trade_balance(trade)
+            self._trade_balances[trade] = new_bal
+            self._apply_trade_balance(new_bal, 1)
+            changed.append(new_bal)
+            if self._config.get("trading_mode", "spot") == TradingMode.FUTURES:
+                self._positions[trade.pair] = self._position_wallet(trade)
+        else:
+            self._positions.pop(trade.pair, None)
+            if not self._trade_balances:
+                # No open trades left - reset to avoid carrying rounding errors
+                self._open_profit = self._open_stake = self._open_used = 0.0
+
+        for currency in {bal.currency for bal in changed if bal.currency is not None}:
+            self._update_currency_wallet(currency)
+        self._update_stake_wallet()
+
+        self._ledger_updates += 1
+        if self._ledger_updates >= LEDGER_RECONCILE_INTERVAL:
+            self._reconcile_ledger()
+
+    def _apply_trade_balance(self, bal: _TradeBalance, sign: int) -> None:
+        self._open_profit += sign * bal.realized_profit
+        self._open_stake += sign * bal.stake_amount
+        self._open_used += sign * bal.used_stake
+        if bal.currency is not None:
+            self._add_currency_balance(bal.currency, bal, sign)
+
+    def _reconcile_ledger(self) -> None:
+        """
+        Recalculate the wallets from all open trades, and compare the result with the
+        incrementally updated stake currency balance.
+        """
+        ledger_wallet = self._wallets[self._stake_currency]
+        self._update_dry()
+        wallet = self._wallets[self._stake_currency]
+        if not (
+            isclose(ledger_wallet.free, wallet.free, rel_tol=1e-9, abs_tol=1e-9)
+            and isclose(ledger_wallet.total, wallet.total, rel_tol=1e-9, abs_tol=1e-9)
+        ):
+            logger.warning(
+                f"Wallet ledger out of sync: {ledger_wallet} != {wallet}. "
+                "Using recalculated balance."
+            )
 
     def _update_live(self) -> None:
         balances = self._exchange.get_balances()
@@ -3,14 +3,24 @@ Green Rat - Agente de Análise Técnica (Chart Agent)
 Responsável por analisar gráficos e indicadores técnicos
 """
 import logging
+import math
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import config
 from llm_client import llm_client
+from rule_engine import score_signals
 
 logger = logging.getLogger(__name__)
 
+LLM_MODEL = "anthropic/claude-3.5-sonnet"
+SYSTEM_PROMPT = ("Você é um analista técnico especializado em criptomoedas. "
+                 "Analise os indicadores e responda apenas: LONG, SHORT ou HOLD, "
+                 "seguido da razão.")
+# Indicadores que compõem o snapshot usado como chave de cache
+SNAPSHOT_FIELDS = ['close', 'rsi', 'macd', 'macd_signal', 'macd_diff', 'ema_short', 'ema_long',
+                   'bb_upper', 'bb_middle', 'bb_lower', 'volume', 'volume_sma']
+
 
 class GreenRat:
     """Agente de Análise Técnica"""
@@ -34,46 +44,126 @@ class GreenRat:
             if dataframe.empty:
                 return self._no_signal("DataFrame vazio")
             
-            # Pegar última linha de dados
-            current = dataframe.iloc[-1]
-            
-            # Calcular indicadores se não existirem
-            if 'rsi' not in dataframe.columns:
-                dataframe = self._calculate_indicators(dataframe)
-                current = dataframe.iloc[-1]
+            messages, cache_key = self._prepare_request(dataframe, pair)
             
-            # Criar mensagem para análise
-            analysis_message = self._create_analysis_message(current, pair)
-            
-            # Tentar usar LLM primeiro
+            # Tentar usar LLM primeiro (respostas memoizadas pelo snapshot dos indicadores)
             llm_response = llm_client.chat(
-                model="anthropic/claude-3.5-sonnet",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "Você é um analista técnico especializado em criptomoedas. "
-                                   "Analise os indicadores e responda apenas: LONG, SHORT ou HOLD, "
-                                   "seguido da razão."
-                    },
-                    {
-                        "role": "user",
-                        "content": analysis_message
-                    }
-                ]
+                model=LLM_MODEL,
+                messages=messages,
+                cache_key=cache_key
             )
-            
-            # Processar resposta
-            if llm_response:
-                signal = self._parse_signal(llm_response)
-                self.logger.info(f"{pair}: {signal['action']} (Confiança: {signal['confidence']:.2f})")
-                return signal
-            else:
-                return self._no_signal("LLM não disponível e fallback falhou")
+            return self._process_response(llm_response, pair)
                 
         except Exception as e:
             self.logger.error(f"Erro na análise: {str(e)}")
             return self._no_signal(f"Erro: {str(e)}")
     
+    def analyze_batch(self, dataframes: Dict[str, pd.DataFrame],
+                      deadline: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Analisa vários pares em paralelo
+        
+        Args:
+            dataframes: DataFrame com OHLCV (e indicadores) por par
+            deadline: Tempo máximo (segundos) para todos os pares. Pares sem resposta
+                do LLM até lá usam a análise rule-based.
+            
+        Returns:
+            Dict com o sinal por par
+        """
+        signals: Dict[str, Dict] = {}
+        batch: Dict[str, List[Dict]] = {}
+        cache_keys: Dict[str, Tuple] = {}
+        for pair, dataframe in dataframes.items():
+            if dataframe.empty:
+                signals[pair] = self._no_signal("DataFrame vazio")
+                continue
+            try:
+                batch[pair], cache_keys[pair] = self._prepare_request(dataframe, pair)
+            except Exception as e:
+                self.logger.error(f"Erro na análise de {pair}: {str(e)}")
+                signals[pair] = self._no_signal(f"Erro: {str(e)}")
+        
+        if batch:
+            responses = llm_client.chat_batch(
+                model=LLM_MODEL,
+                batch=batch,
+                cache_keys=cache_keys,
+                deadline=deadline
+            )
+            for pair, llm_response in responses.items():
+                signals[pair] = self._process_response(llm_response, pair)
+        return signals
+    
+    def analyze_history(self, dataframe: pd.DataFrame, rsi_oversold: Optional[float] = None,
+                        rsi_overbought: Optional[float] = None) -> pd.DataFrame:
+        """
+        Analisa todos os candles de uma vez com o motor de regras vetorizado
+        (sem chamadas ao LLM) - usado para candles históricos, backtesting e hyperopt
+        
+        Args:
+            dataframe: DataFrame com OHLCV e indicadores
+            rsi_oversold: Limite de sobrevenda (padrão: config.RSI_OVERSOLD)
+            rsi_overbought: Limite de sobrecompra (padrão: config.RSI_OVERBOUGHT)
+            
+        Returns:
+            DataFrame (mesmo índice) com action (LONG / SHORT / HOLD) e confidence por candle
+        """
+        if 'rsi' not in dataframe.columns:
+            dataframe = self._calculate_indicators(dataframe)
+        return score_signals(dataframe, rsi_oversold, rsi_overbought)
+    
+    def _prepare_request(self, dataframe: pd.DataFrame, pair: str) -> Tuple[List[Dict], Tuple]:
+        """Cria mensagens para o LLM e a chave de cache do snapshot atual"""
+        # Calcular indicadores se não existirem
+        if 'rsi' not in dataframe.columns:
+            dataframe = self._calculate_indicators(dataframe)
+        
+        # Pegar última linha de dados
+        current = dataframe.iloc[-1]
+        messages = [
+            {
+                "role": "system",
+                "content": SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": self._create_analysis_message(current, pair)
+            }
+        ]
+        return messages, self._snapshot_key(current, pair)
+    
+    def _process_response(self, llm_response: Optional[str], pair: str) -> Dict:
+        """Processa resposta do LLM"""
+        if llm_response:
+            signal = self._parse_signal(llm_response)
+            self.logger.info(f"{pair}: {signal['action']} (Confiança: {signal['confidence']:.2f})")
+            return signal
+        return self._no_signal("LLM não disponível e fallback falhou")
+    
+    def _snapshot_key(self, current: pd.Series, pair: str) -> Tuple:
+        """
+        Snapshot quantizado dos indicadores (3 dígitos significativos, RSI inteiro)
+        Candles com indicadores praticamente iguais reutilizam a mesma resposta do LLM.
+        """
+        values = []
+        for field in SNAPSHOT_FIELDS:
+            value = current.get(field, 0)
+            if value is None or pd.isna(value):
+                values.append(None)
+            elif field == 'rsi':
+                values.append(round(float(value)))
+            else:
+                values.append(self._quantize(float(value)))
+        return (pair, *values)
+    
+    @staticmethod
+    def _quantize(value: float, digits: int = 3) -> float:
+        """Arredonda para o número de dígitos significativos"""
+        if value == 0 or not math.isfinite(value):
+            return value
+        return round(value, digits - 1 - int(math.floor(math.log10(abs(value)))))
+    
     def _calculate_indicators(self, dataframe: pd.DataFrame) -> pd.DataFrame:
         """Calcula indicadores técnicos"""
         df = dataframe.copy()
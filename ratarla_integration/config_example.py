@@ -38,6 +38,10 @@ FREQTRADE_PASSWORD = "sua_senha_freqtrade"
 OPENROUTER_API_KEY = "sua_openrouter_api_key_ou_deixe_vazio"
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 USE_LLM_FALLBACK = True  # Se True, usa análise rule-based quando LLM falhar
+LLM_TIMEOUT = 30  # Timeout (segundos) de cada requisição
+LLM_MAX_CONCURRENCY = 8  # Requisições simultâneas (tamanho do pool de conexões)
+LLM_CACHE_SIZE = 1024  # Respostas memoizadas (LRU)
+LLM_CACHE_TTL = 300  # Validade (segundos) das respostas memoizadas
 
 # ===========================
 # TWITTER API (Opcional)
@@ -3,10 +3,16 @@ Cliente LLM com Fallback Rule-Based
 Integra OpenRouter com análise técnica tradicional como backup
 """
 import logging
+import threading
 import requests
 import re
-from typing import List, Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Hashable, List, Dict, Optional
+import pandas as pd
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
 import config
+from rule_engine import score_signals, signal_reasons
 
 logger = logging.getLogger(__name__)
 
@@ -18,13 +24,109 @@ class LLMClient:
         self.api_key = config.OPENROUTER_API_KEY
         self.api_url = config.OPENROUTER_API_URL
         self.use_fallback = config.USE_LLM_FALLBACK
+        self.timeout = getattr(config, "LLM_TIMEOUT", 30)
+        self.max_workers = getattr(config, "LLM_MAX_CONCURRENCY", 8)
+        
+        # Sessão HTTP com pool de conexões (reutiliza conexões TLS entre requisições)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="llm_client")
+        
+        # Cache LRU com TTL das respostas, chaveado pelo snapshot quantizado dos indicadores
+        self._cache = TTLCache(maxsize=getattr(config, "LLM_CACHE_SIZE", 1024),
+                               ttl=getattr(config, "LLM_CACHE_TTL", 300))
+        self._cache_lock = threading.Lock()
+        # Requisições em andamento - evita chamadas duplicadas para a mesma chave
+        self._pending: Dict[Hashable, Future] = {}
         
     def chat(self, model: str, messages: List[Dict], temperature: float = 0.7, 
-             max_tokens: int = 2000) -> Optional[str]:
+             max_tokens: int = 2000, cache_key: Optional[Hashable] = None,
+             timeout: Optional[float] = None) -> Optional[str]:
         """
         Envia requisição para OpenRouter LLM
         Se falhar, usa análise rule-based como fallback
+        
+        Args:
+            cache_key: Chave para memoizar a resposta (ex: snapshot quantizado dos indicadores)
+            timeout: Timeout da requisição em segundos (padrão: LLM_TIMEOUT)
         """
+        if cache_key is not None:
+            cached = self._get_cached(model, cache_key)
+            if cached is not None:
+                return cached
+        return self._chat_request(model, messages, temperature, max_tokens, cache_key,
+                                  timeout or self.timeout)
+    
+    def chat_batch(self, model: str, batch: Dict[Hashable, List[Dict]],
+                   cache_keys: Optional[Dict[Hashable, Hashable]] = None,
+                   deadline: Optional[float] = None, temperature: float = 0.7,
+                   max_tokens: int = 2000) -> Dict[Hashable, Optional[str]]:
+        """
+        Envia várias requisições em paralelo (pool de threads + sessão HTTP compartilhada)
+        
+        Args:
+            batch: Mensagens por identificador (ex: par de trading)
+            cache_keys: Chave de cache por identificador
+            deadline: Tempo máximo (segundos) para o lote inteiro. Requisições que não
+                terminarem a tempo usam a análise rule-based - e continuam em segundo plano,
+                preenchendo o cache para o próximo ciclo.
+            
+        Returns:
+            Dict com a resposta por identificador
+        """
+        cache_keys = cache_keys or {}
+        deadline = deadline or self.timeout
+        results: Dict[Hashable, Optional[str]] = {}
+        futures: Dict[Hashable, Future] = {}
+        
+        for ident, messages in batch.items():
+            cache_key = cache_keys.get(ident)
+            if cache_key is not None:
+                cached = self._get_cached(model, cache_key)
+                if cached is not None:
+                    results[ident] = cached
+                    continue
+            futures[ident] = self._submit(model, messages, temperature, max_tokens, cache_key)
+        
+        if futures:
+            wait(futures.values(), timeout=deadline)
+        for ident, future in futures.items():
+            if future.done():
+                results[ident] = future.result()
+            else:
+                logger.warning(f"Deadline de {deadline}s excedido para {ident} - "
+                               "usando análise rule-based")
+                results[ident] = (self._fallback_analysis(batch[ident])
+                                  if self.use_fallback else None)
+        return results
+    
+    def _submit(self, model: str, messages: List[Dict], temperature: float, max_tokens: int,
+                cache_key: Optional[Hashable]) -> Future:
+        """Agenda uma requisição no pool - reutilizando requisições em andamento"""
+        if cache_key is None:
+            return self._executor.submit(self._chat_request, model, messages, temperature,
+                                         max_tokens, None, self.timeout)
+        with self._cache_lock:
+            future = self._pending.get((model, cache_key))
+            if future is None:
+                future = self._executor.submit(self._chat_request, model, messages,
+                                               temperature, max_tokens, cache_key, self.timeout)
+                self._pending[(model, cache_key)] = future
+                future.add_done_callback(
+                    lambda _: self._pending.pop((model, cache_key), None))
+        return future
+    
+    def _get_cached(self, model: str, cache_key: Hashable) -> Optional[str]:
+        with self._cache_lock:
+            return self._cache.get((model, cache_key))
+    
+    def _chat_request(self, model: str, messages: List[Dict], temperature: float,
+                      max_tokens: int, cache_key: Optional[Hashable],
+                      timeout: float) -> Optional[str]:
+        """Requisição (bloqueante) para o OpenRouter"""
         try:
             headers = {
                 "Authorization": f"Bearer {self.api_key}",
@@ -38,11 +140,11 @@ class LLMClient:
                 "max_tokens": max_tokens
             }
             
-            response = requests.post(
+            response = self.session.post(
                 self.api_url,
                 headers=headers,
                 json=payload,
-                timeout=30
+                timeout=timeout
             )
             
             # Se receber 402 (Payment Required), usar fallback
@@ -54,7 +156,12 @@ class LLMClient:
             result = response.json()
             
             if 'choices' in result and len(result['choices']) > 0:
-                return result['choices'][0]['message']['content']
+                content = result['choices'][0]['message']['content']
+                # Apenas respostas do LLM são memoizadas - o fallback é barato
+                if cache_key is not None and content:
+                    with self._cache_lock:
+                        self._cache[(model, cache_key)] = content
+                return content
             else:
                 logger.error("Resposta LLM sem conteúdo")
                 return self._fallback_analysis(messages)
@@ -74,53 +181,27 @@ class LLMClient:
         
         # Extrair indicadores da mensagem
         analysis = {
-            'rsi': self._extract_number(last_message, r'RSI[:\s]+([0-9.]+)'),
+            'rsi': self._extract_number(last_message, r'RSI(?:\(\d+\))?[:\s]+([0-9.]+)'),
             'macd': self._extract_number(last_message, r'MACD[:\s]+(-?[0-9.]+)'),
-            'ema_short': self._extract_number(last_message, r'EMA.*?9[:\s]+([0-9.]+)'),
-            'ema_long': self._extract_number(last_message, r'EMA.*?21[:\s]+([0-9.]+)'),
-            'price': self._extract_number(last_message, r'Pre[çc]o[:\s]+([0-9.]+)'),
+            'ema_short': self._extract_number(last_message, r'EMA\W*9\)?[:\s]+([0-9.]+)'),
+            'ema_long': self._extract_number(last_message, r'EMA\W*21\)?[:\s]+([0-9.]+)'),
+            'close': self._extract_number(last_message, r'Pre[çc]o(?: Atual)?[:\s]+([0-9.]+)'),
+            'bb_upper': self._extract_number(last_message, r'BB Upper[:\s]+([0-9.]+)'),
+            'bb_lower': self._extract_number(last_message, r'BB Lower[:\s]+([0-9.]+)'),
         }
         
-        # Lógica de decisão baseada em regras
-        signals = []
-        
-        # RSI Analysis
-        if analysis['rsi']:
-            if analysis['rsi'] < config.RSI_OVERSOLD:
-                signals.append(("LONG", "RSI oversold", 0.8))
-            elif analysis['rsi'] > config.RSI_OVERBOUGHT:
-                signals.append(("SHORT", "RSI overbought", 0.8))
-            else:
-                signals.append(("HOLD", "RSI neutral", 0.3))
-        
-        # MACD Analysis
-        if analysis['macd']:
-            if analysis['macd'] > 0:
-                signals.append(("LONG", "MACD positive", 0.6))
-            else:
-                signals.append(("SHORT", "MACD negative", 0.6))
+        # Lógica de decisão baseada em regras (mesmo motor usado no backtesting)
+        row = score_signals(pd.DataFrame([analysis], dtype=float)).iloc[0]
         
-        # EMA Crossover
-        if analysis['ema_short'] and analysis['ema_long']:
-            if analysis['ema_short'] > analysis['ema_long']:
-                signals.append(("LONG", "EMA bullish crossover", 0.7))
-            else:
-                signals.append(("SHORT", "EMA bearish crossover", 0.7))
-        
-        # Consolidar sinais
-        if not signals:
+        if not row['has_signal']:
             return "HOLD - Dados insuficientes para análise"
         
-        # Calcular confiança ponderada
-        long_score = sum(weight for action, _, weight in signals if action == "LONG")
-        short_score = sum(weight for action, _, weight in signals if action == "SHORT")
-        
-        if long_score > short_score and long_score > 1.0:
-            reasons = [reason for action, reason, _ in signals if action == "LONG"]
-            return f"LONG (Confiança: {long_score:.2f}) - Razões: {', '.join(reasons)}"
-        elif short_score > long_score and short_score > 1.0:
-            reasons = [reason for action, reason, _ in signals if action == "SHORT"]
-            return f"SHORT (Confiança: {short_score:.2f}) - Razões: {', '.join(reasons)}"
+        if row['action'] == 'LONG':
+            reasons = signal_reasons(row, 'LONG')
+            return f"LONG (Confiança: {row['long_score']:.2f}) - Razões: {', '.join(reasons)}"
+        elif row['action'] == 'SHORT':
+            reasons = signal_reasons(row, 'SHORT')
+            return f"SHORT (Confiança: {row['short_score']:.2f}) - Razões: {', '.join(reasons)}"
         else:
             return "HOLD - Sinais conflitantes ou fracos"
     
@@ -0,0 +1,116 @@
+"""
+Motor de Regras Vetorizado
+Pontua sinais de RSI, MACD, EMA e Bollinger sobre colunas inteiras do DataFrame
+(usado em backtesting/hyperopt e como fallback quando o LLM não está disponível)
+"""
+import numpy as np
+import pandas as pd
+from typing import List, Optional
+import config
+
+# Peso de cada regra no score final
+RSI_WEIGHT = 0.8
+MACD_WEIGHT = 0.6
+EMA_WEIGHT = 0.7
+BOLLINGER_WEIGHT = 0.5
+# Score mínimo para gerar LONG / SHORT
+MIN_SCORE = 1.0
+# Confiança atribuída a HOLD (igual ao parsing de respostas HOLD no Green Rat)
+HOLD_CONFIDENCE = 0.5
+
+# Razões por regra: (coluna, LONG, SHORT)
+REASONS = [
+    ('rsi_signal', "RSI oversold", "RSI overbought"),
+    ('macd_signal', "MACD positive", "MACD negative"),
+    ('ema_signal', "EMA bullish crossover", "EMA bearish crossover"),
+    ('bollinger_signal', "Price below lower Bollinger band", "Price above upper Bollinger band"),
+]
+
+
+def _column(dataframe: pd.DataFrame, name: str) -> np.ndarray:
+    """Coluna como array float - NaN se não existir"""
+    if name not in dataframe.columns:
+        return np.full(len(dataframe), np.nan)
+    return pd.to_numeric(dataframe[name], errors='coerce').to_numpy(dtype=float)
+
+
+def _available(*values: np.ndarray) -> np.ndarray:
+    """Valores presentes e diferentes de zero (equivalente ao teste de veracidade original)"""
+    mask = np.ones(len(values[0]), dtype=bool)
+    for value in values:
+        mask &= ~np.isnan(value) & (value != 0)
+    return mask
+
+
+def score_signals(dataframe: pd.DataFrame, rsi_oversold: Optional[float] = None,
+                  rsi_overbought: Optional[float] = None) -> pd.DataFrame:
+    """
+    Pontua todas as linhas do DataFrame de uma vez
+
+    Args:
+        dataframe: DataFrame com indicadores (rsi, macd, ema_short, ema_long,
+            close, bb_upper, bb_lower) - colunas ausentes são ignoradas
+        rsi_oversold: Limite de sobrevenda (padrão: config.RSI_OVERSOLD)
+        rsi_overbought: Limite de sobrecompra (padrão: config.RSI_OVERBOUGHT)
+
+    Returns:
+        DataFrame (mesmo índice) com o sinal de cada regra (1 = LONG, -1 = SHORT,
+        0 = neutro, NaN = sem dados), long_score, short_score, has_signal,
+        action (LONG / SHORT / HOLD) e confidence
+    """
+    rsi_oversold = config.RSI_OVERSOLD if rsi_oversold is None else rsi_oversold
+    rsi_overbought = config.RSI_OVERBOUGHT if rsi_overbought is None else rsi_overbought
+
+    rsi = _column(dataframe, 'rsi')
+    macd = _column(dataframe, 'macd')
+    ema_short = _column(dataframe, 'ema_short')
+    ema_long = _column(dataframe, 'ema_long')
+    close = _column(dataframe, 'close')
+    bb_upper = _column(dataframe, 'bb_upper')
+    bb_lower = _column(dataframe, 'bb_lower')
+
+    has_rsi = _available(rsi)
+    has_macd = _available(macd)
+    has_ema = _available(ema_short, ema_long)
+    has_bollinger = _available(close, bb_upper, bb_lower)
+
+    result = pd.DataFrame(index=dataframe.index)
+    result['rsi_signal'] = np.select(
+        [has_rsi & (rsi < rsi_oversold), has_rsi & (rsi > rsi_overbought), has_rsi],
+        [1.0, -1.0, 0.0], np.nan)
+    result['macd_signal'] = np.where(has_macd, np.where(macd > 0, 1.0, -1.0), np.nan)
+    result['ema_signal'] = np.where(has_ema, np.where(ema_short > ema_long, 1.0, -1.0), np.nan)
+    result['bollinger_signal'] = np.select(
+        [has_bollinger & (close < bb_lower), has_bollinger & (close > bb_upper), has_bollinger],
+        [1.0, -1.0, 0.0], np.nan)
+
+    weights = {
+        'rsi_signal': RSI_WEIGHT,
+        'macd_signal': MACD_WEIGHT,
+        'ema_signal': EMA_WEIGHT,
+        'bollinger_signal': BOLLINGER_WEIGHT,
+    }
+    long_score = np.zeros(len(result))
+    short_score = np.zeros(len(result))
+    for column, weight in weights.items():
+        signal = result[column].to_numpy()
+        long_score += np.where(signal == 1, weight, 0.0)
+        short_score += np.where(signal == -1, weight, 0.0)
+
+    result['long_score'] = long_score
+    result['short_score'] = short_score
+    result['has_signal'] = has_rsi | has_macd | has_ema | has_bollinger
+    is_long = (long_score > short_score) & (long_score > MIN_SCORE)
+    is_short = (short_score > long_score) & (short_score > MIN_SCORE)
+    result['action'] = np.select([is_long, is_short], ['LONG', 'SHORT'], 'HOLD')
+    result['confidence'] = np.select([is_long, is_short], [long_score, short_score],
+                                     HOLD_CONFIDENCE)
+    return result
+
+
+def signal_reasons(row: pd.Series, action: str) -> List[str]:
+    """Razões das regras que apontam para a ação (linha de score_signals)"""
+    direction = 1 if action == 'LONG' else -1
+    return [long_reason if direction == 1 else short_reason
+            for column, long_reason, short_reason in REASONS
+            if row[column] == direction]
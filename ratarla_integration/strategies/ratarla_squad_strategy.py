@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Optional
 import pandas as pd
 from pandas import DataFrame
+from freqtrade.enums import RunMode
 from freqtrade.strategy import IStrategy, CategoricalParameter, DecimalParameter, IntParameter
 import talib.abstract as ta
 
@@ -71,16 +72,41 @@ class RatarlASquadStrategy(IStrategy):
     
     confidence_threshold = DecimalParameter(0.5, 0.9, default=0.7, space='buy')
     
+    # Tempo máximo (segundos) para a análise do Green Rat de todos os pares em um ciclo
+    llm_deadline = 20
+    
     def __init__(self, config: dict) -> None:
         super().__init__(config)
         
         # Inicializar agentes
         self.green_rat = GreenRat() if GreenRat else None
         self.yellow_rat = YellowRat() if YellowRat else None
+        # Sinais do Green Rat pré-calculados no início do ciclo: par -> (data do candle, sinal)
+        self._green_signals: dict = {}
         
         self.logger = logging.getLogger(__name__)
         self.logger.info("🐀 RatarlA Squad Strategy Inicializada!")
     
+    def bot_loop_start(self, current_time: datetime, **kwargs) -> None:
+        """
+        Analisa todos os pares da whitelist em paralelo no início de cada ciclo,
+        limitado por um único deadline - em vez de uma requisição bloqueante por par
+        dentro de populate_entry_trend.
+        """
+        self._green_signals = {}
+        if not self.green_rat or self.dp.runmode not in (RunMode.LIVE, RunMode.DRY_RUN):
+            return
+        
+        dataframes = {}
+        for pair in self.dp.current_whitelist():
+            dataframe = self.dp.ohlcv(pair, self.timeframe, copy=False)
+            if not dataframe.empty:
+                dataframes[pair] = dataframe
+        
+        signals = self.green_rat.analyze_batch(dataframes, deadline=self.llm_deadline)
+        for pair, signal in signals.items():
+            self._green_signals[pair] = (dataframes[pair]['date'].iloc[-1], signal)
+    
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         Adiciona todos os indicadores técnicos necessários
@@ -152,16 +178,33 @@ class RatarlASquadStrategy(IStrategy):
         # Usar análise dos agentes
         try:
             pair = metadata['pair']
+            threshold = self.confidence_threshold.value
+            
+            # Candles históricos: motor de regras vetorizado do Green Rat (sem LLM),
+            # para que a estratégia possa ser usada em backtesting e hyperopt
+            history = self.green_rat.analyze_history(
+                dataframe, self.rsi_oversold.value, self.rsi_overbought.value)
+            confident = history['confidence'] >= threshold
+            dataframe.loc[confident & (history['action'] == 'LONG'), 'enter_long'] = 1
+            dataframe.loc[confident & (history['action'] == 'SHORT'), 'enter_short'] = 1
+            
+            if self.dp.runmode not in (RunMode.LIVE, RunMode.DRY_RUN):
+                return dataframe
             
-            # Análise do Green Rat (Análise Técnica)
-            signal = self.green_rat.analyze(dataframe, pair)
+            # Último candle (ao vivo): análise do Green Rat com LLM - pré-calculada em
+            # bot_loop_start
+            last = dataframe.index[-1]
+            dataframe.loc[last, ['enter_long', 'enter_short']] = 0
+            candle_date, signal = self._green_signals.get(pair, (None, None))
+            if signal is None or candle_date != dataframe['date'].iloc[-1]:
+                signal = self.green_rat.analyze(dataframe, pair)
             
-            if signal['confidence'] >= self.confidence_threshold.value:
+            if signal['confidence'] >= threshold:
                 if signal['action'] == 'LONG':
-                    dataframe.loc[dataframe.index[-1], 'enter_long'] = 1
+                    dataframe.loc[last, 'enter_long'] = 1
                     self.logger.info(f"🟢 {pair} LONG Signal: {signal['reason']}")
                 elif signal['action'] == 'SHORT':
-                    dataframe.loc[dataframe.index[-1], 'enter_short'] = 1
+                    dataframe.loc[last, 'enter_short'] = 1
                     self.logger.info(f"🔴 {pair} SHORT Signal: {signal['reason']}")
         
         except Exception as e:
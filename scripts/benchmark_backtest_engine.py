@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Compare memory usage and wall time of the "lists" and "columnar" backtest data representations.
+
+Uses synthetic analyzed candles, converts them with both engines and walks every candle
+the way Backtesting.time_pair_generator() does.
+
+Usage:
+    python scripts/benchmark_backtest_engine.py --pairs 200 --candles 315000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from freqtrade.optimize.backtest_columnar import ColumnarPairData
+from freqtrade.optimize.backtesting import HEADERS, LONG_IDX
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pairs", type=int, default=20, help="Number of pairs (default: 20).")
+    parser.add_argument(
+        "--candles", type=int, default=100_000, help="Candles per pair (default: 100000)."
+    )
+    parser.add_argument(
+        "--signal-ratio",
+        type=float,
+        default=0.01,
+        help="Ratio of candles with an entry signal (default: 0.01).",
+    )
+    return parser.parse_args()
+
+
+def generate_analyzed_df(candles: int, signal_ratio: float, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, candles))
+    spread = np.abs(rng.normal(0, 0.2, candles))
+    enter_long = (rng.random(candles) < signal_ratio).astype(float)
+    return pd.DataFrame(
+        {
+            "date": pd.date_range("2020-01-01", periods=candles, freq="5min", tz="UTC"),
+            "open": close,
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "enter_long": enter_long,
+            "exit_long": (rng.random(candles) < signal_ratio).astype(float),
+            "enter_short": 0.0,
+            "exit_short": 0.0,
+            "enter_tag": np.where(enter_long == 1, "entry", None),
+            "exit_tag": None,
+        }
+    )
+
+
+def convert_lists(frames: dict[str, pd.DataFrame]) -> dict:
+    return {pair: df[HEADERS].values.tolist() for pair, df in frames.items()}
+
+
+def convert_columnar(frames: dict[str, pd.DataFrame]) -> dict:
+    return {pair: ColumnarPairData.from_dataframe(df, False) for pair, df in frames.items()}
+
+
+def walk_lists(data: dict) -> int:
+    active = 0
+    for rows in data.values():
+        for row in rows:
+            if row[LONG_IDX] == 1:
+                active += 1
+    return active
+
+
+def walk_columnar(data: dict) -> int:
+    active = 0
+    for pair_data in data.values():
+        for idx in np.flatnonzero(pair_data.trade_dirs):
+            pair_data[idx]
+            active += 1
+    return active
+
+
+def measure(name: str, frames: dict[str, pd.DataFrame], convert, walk) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    data = convert(frames)
+    converted = time.perf_counter()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    active = walk(data)
+    walked = time.perf_counter()
+
+    print(
+        f"{name:>9}: convert {converted - start:8.3f}s, walk {walked - converted:8.3f}s, "
+        f"memory {current / 1024**2:10.1f} MiB, active rows {active}"
+    )
+
+
+def main():
+    args = parse_args()
+    frames = {
+        f"PAIR{i}/USDT": generate_analyzed_df(args.candles, args.signal_ratio, seed=i)
+        for i in range(args.pairs)
+    }
+    print(f"{args.pairs} pairs x {args.candles} candles")
+    measure("lists", frames, convert_lists, walk_lists)
+    measure("columnar", frames, convert_columnar, walk_columnar)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from zipfile import ZipFile
 
 import pytest
 from pandas import DataFrame, DateOffset, Timestamp, to_datetime
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import LAST_BT_RESULT_FN
@@ -20,6 +21,7 @@ from freqtrade.data.btanalysis import (
     load_trades,
     load_trades_from_db,
 )
+from freqtrade.data.btanalysis.trade_parallelism import _expand_trade_parallelism
 from freqtrade.data.history import load_data, load_pair_history
 from freqtrade.data.metrics import (
     calculate_cagr,
@@ -37,6 +39,7 @@ from freqtrade.data.metrics import (
     create_cum_profit,
 )
 from freqtrade.exceptions import OperationalException
+from freqtrade.exchange import timeframe_to_resample_freq
 from freqtrade.util import dt_utc
 from tests.conftest import CURRENT_TEST_STRATEGY, create_mock_trades
 from tests.conftest_trades import MOCK_TRADE_COUNT
@@ -220,6 +223,22 @@ def test_analyze_trade_parallelism(testdatadir):
     assert res["open_trades"].min() == 0
 
 
+@pytest.mark.parametrize("timeframe", ["1m", "5m", "1h", "4h", "1d", "3d"])
+def test_analyze_trade_parallelism_expanded(testdatadir, timeframe):
+    bt_data = load_backtest_data(testdatadir / "backtest_results/backtest-result.json")
+    # Trades which are not aligned to candles, and trades closing on the open candle
+    bt_data.loc[0:10, "open_date"] += timedelta(minutes=2)
+    bt_data.loc[11:15, "close_date"] = bt_data.loc[11:15, "open_date"]
+    timeframe_freq = timeframe_to_resample_freq(timeframe)
+
+    res = analyze_trade_parallelism(bt_data, timeframe)
+    expected = _expand_trade_parallelism(bt_data, timeframe_freq)
+    assert_frame_equal(res, expected)
+
+    with pytest.raises(ValueError, match=r"No trades to analyze\."):
+        analyze_trade_parallelism(bt_data.iloc[0:0], timeframe)
+
+
 def test_load_trades(default_conf, mocker):
     db_mock = mocker.patch(
         "freqtrade.data.btanalysis.bt_fileutils.load_trades_from_db", MagicMock()
@@ -6,7 +6,7 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
-from pandas import DataFrame, Timestamp
+from pandas import DataFrame, Timestamp, read_parquet
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
@@ -19,9 +19,10 @@ from freqtrade.data.history.datahandlers.idatahandler import (
 )
 from freqtrade.data.history.datahandlers.jsondatahandler import JsonDataHandler, JsonGzDataHandler
 from freqtrade.data.history.datahandlers.parquetdatahandler import ParquetDataHandler
+from freqtrade.data.history.datahandlers.partitioneddatahandler import PartitionedDataHandler
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
-from tests.conftest import log_has, log_has_re
+from tests.conftest import generate_test_data, log_has, log_has_re
 
 
 def test_datahandler_ohlcv_get_pairs(testdatadir):
@@ -180,6 +181,96 @@ def test_datahandler_ohlcv_data_min_max(testdatadir):
     assert min_max[1] == datetime(2017, 11, 14, 22, 59, tzinfo=UTC)
 
 
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_ohlcv_data_min_max_metadata(mocker, testdatadir, tmp_path, datahandler):
+    ohlcv = get_datahandler(testdatadir, "feather").ohlcv_load(
+        "UNITTEST/BTC", "5m", candle_type="spot"
+    )
+    dh = get_datahandler(tmp_path, datahandler)
+    dh.ohlcv_store("UNITTEST/NEW", "5m", ohlcv, CandleType.SPOT)
+    load_spy = mocker.spy(dh, "_ohlcv_load")
+
+    min_max = dh.ohlcv_data_min_max("UNITTEST/NEW", "5m", CandleType.SPOT)
+    assert min_max == (
+        ohlcv.iloc[0]["date"].to_pydatetime(),
+        ohlcv.iloc[-1]["date"].to_pydatetime(),
+        len(ohlcv),
+    )
+    assert isinstance(min_max[0], datetime)
+    # Only metadata / the date column was read
+    assert load_spy.call_count == 0
+
+    # Empty pair
+    min_max = dh.ohlcv_data_min_max("NOPAIR/XXX", "5m", CandleType.SPOT)
+    assert min_max == (datetime.fromtimestamp(0, tz=UTC), datetime.fromtimestamp(0, tz=UTC), 0)
+
+
+def test_parquetdatahandler_ohlcv_data_min_max_no_statistics(mocker, testdatadir, tmp_path):
+    ohlcv = get_datahandler(testdatadir, "feather").ohlcv_load(
+        "UNITTEST/BTC", "5m", candle_type="spot"
+    )
+    dh = get_datahandler(tmp_path, "parquet")
+    ohlcv.to_parquet(tmp_path / "UNITTEST_NEW-5m.parquet", write_statistics=False)
+    load_spy = mocker.spy(dh, "_ohlcv_load")
+
+    assert dh.ohlcv_data_min_max("UNITTEST/NEW", "5m", CandleType.SPOT) == (
+        ohlcv.iloc[0]["date"].to_pydatetime(),
+        ohlcv.iloc[-1]["date"].to_pydatetime(),
+        len(ohlcv),
+    )
+    assert load_spy.call_count == 0
+
+
+def test_datahandler_ohlcv_data_min_max_all(mocker, testdatadir, tmp_path):
+    ohlcv = get_datahandler(testdatadir, "feather").ohlcv_load(
+        "UNITTEST/BTC", "5m", candle_type="spot"
+    )
+    dh = get_datahandler(tmp_path, "feather")
+    dh.ohlcv_store("UNITTEST/NEW", "5m", ohlcv, CandleType.SPOT)
+    dh.ohlcv_store("UNITTEST/OLD", "5m", ohlcv.iloc[:100], CandleType.SPOT)
+    paircombs = dh.ohlcv_get_available_data(tmp_path, TradingMode.SPOT)
+    min_max_spy = mocker.spy(dh, "ohlcv_data_min_max")
+
+    result = dh.ohlcv_data_min_max_all(paircombs)
+    assert min_max_spy.call_count == 2
+    assert (tmp_path / ".ohlcv_catalog.json").is_file()
+    assert sorted(result) == [
+        (
+            "UNITTEST/NEW",
+            "5m",
+            CandleType.SPOT,
+            ohlcv.iloc[0]["date"].to_pydatetime(),
+            ohlcv.iloc[-1]["date"].to_pydatetime(),
+            len(ohlcv),
+        ),
+        (
+            "UNITTEST/OLD",
+            "5m",
+            CandleType.SPOT,
+            ohlcv.iloc[0]["date"].to_pydatetime(),
+            ohlcv.iloc[99]["date"].to_pydatetime(),
+            100,
+        ),
+    ]
+
+    # Served from the catalog
+    min_max_spy.reset_mock()
+    assert dh.ohlcv_data_min_max_all(paircombs) == result
+    assert min_max_spy.call_count == 0
+
+    # Changed data is read again
+    dh.ohlcv_store("UNITTEST/OLD", "5m", ohlcv.iloc[:50], CandleType.SPOT)
+    result = dh.ohlcv_data_min_max_all(paircombs)
+    assert min_max_spy.call_count == 1
+    assert min_max_spy.call_args[0][0] == "UNITTEST/OLD"
+    assert sorted(result)[1][-1] == 50
+
+    # Broken catalog is rebuilt
+    (tmp_path / ".ohlcv_catalog.json").write_text("{")
+    assert dh.ohlcv_data_min_max_all(paircombs) == result
+    assert min_max_spy.call_count == 3
+
+
 def test_datahandler__check_empty_df(testdatadir, caplog):
     dh = JsonDataHandler(testdatadir)
     expected_text = r"Price jump in UNITTEST/USDT, 1h, spot between"
@@ -290,7 +381,9 @@ def test_jsondatahandler_trades_load(testdatadir, caplog):
     assert log_has(logmsg, caplog)
 
 
-@pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize(
+    "datahandler", [dh for dh in AVAILABLE_DATAHANDLERS if dh != "partitioned"]
+)
 def test_datahandler_ohlcv_append(
     datahandler,
     testdatadir,
@@ -391,11 +484,11 @@ def test_generic_datahandler_ohlcv_load_and_resave(
 
     # Try loading a file that exists but errors
     mocker.patch(
-        "freqtrade.data.history.datahandlers.featherdatahandler.read_feather",
+        "freqtrade.data.history.datahandlers.featherdatahandler.feather.read_table",
         side_effect=Exception("Test"),
     )
     mocker.patch(
-        "freqtrade.data.history.datahandlers.parquetdatahandler.read_parquet",
+        "freqtrade.data.history.datahandlers.parquetdatahandler.parquet.read_table",
         side_effect=Exception("Test"),
     )
     ohlcv_e = dh1.ohlcv_load("UNITTEST/NEW", timeframe, candle_type=candle_type)
@@ -403,6 +496,57 @@ def test_generic_datahandler_ohlcv_load_and_resave(
     assert log_has_re("Error loading data from", caplog)
 
 
+def test_partitioned_datahandler_ohlcv(mocker, tmp_path):
+    dh = get_datahandler(tmp_path, "partitioned")
+    # 2020-01-20 - 2020-03-10
+    ohlcv = generate_test_data("5m", 14400, "2020-01-20")
+    dh.ohlcv_store("UNITTEST/NEW", "5m", ohlcv.iloc[:-100], CandleType.SPOT)
+
+    dirname = tmp_path / "UNITTEST_NEW-5m.partitioned"
+    assert dirname.is_dir()
+    assert sorted(f.name for f in dirname.glob("*.parquet")) == [
+        "2020-01.parquet",
+        "2020-02.parquet",
+        "2020-03.parquet",
+    ]
+    assert dh.ohlcv_data_min_max("UNITTEST/NEW", "5m", CandleType.SPOT) == (
+        ohlcv.iloc[0]["date"],
+        ohlcv.iloc[-101]["date"],
+        len(ohlcv) - 100,
+    )
+    assert dh.ohlcv_get_available_data(tmp_path, TradingMode.SPOT) == [
+        ("UNITTEST/NEW", "5m", CandleType.SPOT)
+    ]
+
+    read_mock = mocker.patch(
+        "freqtrade.data.history.datahandlers.partitioneddatahandler.read_parquet",
+        wraps=read_parquet,
+    )
+    # Only the segment of the timerange is read
+    timerange = TimeRange.parse_timerange("20200205-20200210")
+    loaded = dh.ohlcv_load("UNITTEST/NEW", "5m", timerange=timerange, candle_type="spot")
+    assert read_mock.call_count == 1
+    assert loaded.iloc[0]["date"] == Timestamp("2020-02-05", tz="UTC")
+    assert loaded.iloc[-1]["date"] == Timestamp("2020-02-10", tz="UTC")
+
+    # Appending (overlapping) candles only reads and writes the last segment
+    read_mock.reset_mock()
+    write_spy = mocker.spy(DataFrame, "to_parquet")
+    dh.ohlcv_append("UNITTEST/NEW", "5m", ohlcv.iloc[-150:], CandleType.SPOT)
+    assert read_mock.call_count == 1
+    assert write_spy.call_count == 1
+    assert dh.ohlcv_data_min_max("UNITTEST/NEW", "5m", CandleType.SPOT)[1:] == (
+        ohlcv.iloc[-1]["date"],
+        len(ohlcv),
+    )
+    loaded = dh.ohlcv_load("UNITTEST/NEW", "5m", candle_type="spot")
+    assert_frame_equal(loaded, ohlcv.reset_index(drop=True), check_dtype=False)
+
+    assert dh.ohlcv_purge("UNITTEST/NEW", "5m", CandleType.SPOT)
+    assert not dirname.exists()
+    assert not dh.ohlcv_purge("UNITTEST/NEW", "5m", CandleType.SPOT)
+
+
 @pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet"])
 def test_datahandler_trades_load(testdatadir, datahandler):
     dh = get_datahandler(testdatadir, datahandler)
@@ -495,6 +639,10 @@ def test_gethandlerclass():
     assert cl == ParquetDataHandler
     assert issubclass(cl, IDataHandler)
 
+    cl = get_datahandlerclass("partitioned")
+    assert cl == PartitionedDataHandler
+    assert issubclass(cl, ParquetDataHandler)
+
     with pytest.raises(ValueError, match=r"No datahandler for .*"):
         get_datahandlerclass("DeadBeef")
 
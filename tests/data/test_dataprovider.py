@@ -1,4 +1,4 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock
 
 import pytest
@@ -7,6 +7,7 @@ from pandas import DataFrame, Timestamp
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import CandleType, RunMode
 from freqtrade.exceptions import ExchangeError, OperationalException
+from freqtrade.exchange import timeframe_to_prev_date
 from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.util import dt_utc
 from tests.conftest import EXMS, generate_test_data, get_patched_exchange
@@ -185,6 +186,28 @@ def test_get_pair_dataframe(mocker, default_conf, ohlcv_history, candle_type):
     assert len(df) == 2  # ohlcv_history is limited to 2 rows now
 
 
+def test_get_pair_dataframe_backtest_slice(mocker, default_conf):
+    history = generate_test_data("1h", 100, "2022-01-01 00:00:00+00:00")
+    historymock = MagicMock(return_value=history)
+    mocker.patch("freqtrade.data.dataprovider.load_pair_history", historymock)
+    default_conf["runmode"] = RunMode.BACKTEST
+    dp = DataProvider(default_conf, None)
+
+    for current in [
+        history["date"].iloc[0],
+        history["date"].iloc[10] + timedelta(minutes=30),
+        history["date"].iloc[50],
+        history["date"].iloc[-1] + timedelta(hours=5),
+    ]:
+        dp._set_dataframe_max_date(current)
+        df = dp.get_pair_dataframe("UNITTEST/BTC", "1h")
+        cutoff = timeframe_to_prev_date("1h", current)
+        expected = history.loc[history["date"] < cutoff]
+        assert df.equals(expected)
+    # Data is only loaded once
+    assert historymock.call_count == 1
+
+
 def test_available_pairs(mocker, default_conf, ohlcv_history):
     exchange = get_patched_exchange(mocker, default_conf)
     timeframe = default_conf["timeframe"]
@@ -302,6 +325,11 @@ def test_refresh(mocker, default_conf):
     assert len(refresh_mock.call_args[0][0]) == len(pairs) + len(pairs_non_trad)
     assert refresh_mock.call_args[0][0] == pairs + pairs_non_trad
 
+    # Pairs with open trades are refreshed first
+    refresh_mock.reset_mock()
+    dp.refresh(pairs, pairs_non_trad, priority_pairs=["UNITTEST/BTC"])
+    assert refresh_mock.call_args[0][0] == [pairs[1], pairs[0], *pairs_non_trad]
+
     # Test with public trades
     refresh_mock.reset_mock()
     refresh_mock.reset_mock()
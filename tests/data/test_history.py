@@ -30,14 +30,16 @@ from freqtrade.data.history.history_utils import (
     refresh_data,
     validate_backtest_data,
 )
-from freqtrade.enums import CandleType, TradingMode
+from freqtrade.enums import BacktestState, CandleType, TradingMode
 from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.misc import file_dump_json
+from freqtrade.optimize.bt_progress import BTProgress
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.util import dt_ts, dt_utc
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
     EXMS,
+    generate_test_data,
     get_patched_exchange,
     log_has,
     log_has_re,
@@ -384,6 +386,39 @@ def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history
     assert json_dump_mock.call_count == 3
 
 
+def test_download_pair_history_partitioned(mocker, default_conf, tmp_path) -> None:
+    exchange = get_patched_exchange(mocker, default_conf)
+    ohlcv = generate_test_data("5m", 14400, "2020-01-20")
+    get_mock = mocker.patch.object(exchange, "get_historic_ohlcv", return_value=ohlcv.iloc[:-100])
+    data_handler = get_datahandler(tmp_path, "partitioned")
+    assert _download_pair_history(
+        datadir=tmp_path,
+        exchange=exchange,
+        pair="MEME/BTC",
+        timeframe="5m",
+        candle_type=CandleType.SPOT,
+        data_handler=data_handler,
+    )
+
+    store_spy = mocker.spy(data_handler, "ohlcv_store")
+    load_spy = mocker.spy(data_handler, "_ohlcv_load")
+    get_mock.return_value = ohlcv.iloc[-150:]
+    assert _download_pair_history(
+        datadir=tmp_path,
+        exchange=exchange,
+        pair="MEME/BTC",
+        timeframe="5m",
+        candle_type=CandleType.SPOT,
+        data_handler=data_handler,
+    )
+    # New candles are appended - and only the last segment was loaded
+    assert store_spy.call_count == 0
+    assert len(load_spy.spy_return) < len(ohlcv) // 2
+    # Last stored candle is dropped as incomplete
+    assert get_mock.call_args[1]["since_ms"] == dt_ts(ohlcv.iloc[-102]["date"])
+    assert data_handler.ohlcv_data_min_max("MEME/BTC", "5m", CandleType.SPOT)[2] == len(ohlcv)
+
+
 def test_download_backtesting_data_exception(mocker, caplog, default_conf, tmp_path) -> None:
     mocker.patch(f"{EXMS}.get_historic_ohlcv", side_effect=Exception("File Error"))
     exchange = get_patched_exchange(mocker, default_conf)
@@ -437,6 +472,20 @@ def test_load_partial_missing(testdatadir, caplog) -> None:
     )
 
 
+@pytest.mark.parametrize("workers", [1, 4])
+def test_load_data_workers(testdatadir, workers) -> None:
+    pairs = ["UNITTEST/BTC", "ETH/BTC", "NOPAIR/XXX", "XLM/BTC", "ADA/BTC"]
+    progress = BTProgress()
+    progress.init_step(BacktestState.DATALOAD, len(pairs))
+    data = load_data(testdatadir, "5m", pairs, workers=workers, progress=progress)
+
+    # Pairs keep their order - missing pairs are skipped
+    assert list(data) == ["UNITTEST/BTC", "ETH/BTC", "XLM/BTC", "ADA/BTC"]
+    for pair, df in data.items():
+        assert_frame_equal(df, load_pair_history(pair, "5m", testdatadir))
+    assert progress.progress == 1
+
+
 def test_init(default_conf) -> None:
     assert {} == load_data(datadir=Path(), pairs=[], timeframe=default_conf["timeframe"])
 
@@ -828,6 +877,7 @@ def test_download_pair_history_with_pair_candles(mocker, default_conf, tmp_path,
 
     # Mock the data handler to return existing cached data
     data_handler_mock = MagicMock()
+    data_handler_mock.ohlcv_append_supported = False
     data_handler_mock.ohlcv_load.return_value = existing_data
     data_handler_mock.ohlcv_store = MagicMock()
     mocker.patch(
@@ -923,6 +973,7 @@ def test_download_pair_history_with_pair_candles_no_overlap(
 
     # Mock the data handler to return existing cached data
     data_handler_mock = MagicMock()
+    data_handler_mock.ohlcv_append_supported = False
     data_handler_mock.ohlcv_load.return_value = existing_data
     data_handler_mock.ohlcv_store = MagicMock()
     mocker.patch(
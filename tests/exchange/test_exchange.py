@@ -1,3 +1,4 @@
+import asyncio
 import copy
 import logging
 from copy import deepcopy
@@ -2823,6 +2824,53 @@ def test_refresh_latest_ohlcv_inv_result(default_conf, mocker, caplog):
     assert log_has("Async code raised an exception: TypeError()", caplog)
 
 
+async def test__run_ohlcv_dl_jobs(default_conf, mocker, caplog):
+    exchange = get_patched_exchange(mocker, default_conf)
+    exchange._ft_has["ohlcv_refresh_concurrency"] = 2
+    started = []
+
+    async def job(pair, delay, exc=None):
+        started.append(pair)
+        await asyncio.sleep(delay)
+        if exc:
+            raise exc
+        return pair, "5m", CandleType.SPOT, [], False
+
+    pairs = ["SLOW/BTC", "ETH/BTC", "XRP/BTC", "ERR/BTC", "LTC/BTC"]
+    delays = [1.0, 0.01, 0.01, 0.01, 0.01]
+    dl_jobs = [
+        (
+            (pair, "5m", CandleType.SPOT),
+            job(pair, delay, TypeError() if pair == "ERR/BTC" else None),
+        )
+        for pair, delay in zip(pairs, delays, strict=True)
+    ]
+    processed = []
+    await exchange._run_ohlcv_dl_jobs(dl_jobs, lambda res: processed.append(res[0]), 0.2)
+
+    # Jobs start in the given order
+    assert started == pairs
+    # The slow pair doesn't block the others - and times out.
+    assert processed == ["ETH/BTC", "XRP/BTC", "LTC/BTC"]
+    assert log_has_re(r"Refreshing candle .* SLOW/BTC, 5m, spot timed out after 0.2s\.", caplog)
+    assert log_has("Async code raised an exception: TypeError()", caplog)
+
+
+def test__ohlcv_refresh_concurrency(default_conf, mocker):
+    exchange = get_patched_exchange(mocker, default_conf)
+    exchange._api_async.enableRateLimit = True
+    exchange._api_async.rateLimit = 50
+    assert exchange._ohlcv_refresh_concurrency(60) == 100
+    assert exchange._ohlcv_refresh_concurrency(None) == 100
+    # Requests are started every 3 seconds - only 10 jobs can run within half the timeout
+    exchange._api_async.rateLimit = 3000
+    assert exchange._ohlcv_refresh_concurrency(60) == 10
+    assert exchange._ohlcv_refresh_concurrency(1) == 1
+    assert exchange._ohlcv_refresh_concurrency(None) == 100
+    exchange._api_async.enableRateLimit = False
+    assert exchange._ohlcv_refresh_concurrency(60) == 100
+
+
 def test_get_next_limit_in_list():
     limit_range = [5, 10, 20, 50, 100, 500, 1000]
     assert Exchange.get_next_limit_in_list(1, limit_range) == 5
@@ -3171,6 +3219,95 @@ def test_get_rates_testing_exit(
     assert api_mock.fetch_ticker.call_count == 0
 
 
+def test_prefetch_rates(default_conf, mocker, caplog) -> None:
+    caplog.set_level(logging.DEBUG)
+    default_conf["entry_pricing"]["price_side"] = "other"
+    default_conf["exit_pricing"]["price_side"] = "other"
+    exchange = get_patched_exchange(mocker, default_conf)
+    exchange._api_async.has = {"fetchTickers": True}
+    exchange._api.fetch_tickers = MagicMock(
+        return_value={
+            "ETH/BTC": {"ask": 0.051, "bid": 0.05, "last": 0.0505},
+            "LTC/BTC": {"ask": 0.011, "bid": 0.01, "last": 0.0105},
+            # No bid / ask - fetched separately for open trades
+            "XRP/BTC": {"ask": None, "bid": None, "last": 0.0002},
+            "NEO/BTC": {"ask": None, "bid": None, "last": 0.002},
+            "TKN/BTC": {"ask": 0.002, "bid": 0.001, "last": 0.0015},
+        }
+    )
+    exchange._api_async.fetch_ticker = get_mock_coro(
+        side_effect=[
+            {"ask": 0.00021, "bid": 0.0002, "last": 0.0002},
+            ccxt.NetworkError("Timeout"),
+        ]
+    )
+    exchange._api.fetch_ticker = MagicMock(return_value={"ask": 1.1, "bid": 1.0, "last": 1.05})
+
+    exchange.prefetch_rates(
+        {"XRP/BTC": True, "BTT/BTC": False, "NEO/BTC": False}, ["ETH/BTC", "LTC/BTC"]
+    )
+    assert exchange._api.fetch_tickers.call_count == 1
+    # Inactive pair (BTT/BTC) is skipped
+    assert exchange._api_async.fetch_ticker.call_count == 2
+    assert log_has_re(r"Could not prefetch pricing data for NEO/BTC.*", caplog)
+    # Rate caches are filled for all pairs with pricing data
+    assert exchange._entry_rate_cache["ETH/BTC"] == 0.051
+    assert exchange._exit_rate_cache["LTC/BTC"] == 0.01
+    # XRP/BTC is short - so entry is on the bid side
+    assert exchange._entry_rate_cache["XRP/BTC"] == 0.0002
+    assert "TKN/BTC" not in exchange._entry_rate_cache
+    assert "NEO/BTC" not in exchange._entry_rate_cache
+    assert exchange._api.fetch_ticker.call_count == 0
+
+    # Prefetched data is used without fetching the ticker again
+    assert exchange.get_rate("LTC/BTC", refresh=True, side="entry", is_short=False) == 0.011
+    assert exchange.get_rates("ETH/BTC", refresh=True, is_short=False) == (0.051, 0.05)
+    assert exchange._api.fetch_ticker.call_count == 0
+    # Pairs which could not be prefetched are fetched on demand
+    assert exchange.get_rate("NEO/BTC", refresh=True, side="entry", is_short=False) == 1.1
+    assert exchange._api.fetch_ticker.call_count == 1
+
+    exchange.clear_prefetched_rates()
+    assert exchange.get_rate("LTC/BTC", refresh=True, side="entry", is_short=False) == 1.1
+    assert exchange._api.fetch_ticker.call_count == 2
+
+
+def test_prefetch_rates_order_book(default_conf, mocker, order_book_l2) -> None:
+    default_conf["entry_pricing"].update(
+        {"price_side": "bid", "use_order_book": True, "order_book_top": 2}
+    )
+    default_conf["exit_pricing"].update({"price_side": "ask", "use_order_book": True})
+    exchange = get_patched_exchange(mocker, default_conf)
+    exchange._api_async.has = {"fetchTickers": True}
+    exchange._api_async.fetch_l2_order_book = get_mock_coro(order_book_l2.return_value)
+    exchange._api.fetch_l2_order_book = order_book_l2
+
+    exchange.prefetch_rates({"ETH/BTC": False}, ["ETH/BTC", "LTC/BTC"])
+    # Orderbooks are only fetched for open trades - and tickers are not required.
+    assert exchange._api_async.fetch_l2_order_book.call_count == 1
+    assert exchange._api_async.fetch_l2_order_book.call_args[0][0] == "ETH/BTC"
+    assert exchange._api.fetch_tickers.call_count == 0
+    assert exchange._entry_rate_cache["ETH/BTC"] == 0.043935
+    assert exchange._exit_rate_cache["ETH/BTC"] == 0.043949
+
+    assert exchange.get_rate("ETH/BTC", refresh=True, side="exit", is_short=False) == 0.043949
+    assert order_book_l2.call_count == 0
+    # Larger orderbook than prefetched
+    default_conf["exit_pricing"]["order_book_top"] = 3
+    assert exchange.get_rate("ETH/BTC", refresh=True, side="exit", is_short=False) == 0.043951
+    assert order_book_l2.call_count == 1
+
+
+def test_prefetch_rates_cache_size(default_conf, mocker) -> None:
+    exchange = get_patched_exchange(mocker, default_conf)
+    exchange.prefetch_rates({}, [f"PAIR{i}/BTC" for i in range(150)])
+    assert exchange._entry_rate_cache.maxsize == 150
+    assert exchange._exit_rate_cache.maxsize == 150
+    # Caches are not shrunk
+    exchange.prefetch_rates({}, ["ETH/BTC"])
+    assert exchange._entry_rate_cache.maxsize == 150
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 async def test___async_get_candle_history_sort(default_conf, mocker, exchange_name):
     def sort_data(data, key):
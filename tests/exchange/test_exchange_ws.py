@@ -9,6 +9,7 @@ from ccxt import NotSupported
 
 from freqtrade.enums import CandleType
 from freqtrade.exchange.exchange_ws import ExchangeWS
+from freqtrade.exchange.ws_candle_buffer import WSCandleBuffer
 from ft_client.test_client.test_rest_client import log_has_re
 
 
@@ -175,6 +176,8 @@ async def test_exchangews_get_ohlcv(mocker, caplog):
     mocker.patch("freqtrade.exchange.exchange_ws.ExchangeWS._start_forever", MagicMock())
 
     exchange_ws = ExchangeWS(config, ccxt_object)
+    exchange_ws._store_ohlcv("ETH/USDT", "1m", 1635840121000)
+    exchange_ws._store_ohlcv("ETH/USDT", "5m", 1635840601000)
     exchange_ws.klines_last_refresh = {
         ("ETH/USDT", "1m", CandleType.SPOT): 1635840120000,
         ("ETH/USDT", "5m", CandleType.SPOT): 1635840600000,
@@ -221,5 +224,47 @@ async def test_exchangews_get_ohlcv(mocker, caplog):
     assert resp[4] is True
 
     assert log_has_re(msg, caplog)
+    assert exchange_ws.klines_handoff_latency[("ETH/USDT", "1m", CandleType.SPOT)] > 0
+    # No data received for this pair (yet)
+    assert exchange_ws.ohlcvs("XRP/USDT", "1m") == []
+    assert exchange_ws.ohlcv_snapshot("XRP/USDT", "1m") is None
 
     exchange_ws.cleanup()
+
+
+def test_ws_candle_buffer():
+    buffer = WSCandleBuffer(maxlen=5)
+    empty = buffer.snapshot()
+    assert len(empty) == 0
+    assert empty.last_date == 0
+    assert empty.tolist() == []
+
+    candles = [[1635840000000 + i * 60000, i, i + 1, i - 1, i + 0.5, 10 * i] for i in range(4)]
+    buffer.update(candles, 1635840200000)
+    snapshot = buffer.snapshot()
+    assert snapshot.version == 1
+    assert snapshot.received == 1635840200000
+    assert snapshot.tolist() == candles
+    assert snapshot.last_date == candles[-1][0]
+    # Unchanged buffer - the same snapshot is returned
+    assert buffer.snapshot() is snapshot
+    assert not snapshot.values.flags.writeable
+
+    # Update of the open candle and one new candle - older candles are ignored.
+    updated = [*candles[:-1], [candles[-1][0], 3, 5, 1, 4, 50], [1635840240000, 4, 5, 3, 4, 5]]
+    buffer.update(updated, 1635840250000)
+    new_snapshot = buffer.snapshot()
+    assert new_snapshot.version == 2
+    assert new_snapshot.tolist() == updated
+    # Earlier snapshots are not modified.
+    assert snapshot.tolist() == candles
+
+    # Old candles age out
+    more = [[1635840300000 + i * 60000, i, i, i, i, i] for i in range(8)]
+    buffer.update(more, 1635840800000)
+    assert buffer.snapshot().tolist() == more[-5:]
+    buffer.update(more, 1635840800000)
+    assert buffer.snapshot().version == 4
+    more2 = [[1635840780000 + i * 60000, i, i, i, i, i] for i in range(3)]
+    buffer.update(more2, 1635840900000)
+    assert buffer.snapshot().tolist() == [*more[-2:], *more2]
@@ -0,0 +1,102 @@
+import pandas as pd
+import pytest
+
+from freqtrade.data.converter import clean_ohlcv_dataframe
+from freqtrade.exchange.kline_buffer import KlineBuffer
+from tests.conftest import generate_test_data
+
+
+def _expected(old: pd.DataFrame, new: pd.DataFrame, maxlen: int) -> pd.DataFrame:
+    # Equivalent of the regular (concat / clean / tail) refresh logic.
+    df = clean_ohlcv_dataframe(
+        pd.concat([old, new], axis=0),
+        "5m",
+        "UNITTEST/USDT",
+        fill_missing=True,
+        drop_incomplete=False,
+    )
+    return df.tail(maxlen).reset_index(drop=True)
+
+
+@pytest.mark.parametrize(
+    "new_start,new_len,drop",
+    [
+        # Overlapping candles
+        (90, 20, []),
+        # Only updating existing candles
+        (95, 5, []),
+        # Gap between buffered and new data
+        (110, 10, []),
+        # Missing candles within the new data
+        (98, 20, [3, 4, 5]),
+        # More new candles than the buffer can hold
+        (100, 150, []),
+    ],
+)
+def test_kline_buffer_update(new_start, new_len, drop) -> None:
+    maxlen = 100
+    data = generate_test_data("5m", 300, "2022-01-03 12:00:00+00:00")
+    old = data.iloc[:100].reset_index(drop=True)
+    new = data.iloc[new_start : new_start + new_len].copy()
+    # Changed values for existing candles
+    new["high"] = new["high"] * 1.01
+    new["close"] = new["close"] * 0.99
+    new = new.drop(index=new.index[drop]).reset_index(drop=True)
+
+    buffer = KlineBuffer.from_dataframe(old, "5m", maxlen)
+    assert buffer is not None
+    assert buffer.df is old
+    assert buffer.update(new, "UNITTEST/USDT")
+
+    expected = _expected(old, new, maxlen)
+    pd.testing.assert_frame_equal(buffer.df, expected, check_dtype=False)
+    assert len(buffer) == len(expected)
+
+    # Repeated updates keep working after compacting the buffer
+    newer = data.iloc[new_start + new_len : new_start + new_len + 60].reset_index(drop=True)
+    assert buffer.update(newer, "UNITTEST/USDT")
+    pd.testing.assert_frame_equal(buffer.df, _expected(expected, newer, maxlen), check_dtype=False)
+
+
+def test_kline_buffer_update_returned_df_is_copy() -> None:
+    data = generate_test_data("5m", 120, "2022-01-03 12:00:00+00:00")
+    buffer = KlineBuffer.from_dataframe(data.iloc[:100], "5m", 100)
+    assert buffer.update(data.iloc[99:110].reset_index(drop=True), "UNITTEST/USDT")
+    df = buffer.df
+    last_close = df["close"].iloc[-1]
+
+    assert buffer.update(data.iloc[109:120].reset_index(drop=True), "UNITTEST/USDT")
+    assert buffer.df is not df
+    # Dataframes handed out earlier are not modified by later updates.
+    assert df["close"].iloc[-1] == last_close
+
+
+def test_kline_buffer_update_not_possible() -> None:
+    data = generate_test_data("5m", 120, "2022-01-03 12:00:00+00:00")
+    buffer = KlineBuffer.from_dataframe(data.iloc[10:100], "5m", 100)
+    assert buffer is not None
+    df = buffer.df
+
+    # Starts before the buffered data
+    assert not buffer.update(data.iloc[5:20].reset_index(drop=True), "UNITTEST/USDT")
+    # Not aligned to the buffered candles
+    misaligned = data.iloc[100:110].reset_index(drop=True)
+    misaligned["date"] = misaligned["date"] + pd.Timedelta(minutes=1)
+    assert not buffer.update(misaligned, "UNITTEST/USDT")
+    assert buffer.df is df
+    assert len(buffer) == 90
+
+
+def test_kline_buffer_from_dataframe() -> None:
+    data = generate_test_data("5m", 100, "2022-01-03 12:00:00+00:00")
+
+    assert KlineBuffer.from_dataframe(data.iloc[0:0], "5m", 100) is None
+    # Gaps in the data
+    assert KlineBuffer.from_dataframe(data.drop(index=[50]), "5m", 100) is None
+    # Gaps before the part which is kept are irrelevant
+    assert KlineBuffer.from_dataframe(data.drop(index=[5]), "5m", 50) is not None
+    # Weekly / monthly candles are anchored (to monday / the 1st of the month)
+    assert not KlineBuffer.supports_timeframe("1w")
+    assert not KlineBuffer.supports_timeframe("1M")
+    assert KlineBuffer.supports_timeframe("1d")
+    assert KlineBuffer.supports_timeframe("5m")
@@ -4,12 +4,15 @@ from unittest.mock import patch
 
 import pandas as pd
 import pytest
+from joblib.externals import cloudpickle
 
 from freqtrade.configuration import TimeRange
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.exceptions import OperationalException
+from freqtrade.freqai.candle_history import CandleHistory
 from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
-from tests.conftest import get_patched_exchange
+from freqtrade.freqai.historic_predictions import HistoricPredictions
+from tests.conftest import generate_test_data, get_patched_exchange, log_has_re
 from tests.freqai.conftest import get_patched_freqai_strategy
 
 
@@ -117,7 +120,7 @@ def test_get_timerange_from_live_historic_predictions(mocker, freqai_conf):
     sub_timerange = TimeRange.parse_timerange("20180128-20180130")
     _, base_df = freqai.dd.get_base_and_corr_dataframes(sub_timerange, "ADA/BTC", freqai.dk)
     base_df["5m"]["date_pred"] = base_df["5m"]["date"]
-    freqai.dd.historic_predictions = {}
+    freqai.dd.historic_predictions.clear()
     freqai.dd.historic_predictions["ADA/USDT"] = base_df["5m"]
     freqai.dd.save_historic_predictions_to_disk()
     freqai.dd.save_global_metadata_to_disk({"start_dry_live_date": 1516406400})
@@ -237,3 +240,120 @@ def test_set_initial_return_values_warning(mocker, freqai_conf):
 
     # Ensure logger error is not called
     mock_logger_warning.assert_called()
+
+
+def test_historic_predictions_append_save_load(tmp_path):
+    pair = "BTC/USDT"
+    dates = pd.date_range("2023-08-01", periods=5, freq="5min", tz="UTC")
+    store = HistoricPredictions(tmp_path / "historic_predictions", max_rows=8)
+    store[pair] = pd.DataFrame({"&-s_close": range(5), "do_predict": 1, "date_pred": dates})
+    store.save()
+
+    for i in range(5, 12):
+        store.append(
+            pair,
+            {"&-s_close": float(i), "date_pred": dates[-1] + pd.Timedelta(minutes=5 * (i - 4))},
+        )
+    with pytest.raises(KeyError, match=r"Unknown historic prediction columns"):
+        store.append(pair, {"&-s_close": 1.0, "unknown": 1.0})
+
+    # Rows beyond max_rows are dropped, missing values are set to 0
+    df = store[pair]
+    assert len(df) == 8
+    assert df["&-s_close"].tolist() == list(range(4, 12))
+    assert df["do_predict"].tolist() == [1.0] + [0.0] * 7
+    assert df["date_pred"].dtype == dates.dtype
+    assert df["date_pred"].iloc[-1] == dates[-1] + pd.Timedelta(minutes=35)
+    tail = store.tail(pair, 3)
+    assert tail.index.tolist() == [0, 1, 2]
+    assert tail["&-s_close"].tolist() == [9.0, 10.0, 11.0]
+
+    # Only new rows are appended to the file
+    store.save()
+    file = tmp_path / "historic_predictions" / "BTC_USDT.pkl"
+    size = file.stat().st_size
+    store.append(pair, {"&-s_close": 12.0, "date_pred": dates[-1] + pd.Timedelta(minutes=40)})
+    store.save()
+    assert file.stat().st_size > size
+
+    loaded = HistoricPredictions(tmp_path / "historic_predictions", max_rows=8)
+    assert loaded.load()
+    pd.testing.assert_frame_equal(loaded[pair], store[pair])
+
+    # A partially written last segment is removed
+    size = file.stat().st_size
+    with file.open("ab") as fp:
+        fp.write(b"\x80\x05corrupted")
+    with patch("logging.Logger.warning") as mock_logger_warning:
+        assert loaded.load()
+    mock_logger_warning.assert_called()
+    pd.testing.assert_frame_equal(loaded[pair], store[pair])
+    assert file.stat().st_size == size
+
+    # Pairs which were removed are removed on disk on the next save
+    del store[pair]
+    store.save()
+    assert not file.exists()
+    assert not loaded.load()
+
+
+def test_load_legacy_historic_predictions(mocker, freqai_conf):
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    exchange = get_patched_exchange(mocker, freqai_conf)
+    strategy.dp = DataProvider(freqai_conf, exchange)
+    dd = strategy.freqai.dd
+    legacy = {
+        "ADA/USDT": pd.DataFrame(
+            {
+                "&-s_close": [1.0, 2.0],
+                "date_pred": pd.date_range("2023-08-01", periods=2, freq="5min", tz="UTC"),
+            }
+        )
+    }
+    dd.full_path.mkdir(parents=True, exist_ok=True)
+    with dd.historic_predictions_path.open("wb") as fp:
+        cloudpickle.dump(legacy, fp)
+
+    assert dd.load_historic_predictions_from_disk()
+    pd.testing.assert_frame_equal(dd.historic_predictions["ADA/USDT"], legacy["ADA/USDT"])
+    assert (dd.historic_predictions.path / "ADA_USDT.pkl").is_file()
+    shutil.rmtree(dd.full_path)
+
+
+def test_candle_history_append_slice():
+    data = generate_test_data("5m", 300, "2023-08-01 00:00:00+00:00")
+    history = CandleHistory(data.iloc[:100])
+    assert history.last_date == data["date"].iloc[99]
+
+    # Overlapping candles - only newer candles are appended
+    assert history.append(data.iloc[50:150], "ADA/BTC", "5m") == 50
+    assert history.append(data.iloc[50:150], "ADA/BTC", "5m") == 0
+    assert history.append(data.iloc[0:0], "ADA/BTC", "5m") == 0
+    assert len(history) == 150
+    # Growing the arrays while appending candle by candle
+    while len(history) < len(data):
+        history.append(data.iloc[len(history) - 1 : len(history) + 1], "ADA/BTC", "5m")
+    pd.testing.assert_frame_equal(history.slice(data["date"].iloc[0]), data, check_dtype=False)
+
+    sliced = history.slice(data["date"].iloc[10], data["date"].iloc[20])
+    pd.testing.assert_frame_equal(
+        sliced, data.iloc[10:20].reset_index(drop=True), check_dtype=False
+    )
+    assert history.slice(data["date"].iloc[-1] + pd.Timedelta(days=1)).empty
+
+    with pytest.raises(OperationalException, match=r"In memory historical data is older"):
+        history.append(
+            generate_test_data("5m", 10, "2023-09-01 00:00:00+00:00"), "ADA/BTC", "5m"
+        )
+
+
+def test_candle_history_append_gap(caplog):
+    data = generate_test_data("5m", 100, "2023-08-01 00:00:00+00:00")
+    history = CandleHistory(data.iloc[:50])
+    # Dataprovider candles are not aligned to the stored candles
+    shifted = data.iloc[40:60].copy()
+    shifted["date"] = shifted["date"] + pd.Timedelta(minutes=1)
+
+    assert history.append(shifted, "ADA/BTC", "5m") == 1
+    assert log_has_re(r"No common dates in historical data and dataprovider for ADA/BTC.*", caplog)
+    assert history.last_date == shifted["date"].iloc[-1]
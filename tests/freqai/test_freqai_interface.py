@@ -3,6 +3,7 @@ import shutil
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pandas as pd
 import pytest
 
 from freqtrade.configuration import TimeRange
@@ -347,6 +348,39 @@ def test_start_backtesting_subdaily_backtest_period(mocker, freqai_conf):
     shutil.rmtree(Path(freqai.dk.full_path))
 
 
+def test_start_backtesting_parallel_training(mocker, freqai_conf):
+    freqai_conf.update({"timerange": "20180120-20180124"})
+    freqai_conf["runmode"] = "backtest"
+    freqai_conf.get("freqai", {}).update({"backtest_period_days": 0.5})
+    freqai_conf.get("freqai", {}).get("feature_parameters", {}).update(
+        {"indicator_periods_candles": [2]}
+    )
+    metadata = {"pair": "LTC/BTC"}
+    results = []
+    for workers in (1, 3):
+        freqai_conf["freqai"]["backtest_training_workers"] = workers
+        strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+        exchange = get_patched_exchange(mocker, freqai_conf)
+        strategy.dp = DataProvider(freqai_conf, exchange)
+        strategy.freqai_info = freqai_conf.get("freqai", {})
+        freqai = strategy.freqai
+        assert freqai.backtest_training_workers == workers
+        freqai.live = False
+        freqai.dk = FreqaiDataKitchen(freqai_conf)
+        timerange = TimeRange.parse_timerange("20180110-20180130")
+        freqai.dd.load_all_pair_histories(timerange, freqai.dk)
+        _, base_df = freqai.dd.get_base_and_corr_dataframes(timerange, "LTC/BTC", freqai.dk)
+        df = base_df[freqai_conf["timeframe"]]
+
+        freqai.start_backtesting(df, metadata, freqai.dk, strategy)
+        results.append(freqai.dk.full_df)
+        shutil.rmtree(Path(freqai.dk.full_path))
+
+    # Windows are appended in order, no matter how many windows are trained in parallel
+    assert len(results[0]) > 0
+    pd.testing.assert_frame_equal(results[0], results[1])
+
+
 def test_start_backtesting_from_existing_folder(mocker, freqai_conf, caplog):
     freqai_conf.update({"timerange": "20180120-20180130"})
     freqai_conf["runmode"] = "backtest"
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from freqtrade.optimize.backtest_columnar import ColumnarPairData, DetailPairData
+from freqtrade.optimize.backtesting import HEADERS
+from tests.conftest import generate_test_data
+
+
+def _analyzed_df(rows: int = 10) -> pd.DataFrame:
+    df = generate_test_data("5m", rows, "2022-01-03 12:00:00+00:00")
+    df["enter_long"] = np.where(df.index % 3 == 0, 1.0, 0.0)
+    df["exit_long"] = np.where(df.index % 6 == 0, 1.0, 0.0)
+    df["enter_short"] = np.where(df.index % 4 == 0, 1.0, 0.0)
+    df["exit_short"] = 0.0
+    df["enter_tag"] = np.where(df.index % 3 == 0, "long_tag", None)
+    df["exit_tag"] = None
+    return df[HEADERS]
+
+
+def test_columnar_pair_data_rows() -> None:
+    df = _analyzed_df()
+    rows = df.values.tolist()
+    columnar = ColumnarPairData.from_dataframe(df, True)
+
+    assert len(columnar) == len(rows)
+    for idx in range(len(rows)):
+        assert list(columnar[idx]) == rows[idx]
+    assert list(columnar[-1]) == rows[-1]
+    assert columnar.enter_tags == ["long_tag"]
+    assert columnar.exit_tag_ids.max() == -1
+
+    with pytest.raises(IndexError):
+        columnar[len(rows)]
+
+
+@pytest.mark.parametrize("can_short", [True, False])
+def test_columnar_pair_data_trade_direction(can_short) -> None:
+    df = _analyzed_df(24)
+    columnar = ColumnarPairData.from_dataframe(df, can_short)
+
+    for idx, row in enumerate(df.itertuples(index=False)):
+        enter_short = can_short and row.enter_short == 1
+        expected = None
+        if row.enter_long == 1 and not (row.exit_long == 1 or enter_short):
+            expected = "long"
+        elif enter_short and not (row.exit_short == 1 or row.enter_long == 1):
+            expected = "short"
+        assert columnar.trade_direction(idx) == expected
+
+
+def test_columnar_pair_data_is_valid() -> None:
+    df = _analyzed_df()
+    columnar = ColumnarPairData.from_dataframe(df, False)
+    first_date = df["date"].iloc[0].to_pydatetime()
+
+    assert columnar.is_valid(0, first_date)
+    assert not columnar.is_valid(1, first_date)
+    assert not columnar.is_valid(len(df), df["date"].iloc[-1].to_pydatetime())
+
+
+def test_detail_pair_data() -> None:
+    detail = generate_test_data("1m", 100, "2022-01-03 12:00:00+00:00")
+    # Remove a few candles to create a gap in the detail data
+    detail = detail.drop(index=range(10, 15)).reset_index(drop=True)
+    main_dates = pd.date_range("2022-01-03 12:00:00+00:00", periods=21, freq="5min")
+
+    detail_data = DetailPairData.from_dataframe(detail)
+    detail_data.build_offsets(main_dates.values.astype("datetime64[ms]").view("int64"), 300_000)
+    signals = (1.0, 0.0, 0.0, 0.0, "tag", None)
+
+    for main_date in main_dates:
+        expected = detail.loc[
+            (detail["date"] >= main_date) & (detail["date"] < main_date + pd.Timedelta(minutes=5))
+        ]
+        view = detail_data.get_candles(int(main_date.timestamp() * 1000), signals)
+        if expected.empty:
+            assert view is None
+            continue
+        assert len(view) == len(expected)
+        # Arrays are views on the underlying data - not copies.
+        assert view.ohlc.base is not None
+        for idx, exp_row in enumerate(expected.itertuples(index=False)):
+            assert view[idx] == (
+                exp_row.date,
+                exp_row.open,
+                exp_row.high,
+                exp_row.low,
+                exp_row.close,
+                *signals,
+            )
@@ -371,6 +371,15 @@ def test_get_pair_precision_bt(default_conf, mocker) -> None:
     assert backtesting.get_pair_precision("ETH/BTC", dt_utc(2017, 1, 15)) == (1e-5, DECIMAL_PLACES)
     assert ex_mock.call_count == 2
 
+    # Same result as Series.asof() - including months without data
+    precision = backtesting.price_pair_prec[pair].copy()
+    precision.iloc[1] = np.nan
+    mocker.patch("freqtrade.optimize.backtesting.get_tick_size_over_time", return_value=precision)
+    backtesting.load_bt_data()
+    end = precision.index[-1] + timedelta(days=40)
+    for date in pd.date_range(precision.index[0], end, freq="5D"):
+        assert backtesting.get_pair_precision(pair, date.to_pydatetime())[0] == precision.asof(date)
+
 
 def test_backtest_abort(default_conf, mocker, testdatadir) -> None:
     patch_exchange(mocker)
@@ -1947,6 +1956,138 @@ def test_backtest_multi_pair_long_short_switch(
     assert len(results["results"]) == 53
 
 
+@pytest.mark.parametrize("use_detail", [True, False])
+def test_backtest_columnar_engine(default_conf, fee, mocker, testdatadir, use_detail) -> None:
+    def _trend_alternate_hold(dataframe=None, metadata=None):
+        multi = 20 if metadata["pair"] in ("ETH/BTC", "LTC/BTC") else 18
+        dataframe["enter_long"] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + multi - 2) % multi == 0, 1, 0)
+        dataframe["enter_tag"] = np.where(dataframe.index % (multi * 2) == 0, "tag_a", None)
+        dataframe["exit_tag"] = np.where(dataframe["exit_long"] == 1, "exit_a", None)
+        return dataframe
+
+    default_conf.update({"runmode": "backtest", "timeframe": "5m", "max_open_trades": 3})
+    if use_detail:
+        default_conf["timeframe_detail"] = "1m"
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    pairs = ["ADA/BTC", "DASH/BTC", "ETH/BTC", "LTC/BTC", "NXT/BTC"]
+    raw_candles_1m = generate_test_data("1m", 2500, "2022-01-03 12:00:00+00:00")
+    raw_candles = ohlcv_fill_up_missing_data(raw_candles_1m, "5m", "dummy")
+    data = trim_dictlist({pair: raw_candles for pair in pairs}, -500)
+
+    results = {}
+    for engine in ("lists", "columnar"):
+        default_conf["backtest_engine"] = engine
+        backtesting = Backtesting(deepcopy(default_conf))
+        if use_detail:
+            backtesting.detail_data = {pair: raw_candles_1m for pair in pairs}
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _trend_alternate_hold  # Override
+        backtesting.strategy.advise_exit = _trend_alternate_hold  # Override
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[engine] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+
+    assert len(results["lists"]["results"]) > 0
+    pd.testing.assert_frame_equal(results["lists"]["results"], results["columnar"]["results"])
+    assert results["lists"]["final_balance"] == results["columnar"]["final_balance"]
+    assert results["lists"]["rejected_signals"] == results["columnar"]["rejected_signals"]
+
+
+@pytest.mark.parametrize(
+    "trailing",
+    [
+        {"trailing_stop": False},
+        {"trailing_stop": True, "trailing_stop_positive": None},
+        {
+            "trailing_stop": True,
+            "trailing_stop_positive": 0.01,
+            "trailing_stop_positive_offset": 0.02,
+            "trailing_only_offset_is_reached": True,
+        },
+        {
+            "trailing_stop": True,
+            "trailing_stop_positive": 0.2,
+            "trailing_stop_positive_offset": 0.0,
+            "trailing_only_offset_is_reached": False,
+        },
+    ],
+)
+def test_backtest_signal_only(default_conf, fee, mocker, trailing) -> None:
+    def _trend_alternate_hold(dataframe=None, metadata=None):
+        multi = 20 if metadata["pair"] in ("ETH/BTC", "LTC/BTC") else 18
+        dataframe["enter_long"] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + multi - 2) % multi == 0, 1, 0)
+        dataframe["enter_tag"] = np.where(dataframe.index % (multi * 2) == 0, "tag_a", None)
+        dataframe["exit_tag"] = np.where(dataframe["exit_long"] == 1, "exit_a", None)
+        return dataframe
+
+    default_conf.update({"runmode": "backtest", "timeframe": "5m", "max_open_trades": 3})
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    pairs = ["ADA/BTC", "DASH/BTC", "ETH/BTC", "LTC/BTC", "NXT/BTC"]
+    raw_candles = generate_test_data("5m", 1000, "2022-01-03 12:00:00+00:00")
+    data = {pair: raw_candles for pair in pairs}
+
+    results = {}
+    for signal_only in (False, True):
+        backtesting = Backtesting(deepcopy(default_conf))
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _trend_alternate_hold  # Override
+        backtesting.strategy.advise_exit = _trend_alternate_hold  # Override
+        backtesting.strategy.minimal_roi = {0: 0.03, 60: 0.01, 200: 0}
+        backtesting.strategy.stoploss = -0.02
+        for key, value in trailing.items():
+            setattr(backtesting.strategy, key, value)
+        assert backtesting.supports_signal_only()
+        backtesting.signal_only = signal_only
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[signal_only] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+        if signal_only:
+            # 2nd run reuses the converted signals
+            backtesting.strategy.advise_entry = MagicMock()
+            rerun = backtesting.backtest(
+                processed=deepcopy(processed), start_date=min_date, end_date=max_date
+            )
+            assert backtesting.strategy.advise_entry.call_count == 0
+            pd.testing.assert_frame_equal(results[True]["results"], rerun["results"])
+
+    assert len(results[False]["results"]) > 0
+    pd.testing.assert_frame_equal(results[False]["results"], results[True]["results"])
+    assert results[False]["final_balance"] == results[True]["final_balance"]
+    assert results[False]["rejected_signals"] == results[True]["rejected_signals"]
+
+
+def test_backtest_supports_signal_only(default_conf, mocker) -> None:
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert backtesting.supports_signal_only()
+
+    backtesting.strategy.use_custom_stoploss = True
+    assert not backtesting.supports_signal_only()
+    backtesting.strategy.use_custom_stoploss = False
+
+    mocker.patch.object(
+        backtesting.strategy.__class__, "confirm_trade_entry", lambda *args, **kwargs: True
+    )
+    assert not backtesting.supports_signal_only()
+
+
 def test_backtest_start_timerange(default_conf, mocker, caplog, testdatadir):
     patch_exchange(mocker)
     mocker.patch("freqtrade.optimize.backtesting.Backtesting.backtest")
@@ -357,7 +357,7 @@ def test_params_no_optimize_details(hyperopt) -> None:
 
 
 def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_hyperopt_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -399,6 +399,7 @@ def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
     hyperopt.start()
 
     parallel.assert_called_once()
+    assert hyperopt.hyperopter.backtesting.signal_only is False
 
     out, _err = capsys.readouterr()
     assert "Best result:\n\n*    1/1: foo result Objective: 1.00000\n" in out
@@ -413,6 +414,77 @@ def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
     assert hasattr(hyperopt.hyperopter.backtesting, "_position_stacking")
 
 
+def test_start_worker_pool(mocker, hyperopt_conf, capsys) -> None:
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_hyperopt_data")
+    save_result = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
+    mocker.patch(
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
+    )
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
+    mocker.patch(
+        "freqtrade.optimize.backtesting.Backtesting.load_bt_data",
+        MagicMock(return_value=(MagicMock(), None)),
+    )
+    mocker.patch(
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.get_timerange",
+        MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13))),
+    )
+    parallel = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel")
+    patch_exchange(mocker)
+
+    submitted = []
+
+    class FakePool:
+        def __init__(self, hyperopter, n_workers):
+            assert n_workers == 2
+            self._pending = []
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+        @property
+        def pending(self):
+            return len(self._pending)
+
+        def submit(self, params_dict, context):
+            submitted.append(params_dict)
+            self._pending.append(context)
+
+        def wait_completed(self):
+            # Complete one epoch at a time, newest first.
+            context = self._pending.pop()
+            return [
+                (
+                    context,
+                    {
+                        "loss": len(submitted),
+                        "results_explanation": "foo result",
+                        "params": {"buy": {}, "sell": {}, "roi": {}, "stoploss": 0.0},
+                        "results_metrics": generate_result_metrics(),
+                    },
+                )
+            ]
+
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt.HyperoptWorkerPool", FakePool)
+    hyperopt_conf.update({"epochs": 5, "hyperopt_jobs": 2})
+
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.hyperopter.backtesting.strategy.advise_all_indicators = MagicMock()
+    hyperopt.hyperopter.custom_hyperopt.generate_roi_table = MagicMock(return_value={})
+
+    hyperopt.start()
+
+    assert parallel.call_count == 0
+    assert len(submitted) == 5
+    assert save_result.call_count == 5
+    out, _err = capsys.readouterr()
+    # First completed epoch has the lowest loss
+    assert "Best result:\n\n*    1/5: foo result Objective: 2.00000\n" in out
+
+
 def test_hyperopt_format_results(hyperopt):
     bt_result = {
         "results": pd.DataFrame(
@@ -561,7 +633,8 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     mocker.patch.object(Path, "open")
     mocker.patch("freqtrade.configuration.config_validation.validate_config_schema")
     mocker.patch(
-        "freqtrade.optimize.hyperopt.hyperopt_optimizer.load", return_value={"XRP/BTC": None}
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.load_hyperopt_data",
+        return_value={"XRP/BTC": None},
     )
 
     optimizer_param = {
@@ -648,12 +721,12 @@ def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     unlinkmock = mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Path.unlink", MagicMock())
     h = Hyperopt(hyperopt_conf)
 
-    assert unlinkmock.call_count == 2
+    assert unlinkmock.call_count == 3
     assert log_has(f"Removing `{h.data_pickle_file}`.", caplog)
 
 
 def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_hyperopt_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
@@ -720,7 +793,7 @@ def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_hyperopt_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
@@ -777,7 +850,7 @@ def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_hyperopt_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -832,7 +905,7 @@ def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_hyperopt_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -861,6 +934,9 @@ def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> Non
         ),
     )
     patch_exchange(mocker)
+    mocker.patch(
+        "freqtrade.optimize.backtesting.Backtesting.supports_signal_only", return_value=True
+    )
 
     hyperopt_conf.update({"spaces": ["roi", "stoploss"]})
 
@@ -871,6 +947,8 @@ def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> Non
     hyperopt.start()
 
     parallel.assert_called_once()
+    # Signals don't change between epochs
+    assert hyperopt.hyperopter.backtesting.signal_only is True
 
     out, _err = capsys.readouterr()
     assert "Best result:\n\n*    1/1: foo result Objective: 1.00000\n" in out
@@ -886,7 +964,7 @@ def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> Non
 
 
 def test_simplified_interface_all_failed(mocker, hyperopt_conf, caplog) -> None:
-    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump", MagicMock())
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_hyperopt_data", MagicMock())
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
         "freqtrade.optimize.backtesting.Backtesting.load_bt_data",
@@ -922,7 +1000,7 @@ def test_simplified_interface_all_failed(mocker, hyperopt_conf, caplog) -> None:
 
 
 def test_simplified_interface_none_selected(mocker, hyperopt_conf, caplog) -> None:
-    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump", MagicMock())
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_hyperopt_data", MagicMock())
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
         "freqtrade.optimize.backtesting.Backtesting.load_bt_data",
@@ -950,7 +1028,7 @@ def test_simplified_interface_none_selected(mocker, hyperopt_conf, caplog) -> No
 
 
 def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_hyperopt_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -1004,7 +1082,7 @@ def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_hyperopt_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -1070,7 +1148,7 @@ def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
     ],
 )
 def test_simplified_interface_failed(mocker, hyperopt_conf, space) -> None:
-    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump", MagicMock())
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_hyperopt_data", MagicMock())
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
         "freqtrade.optimize.backtesting.Backtesting.load_bt_data",
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from freqtrade.optimize.hyperopt.hyperopt_data import (
+    hyperopt_data_manifest,
+    load_hyperopt_data,
+    store_hyperopt_data,
+)
+from tests.conftest import generate_test_data
+
+
+@pytest.fixture
+def hyperopt_data():
+    df = generate_test_data("5m", 100, "2022-01-03 12:00:00+00:00")
+    df["rsi"] = np.arange(100, dtype=np.int64)
+    df["is_green"] = df["close"] > df["open"]
+    df["label"] = np.where(df["is_green"], "green", "red")
+    return {
+        "ETH/USDT": df,
+        "BTC/USDT": df.iloc[10:].reset_index(drop=True),
+        "XRP/USDT": df.iloc[0:0],
+    }
+
+
+def test_store_load_hyperopt_data(tmp_path, hyperopt_data):
+    datafile = tmp_path / "hyperopt_tickerdata.bin"
+    store_hyperopt_data(hyperopt_data, datafile)
+    assert datafile.is_file()
+    assert hyperopt_data_manifest(datafile).is_file()
+
+    loaded = load_hyperopt_data(datafile)
+    assert list(loaded.keys()) == list(hyperopt_data.keys())
+    for pair, df in hyperopt_data.items():
+        pd.testing.assert_frame_equal(loaded[pair], df)
+
+    # Numeric columns are read-only views on the memory-mapped file
+    assert not loaded["ETH/USDT"]["close"].values.flags.writeable
+
+
+def test_load_hyperopt_data_shared(tmp_path, hyperopt_data):
+    datafile = tmp_path / "hyperopt_tickerdata.bin"
+    store_hyperopt_data(hyperopt_data, datafile)
+
+    first = load_hyperopt_data(datafile)
+    # Columns added during one epoch must not be visible in the next epoch.
+    first["ETH/USDT"]["enter_long"] = 1
+    second = load_hyperopt_data(datafile)
+
+    assert "enter_long" not in second["ETH/USDT"].columns
+    assert first["ETH/USDT"] is not second["ETH/USDT"]
+    # Both epochs use the same underlying memory.
+    assert np.shares_memory(first["ETH/USDT"]["close"].values, second["ETH/USDT"]["close"].values)
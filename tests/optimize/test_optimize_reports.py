@@ -24,7 +24,9 @@ from freqtrade.optimize.optimize_reports import (
     generate_daily_stats,
     generate_pair_metrics,
     generate_periodic_breakdown_stats,
+    generate_rejected_signals,
     generate_strategy_comparison,
+    generate_trade_signal_candles,
     generate_trading_stats,
     show_sorted_pairlist,
     store_backtest_results,
@@ -40,7 +42,7 @@ from freqtrade.optimize.optimize_reports.optimize_reports import (
 from freqtrade.resolvers.strategy_resolver import StrategyResolver
 from freqtrade.util import dt_ts, format_duration
 from freqtrade.util.datetime_helpers import dt_from_ts, dt_utc
-from tests.conftest import CURRENT_TEST_STRATEGY, log_has_re
+from tests.conftest import CURRENT_TEST_STRATEGY, generate_test_data, log_has_re
 from tests.data.test_history import _clean_test_file
 
 
@@ -394,6 +396,46 @@ def test_write_read_backtest_candles(tmp_path):
     _clean_test_file(stored_file)
 
 
+def test_generate_trade_signal_candles():
+    candles = generate_test_data("5m", 50, "2022-01-01 00:00:00+00:00")
+    candles["enter_long"] = 0
+    preprocessed = {"ETH/BTC": candles, "XRP/BTC": candles.copy(), "LTC/BTC": candles.iloc[0:0]}
+    dates = candles["date"]
+    results = pd.DataFrame(
+        {
+            "pair": ["ETH/BTC", "ETH/BTC", "LTC/BTC", "ETH/BTC"],
+            "open_date": [dates[5], dates[10] + timedelta(minutes=2), dates[3], dates[0]],
+            "close_date": [dates[8], dates[20], dates[4], dates[49]],
+        }
+    )
+
+    signals = generate_trade_signal_candles(preprocessed, {"results": results}, "open_date")
+    # No candles for LTC/BTC
+    assert set(signals.keys()) == {"ETH/BTC", "XRP/BTC"}
+    assert signals["XRP/BTC"].empty
+    # Candle before the trade open - the trade opening on the first candle has none
+    assert signals["ETH/BTC"]["date"].tolist() == [dates[4], dates[10]]
+    assert signals["ETH/BTC"].index.tolist() == [4, 10]
+    assert list(signals["ETH/BTC"].columns) == list(candles.columns)
+
+    exits = generate_trade_signal_candles(preprocessed, {"results": results}, "close_date")
+    assert exits["ETH/BTC"]["date"].tolist() == [dates[7], dates[19], dates[48]]
+
+    rejected = generate_rejected_signals(
+        preprocessed,
+        {
+            "ETH/BTC": [[dates[3], "tag1"], [dates[7], None], [dates[7] + timedelta(days=1), "x"]],
+            "XRP/BTC": [],
+        },
+    )
+    assert rejected["XRP/BTC"].empty
+    rejected_eth = rejected["ETH/BTC"]
+    assert rejected_eth["date"].tolist() == [dates[3], dates[7]]
+    assert rejected_eth["pair"].tolist() == ["ETH/BTC", "ETH/BTC"]
+    assert rejected_eth["enter_tag"].tolist() == ["tag1", None]
+    assert rejected_eth["close"].tolist() == candles["close"].iloc[[3, 7]].tolist()
+
+
 def test_generate_pair_metrics():
     results = pd.DataFrame(
         {
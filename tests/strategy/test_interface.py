@@ -1,6 +1,7 @@
 # pragma pylint: disable=missing-docstring, C0103
 import logging
 import math
+import time
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -814,6 +815,40 @@ def test_analyze_ticker_default(ohlcv_history, mocker, caplog) -> None:
     assert not log_has("Skipping TA Analysis for already analyzed candle", caplog)
 
 
+@pytest.mark.parametrize("workers", [1, 3])
+def test_analyze_parallel(ohlcv_history, mocker, workers) -> None:
+    def populate(dataframe, metadata):
+        if metadata["pair"] == "ETH/BTC":
+            # First pair finishes last
+            time.sleep(0.1)
+        return dataframe
+
+    mocker.patch.multiple(
+        "freqtrade.strategy.interface.IStrategy",
+        advise_indicators=MagicMock(side_effect=populate),
+        advise_entry=MagicMock(side_effect=lambda x, meta: x),
+        advise_exit=MagicMock(side_effect=lambda x, meta: x),
+    )
+    strategy = StrategyTestV3({"analysis_workers": workers})
+    strategy.dp = DataProvider({}, None, None)
+    mocker.patch.object(strategy.dp, "ohlcv", return_value=ohlcv_history)
+    cache_mock = mocker.spy(strategy.dp, "_set_cached_df")
+    emit_mock = mocker.spy(strategy.dp, "_emit_df")
+    pairs = ["ETH/BTC", "XRP/BTC", "LTC/BTC", "NEO/BTC"]
+
+    strategy.analyze(pairs)
+    # Results are stored in pair order
+    assert [c[0][0] for c in cache_mock.call_args_list] == pairs
+    assert [c[0][0][0] for c in emit_mock.call_args_list] == pairs
+    assert list(strategy.analysis_timings.keys()) == pairs
+    assert strategy.analysis_timings["ETH/BTC"] >= 0.1
+
+    # Nothing to analyze on the same candle
+    cache_mock.reset_mock()
+    strategy.analyze(pairs)
+    assert cache_mock.call_count == 0
+
+
 def test__analyze_ticker_internal_skip_analyze(ohlcv_history, mocker, caplog) -> None:
     caplog.set_level(logging.DEBUG)
     ind_mock = MagicMock(side_effect=lambda x, meta: x)
@@ -7,12 +7,15 @@ from sqlalchemy import select
 
 from freqtrade.constants import UNLIMITED_STAKE_AMOUNT
 from freqtrade.exceptions import DependencyException
-from freqtrade.persistence import Trade
+from freqtrade.persistence import LocalTrade, Trade
+from freqtrade.wallets import LEDGER_RECONCILE_INTERVAL, Wallets
 from tests.conftest import (
     EXMS,
     create_mock_trades,
     create_mock_trades_usdt,
+    get_patched_exchange,
     get_patched_freqtradebot,
+    log_has_re,
     patch_wallet,
 )
 
@@ -416,6 +419,61 @@ def test_sync_wallet_futures_dry(mocker, default_conf, fee):
     assert free + used == total
 
 
+@pytest.mark.parametrize("trading_mode", ["spot", "futures"])
+def test_update_trade_backtest(mocker, default_conf, fee, caplog, trading_mode):
+    default_conf["dry_run"] = True
+    default_conf["trading_mode"] = trading_mode
+    default_conf["margin_mode"] = "isolated"
+    exchange = get_patched_exchange(mocker, default_conf)
+    LocalTrade.reset_trades()
+    Trade.use_db = False
+    try:
+        wallets = Wallets(default_conf, exchange, is_backtest=True)
+
+        def full_update():
+            ledger = (deepcopy(wallets.get_all_balances()), deepcopy(wallets.get_all_positions()))
+            wallets.update()
+            return ledger, (wallets.get_all_balances(), wallets.get_all_positions())
+
+        create_mock_trades(fee, is_short=None, use_db=False)
+        trades = list(LocalTrade.bt_trades_open)
+        for trade in trades:
+            wallets.update_trade(trade)
+        ledger, expected = full_update()
+        assert ledger == expected
+        assert len(ledger[1]) == (4 if trading_mode == "futures" else 0)
+
+        # Filled exit order closing the trade
+        trades[0].is_open = False
+        trades[0].close_profit_abs = 0.0001
+        LocalTrade.close_bt_trade(trades[0])
+        wallets.update_trade(trades[0])
+        # Entry order which never filled
+        LocalTrade.remove_bt_trade(trades[1])
+        wallets.update_trade(trades[1])
+        open_trades = LocalTrade.bt_trades_open
+        assert wallets.get_free("BTC") == pytest.approx(
+            default_conf["dry_run_wallet"]
+            + 0.0001
+            + sum(t.realized_profit for t in open_trades)
+            - sum(t.stake_amount for t in open_trades)
+        )
+        ledger, expected = full_update()
+        assert ledger == expected
+
+        # Periodic recalculation fixes (and reports) differences
+        wallets._open_stake += 1
+        wallets._ledger_updates = LEDGER_RECONCILE_INTERVAL - 1
+        wallets.update_trade(trades[2])
+        assert log_has_re(r"Wallet ledger out of sync: .*", caplog)
+        assert wallets._ledger_updates == 0
+        ledger, expected = full_update()
+        assert ledger == expected
+    finally:
+        Trade.use_db = True
+        LocalTrade.reset_trades()
+
+
 def test_check_exit_amount(mocker, default_conf, fee):
     freqtrade = get_patched_freqtradebot(mocker, default_conf)
     update_mock = mocker.patch("freqtrade.wallets.Wallets.update")